@@ -0,0 +1,223 @@
+extends Node
+## BossPrefetcher autoload - loads the current stage's boss and mini-boss
+## scenes on background threads a few waves before they are needed
+## Driven by StageManager.progress_changed: each scene is requested with
+## ResourceLoader.load_threaded_request once the wave is within
+## PREFETCH_LEAD_WAVES of its boss/mini-boss wave, then collected here when the
+## thread finishes. game_controller asks for scenes through get_boss_scene /
+## get_mini_boss_scene; a scene that was never requested falls back to a
+## blocking load(). Only the current stage's scenes are kept.
+## Boss scenes are never preload()ed - see boss_base.gd for the class loading
+## order problem this avoids.
+
+const PREFETCH_LEAD_WAVES: int = 2  # Start loading this many waves before the spawn wave
+
+# Indexed by stage
+const BOSS_SCENES: Array[String] = [
+	"res://scenes/entities/enemies/bosses/slime_king.tscn",  # The Pit
+	"res://scenes/entities/enemies/bosses/frost_wyrm.tscn",  # Frozen Depths
+	"res://scenes/entities/enemies/bosses/sand_golem.tscn",  # Burning Sands
+	"res://scenes/entities/enemies/bosses/void_lord.tscn",  # Void Chasm
+	"res://scenes/entities/enemies/bosses/plague_beast.tscn",  # Toxic Marsh
+	"res://scenes/entities/enemies/bosses/storm_titan.tscn",  # Storm Spire
+	"res://scenes/entities/enemies/bosses/crystal_golem.tscn",  # Crystal Caverns
+	"res://scenes/entities/enemies/bosses/abyssal_horror.tscn",  # The Abyss
+]
+
+# Indexed by stage, then by StageManager.MINI_BOSS_WAVES index
+const MINI_BOSS_SCENES: Array[Array] = [
+	[  # The Pit
+		"res://scenes/entities/enemies/mini_bosses/elite_slime.tscn",
+		"res://scenes/entities/enemies/mini_bosses/giant_bat.tscn",
+	],
+	[  # Frozen Depths
+		"res://scenes/entities/enemies/mini_bosses/frost_golem.tscn",
+		"res://scenes/entities/enemies/mini_bosses/ice_wraith.tscn",
+	],
+	[  # Burning Sands
+		"res://scenes/entities/enemies/mini_bosses/fire_crab.tscn",
+		"res://scenes/entities/enemies/mini_bosses/sand_archer.tscn",
+	],
+	[  # Void Chasm
+		"res://scenes/entities/enemies/mini_bosses/void_spawn.tscn",
+		"res://scenes/entities/enemies/mini_bosses/shadow_knight.tscn",
+	],
+	[  # Toxic Marsh
+		"res://scenes/entities/enemies/mini_bosses/toxic_lurker.tscn",
+		"res://scenes/entities/enemies/mini_bosses/swamp_horror.tscn",
+	],
+	[  # Storm Spire
+		"res://scenes/entities/enemies/mini_bosses/lightning_elemental.tscn",
+		"res://scenes/entities/enemies/mini_bosses/storm_harpy.tscn",
+	],
+	[  # Crystal Caverns
+		"res://scenes/entities/enemies/mini_bosses/crystal_guardian.tscn",
+		"res://scenes/entities/enemies/mini_bosses/gem_spider.tscn",
+	],
+	[  # The Abyss
+		"res://scenes/entities/enemies/mini_bosses/abyss_watcher.tscn",
+		"res://scenes/entities/enemies/mini_bosses/nightmare.tscn",
+	],
+]
+
+var _stage: int = -1
+var _pending: Dictionary = {}  # path -> true while its threaded load is in flight
+var _scenes: Dictionary = {}  # path -> PackedScene (current stage only)
+
+# Stats
+var _requested_total: int = 0
+var _ready_hits: int = 0  # Scene was already loaded when asked for
+var _blocking_waits: int = 0  # Asked for while its thread was still loading
+var _sync_loads: int = 0  # Never requested - loaded on the main thread
+var _spawn_start_usec: int = 0
+var _last_spawn_kind: String = ""
+var _last_spawn_usec: int = 0
+var _last_spawn_frame_ms: float = 0.0
+
+
+func _ready() -> void:
+	set_process(false)
+	StageManager.progress_changed.connect(_on_progress_changed)
+	GameManager.game_started.connect(_on_game_started)
+
+
+func _process(_delta: float) -> void:
+	# Collect finished loads so the scene is ready before the spawn wave
+	for path in _pending.keys():
+		var status := ResourceLoader.load_threaded_get_status(path)
+		if status == ResourceLoader.THREAD_LOAD_IN_PROGRESS:
+			continue
+		_pending.erase(path)
+		var scene := ResourceLoader.load_threaded_get(path) as PackedScene
+		if status == ResourceLoader.THREAD_LOAD_LOADED and scene and _stage_paths(_stage).has(path):
+			_scenes[path] = scene
+	if _pending.is_empty():
+		set_process(false)
+
+
+# ============================================================================
+# Spawn API
+# ============================================================================
+
+func get_boss_scene(stage: int) -> PackedScene:
+	## Boss for a stage (Slime King for stages without one)
+	if stage < 0 or stage >= BOSS_SCENES.size():
+		stage = 0
+	return _get_scene(BOSS_SCENES[stage])
+
+
+func get_mini_boss_scene(stage: int, mini_boss_idx: int) -> PackedScene:
+	## Mini-boss for a stage and MINI_BOSS_WAVES index, or null if there isn't one
+	if stage < 0 or stage >= MINI_BOSS_SCENES.size():
+		return null
+	if mini_boss_idx < 0 or mini_boss_idx >= MINI_BOSS_SCENES[stage].size():
+		return null
+	return _get_scene(MINI_BOSS_SCENES[stage][mini_boss_idx])
+
+
+func is_prefetched(path: String) -> bool:
+	## True if the scene is loaded and waiting (get_*_scene won't block)
+	if _scenes.has(path):
+		return true
+	return _pending.has(path) and ResourceLoader.load_threaded_get_status(path) == ResourceLoader.THREAD_LOAD_LOADED
+
+
+func begin_spawn_measure(kind: String) -> void:
+	## Call at the start of a boss/mini-boss spawn; see end_spawn_measure
+	_spawn_start_usec = Time.get_ticks_usec()
+	_last_spawn_kind = kind
+
+
+func end_spawn_measure() -> void:
+	## Records the spawn's own cost now and, on the next frame, the whole
+	## spawn frame (including the first draw of the new boss)
+	_last_spawn_usec = Time.get_ticks_usec() - _spawn_start_usec
+	var start := _spawn_start_usec
+	await get_tree().process_frame
+	_last_spawn_frame_ms = (Time.get_ticks_usec() - start) / 1000.0
+
+
+# ============================================================================
+# Internals
+# ============================================================================
+
+func _on_game_started() -> void:
+	# StageManager has already reset to stage 0 / wave 1 (it connects first)
+	_on_progress_changed(StageManager.current_stage, StageManager.wave_in_stage)
+
+
+func _on_progress_changed(stage: int, wave_in_stage: int) -> void:
+	if stage != _stage:
+		_stage = stage
+		_scenes.clear()  # Previous stage's bosses are done with
+	if stage < 0 or stage >= BOSS_SCENES.size():
+		return
+
+	var mini_boss_count := mini(StageManager.MINI_BOSS_WAVES.size(), MINI_BOSS_SCENES[stage].size())
+	for i in range(mini_boss_count):
+		if _is_within_lead(wave_in_stage, StageManager.MINI_BOSS_WAVES[i]):
+			_request(MINI_BOSS_SCENES[stage][i])
+
+	var waves_per_stage: int = StageManager.current_biome.waves_before_boss if StageManager.current_biome else 10
+	if _is_within_lead(wave_in_stage, waves_per_stage):
+		_request(BOSS_SCENES[stage])
+
+
+func _is_within_lead(wave_in_stage: int, spawn_wave: int) -> bool:
+	return wave_in_stage >= spawn_wave - PREFETCH_LEAD_WAVES and wave_in_stage <= spawn_wave
+
+
+func _request(path: String) -> void:
+	if _scenes.has(path) or _pending.has(path):
+		return
+	if ResourceLoader.load_threaded_request(path, "PackedScene") != OK:
+		return  # get_*_scene falls back to load()
+	_pending[path] = true
+	_requested_total += 1
+	set_process(true)
+
+
+func _get_scene(path: String) -> PackedScene:
+	if _scenes.has(path):
+		_ready_hits += 1
+		return _scenes[path]
+
+	var scene: PackedScene = null
+	if _pending.has(path):
+		if ResourceLoader.load_threaded_get_status(path) == ResourceLoader.THREAD_LOAD_LOADED:
+			_ready_hits += 1
+		else:
+			_blocking_waits += 1
+		_pending.erase(path)
+		scene = ResourceLoader.load_threaded_get(path) as PackedScene  # Waits for the thread if needed
+	if not scene:
+		_sync_loads += 1
+		scene = load(path)
+	if scene and _stage_paths(_stage).has(path):
+		_scenes[path] = scene
+	return scene
+
+
+func _stage_paths(stage: int) -> Array:
+	if stage < 0 or stage >= BOSS_SCENES.size():
+		return []
+	return [BOSS_SCENES[stage]] + MINI_BOSS_SCENES[stage]
+
+
+# ============================================================================
+# Debug / Stats
+# ============================================================================
+
+func get_stats() -> Dictionary:
+	return {
+		"stage": _stage,
+		"pending": _pending.size(),
+		"cached": _scenes.size(),
+		"requested_total": _requested_total,
+		"ready_hits": _ready_hits,
+		"blocking_waits": _blocking_waits,
+		"sync_loads": _sync_loads,
+		"last_spawn_kind": _last_spawn_kind,
+		"last_spawn_usec": _last_spawn_usec,
+		"last_spawn_frame_ms": _last_spawn_frame_ms,
+	}
@@ -0,0 +1,138 @@
+extends Node
+## CombatResolver autoload - batches ball hits and resolves them once per frame
+## Hits queued during the physics step are merged per enemy (damage summed,
+## crit if any hit crit) and applied in first-hit order once balls and enemies
+## have moved, so kills happen in a deterministic order. The per-hit extras -
+## camera shake, the HIT_ENEMY sound and damage recording (lifesteal heal) -
+## run once per frame for the whole batch instead of once per hit.
+
+const PHYSICS_PRIORITY: int = 200  # After balls, enemies and FormationSystem
+
+# Per-enemy entries for this frame (index order = first-hit order)
+var _targets: Array = []  # Untyped: a queued enemy can be freed before we resolve
+var _target_ids := PackedInt64Array()
+var _generations := PackedInt32Array()  # EnemyBase.spawn_generation when first hit
+var _amounts := PackedInt32Array()
+var _crits := PackedByteArray()
+var _index_by_id: Dictionary = {}  # enemy instance id -> entry index
+var _pending_hits: int = 0
+
+# Stats
+var _hits_last_frame: int = 0
+var _enemies_last_frame: int = 0
+var _kills_last_frame: int = 0
+var _hits_total: int = 0
+var _enemies_total: int = 0
+var _frames_resolved: int = 0
+
+
+func _ready() -> void:
+	process_physics_priority = PHYSICS_PRIORITY
+
+
+func _physics_process(_delta: float) -> void:
+	if _targets.is_empty():
+		return
+	_resolve()
+
+
+# ============================================================================
+# Hit API
+# ============================================================================
+
+func queue_hit(enemy: EnemyBase, amount: int, is_crit: bool = false) -> void:
+	## Queue damage for this frame's batch (merged with other hits on the same enemy)
+	var id := enemy.get_instance_id()
+	var index: int = _index_by_id.get(id, -1)
+	if index < 0:
+		index = _targets.size()
+		_index_by_id[id] = index
+		_targets.append(enemy)
+		_target_ids.append(id)
+		_generations.append(enemy.spawn_generation)
+		_amounts.append(0)
+		_crits.append(0)
+	_amounts[index] += amount
+	if is_crit:
+		_crits[index] = 1
+	_pending_hits += 1
+
+
+func queue_hit_at(enemy: EnemyBase, amount: int, hit_position: Vector2, is_crit: bool = false) -> void:
+	## queue_hit with weak points (e.g. boss crowns) applied at the hit position now
+	if enemy is BossBase:
+		amount = int(amount * enemy.get_hit_multiplier(hit_position))
+	queue_hit(enemy, amount, is_crit)
+
+
+func queue_hit_by_path(enemy_path: NodePath, amount: int, is_crit: bool = false) -> void:
+	## Test-friendly version that takes a node path
+	var enemy := get_node_or_null(enemy_path) as EnemyBase
+	if enemy:
+		queue_hit(enemy, amount, is_crit)
+
+
+# ============================================================================
+# Resolution
+# ============================================================================
+
+func _resolve() -> void:
+	# Take this frame's batch first: hits queued by deaths (explosions, etc.)
+	# while resolving go into the next frame's batch
+	var targets := _targets
+	var target_ids := _target_ids
+	var generations := _generations
+	var amounts := _amounts
+	var crits := _crits
+	_hits_last_frame = _pending_hits
+	_hits_total += _pending_hits
+	_targets = []
+	_target_ids = PackedInt64Array()
+	_generations = PackedInt32Array()
+	_amounts = PackedInt32Array()
+	_crits = PackedByteArray()
+	_index_by_id.clear()
+	_pending_hits = 0
+
+	var dealt_total := 0
+	var resolved := 0
+	var kills := 0
+	for i in range(targets.size()):
+		if not is_instance_id_valid(target_ids[i]):
+			continue
+		var enemy = targets[i]
+		# Skip enemies that died or were despawned and reused since being hit
+		if enemy.current_state == EnemyBase.State.DEAD or enemy.spawn_generation != generations[i]:
+			continue
+		dealt_total += enemy.take_batched_damage(amounts[i], crits[i] == 1)
+		resolved += 1
+		if enemy.current_state == EnemyBase.State.DEAD:
+			kills += 1
+
+	_enemies_total += resolved
+	_frames_resolved += 1
+	_enemies_last_frame = resolved
+	_kills_last_frame = kills
+
+	if resolved == 0:
+		return
+	SoundManager.play(SoundManager.SoundType.HIT_ENEMY)
+	if dealt_total > 0:
+		CameraShake.shake(EnemyBase.HIT_SHAKE_INTENSITY, EnemyBase.HIT_SHAKE_DECAY)
+		GameManager.record_damage_dealt(dealt_total)
+
+
+# ============================================================================
+# Debug / Stats
+# ============================================================================
+
+func get_stats() -> Dictionary:
+	return {
+		"pending_enemies": _targets.size(),
+		"hits_last_frame": _hits_last_frame,
+		"enemies_last_frame": _enemies_last_frame,
+		"kills_last_frame": _kills_last_frame,
+		"hits_total": _hits_total,
+		"enemies_total": _enemies_total,
+		"frames_resolved": _frames_resolved,
+	}
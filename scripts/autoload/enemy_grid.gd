@@ -0,0 +1,271 @@
+extends Node
+## EnemyGrid autoload - uniform grid spatial index over live enemies
+## Rebuilt lazily at most once per physics frame, so every AoE effect that
+## frame shares a single O(n) bucketing pass instead of scanning all enemies.
+
+# Grid covers the play field plus the spawn band above it. Positions outside
+# are clamped into the border cells, so queries stay correct everywhere.
+const CELL_SIZE: float = 64.0
+const GRID_ORIGIN := Vector2(-128.0, -256.0)
+const GRID_COLS: int = 16  # -128..896 px
+const GRID_ROWS: int = 28  # -256..1536 px
+const CELL_COUNT: int = GRID_COLS * GRID_ROWS
+
+var _enemies: Array = []  # Untyped: entries may be freed before the next rebuild
+var _cell_of := PackedInt32Array()  # enemy index -> cell
+var _cell_start := PackedInt32Array()  # cell -> first slot in _cell_items (CELL_COUNT + 1 entries)
+var _cell_cursor := PackedInt32Array()
+var _cell_items := PackedInt32Array()  # enemy indices bucketed by cell, tree order within a cell
+var _best_dist := PackedFloat32Array()  # query_nearest scratch
+var _best_idx := PackedInt32Array()
+var _built_frame: int = -1
+var _container: Node = null
+
+
+func _ready() -> void:
+	_cell_start.resize(CELL_COUNT + 1)
+	_cell_cursor.resize(CELL_COUNT)
+
+
+# ============================================================================
+# Queries
+# ============================================================================
+
+func query_radius(pos: Vector2, radius: float, exclude: Node = null) -> Array[EnemyBase]:
+	## Live enemies within radius of pos, in scene-tree order
+	_ensure_built()
+	var result: Array[EnemyBase] = []
+	var radius_sq := radius * radius
+	var hits := PackedInt32Array()
+	var offset := Vector2(radius, radius)
+	for i in _collect_candidates(pos - offset, pos + offset):
+		var enemy = _enemies[i]
+		if not _is_live(enemy, exclude):
+			continue
+		if enemy.global_position.distance_squared_to(pos) < radius_sq:
+			hits.append(i)
+	hits.sort()
+	for i in hits:
+		result.append(_enemies[i])
+	return result
+
+
+func query_nearest(pos: Vector2, k: int = 1, exclude: Node = null, filter: Callable = Callable()) -> Array[EnemyBase]:
+	## Up to k live enemies closest to pos, nearest first.
+	## filter (optional) receives an EnemyBase and returns false to skip it.
+	_ensure_built()
+	var result: Array[EnemyBase] = []
+	if k <= 0 or _enemies.is_empty():
+		return result
+
+	_best_dist.clear()
+	_best_idx.clear()
+	var cx := _cell_x(pos.x)
+	var cy := _cell_y(pos.y)
+	# Ring bound only holds when pos is inside the grid (clamping is a projection)
+	var bounded := Rect2(GRID_ORIGIN, Vector2(GRID_COLS, GRID_ROWS) * CELL_SIZE).has_point(pos)
+	var max_ring := maxi(GRID_COLS, GRID_ROWS)
+
+	for ring in range(max_ring + 1):
+		for cell in _ring_cells(cx, cy, ring):
+			for slot in range(_cell_start[cell], _cell_start[cell + 1]):
+				var i := _cell_items[slot]
+				var enemy = _enemies[i]
+				if not _is_live(enemy, exclude):
+					continue
+				if filter.is_valid() and not filter.call(enemy):
+					continue
+				_insert_best(k, enemy.global_position.distance_squared_to(pos), i)
+		# Anything in ring + 1 or beyond is at least ring * CELL_SIZE away
+		if bounded and _best_idx.size() >= k:
+			var bound := ring * CELL_SIZE
+			if _best_dist[_best_idx.size() - 1] <= bound * bound:
+				break
+
+	for i in _best_idx:
+		result.append(_enemies[i])
+	return result
+
+
+func query_segment(a: Vector2, b: Vector2, width: float, exclude: Node = null) -> Array[EnemyBase]:
+	## Live enemies within width of the segment a-b, in scene-tree order
+	_ensure_built()
+	var result: Array[EnemyBase] = []
+	var width_sq := width * width
+	var hits := PackedInt32Array()
+	var offset := Vector2(width, width)
+	var lo := Vector2(minf(a.x, b.x), minf(a.y, b.y)) - offset
+	var hi := Vector2(maxf(a.x, b.x), maxf(a.y, b.y)) + offset
+	for i in _collect_candidates(lo, hi):
+		var enemy = _enemies[i]
+		if not _is_live(enemy, exclude):
+			continue
+		var closest := Geometry2D.get_closest_point_to_segment(enemy.global_position, a, b)
+		if enemy.global_position.distance_squared_to(closest) < width_sq:
+			hits.append(i)
+	hits.sort()
+	for i in hits:
+		result.append(_enemies[i])
+	return result
+
+
+func get_enemy_count() -> int:
+	_ensure_built()
+	return _enemies.size()
+
+
+func invalidate() -> void:
+	## Force a rebuild on the next query (e.g. after a batch spawn mid-frame)
+	_built_frame = -1
+
+
+# ============================================================================
+# Grid Build
+# ============================================================================
+
+func _ensure_built() -> void:
+	if _built_frame != Engine.get_physics_frames():
+		_rebuild()
+
+
+func _rebuild() -> void:
+	_built_frame = Engine.get_physics_frames()
+	_enemies.clear()
+
+	var container := _get_container()
+	if container:
+		for child in container.get_children():
+			if child is EnemyBase and child.current_state != EnemyBase.State.DEAD:
+				_enemies.append(child)
+
+	# Counting sort of enemy indices into cells
+	var count := _enemies.size()
+	_cell_of.resize(count)
+	_cell_items.resize(count)
+	_cell_start.fill(0)
+	for i in range(count):
+		var pos: Vector2 = _enemies[i].global_position
+		var cell := _cell_y(pos.y) * GRID_COLS + _cell_x(pos.x)
+		_cell_of[i] = cell
+		_cell_start[cell + 1] += 1
+	for c in range(1, CELL_COUNT + 1):
+		_cell_start[c] += _cell_start[c - 1]
+	for c in range(CELL_COUNT):
+		_cell_cursor[c] = _cell_start[c]
+	for i in range(count):
+		var cell := _cell_of[i]
+		_cell_items[_cell_cursor[cell]] = i
+		_cell_cursor[cell] += 1
+
+
+func _get_container() -> Node:
+	if not is_instance_valid(_container) or not _container.is_inside_tree():
+		_container = EntityRegistry.get_container(EntityRegistry.ENEMIES_CONTAINER)
+	return _container
+
+
+func _cell_x(x: float) -> int:
+	return clampi(int(floorf((x - GRID_ORIGIN.x) / CELL_SIZE)), 0, GRID_COLS - 1)
+
+
+func _cell_y(y: float) -> int:
+	return clampi(int(floorf((y - GRID_ORIGIN.y) / CELL_SIZE)), 0, GRID_ROWS - 1)
+
+
+func _collect_candidates(lo: Vector2, hi: Vector2) -> PackedInt32Array:
+	var candidates := PackedInt32Array()
+	for cy in range(_cell_y(lo.y), _cell_y(hi.y) + 1):
+		for cx in range(_cell_x(lo.x), _cell_x(hi.x) + 1):
+			var cell := cy * GRID_COLS + cx
+			for slot in range(_cell_start[cell], _cell_start[cell + 1]):
+				candidates.append(_cell_items[slot])
+	return candidates
+
+
+func _ring_cells(cx: int, cy: int, ring: int) -> PackedInt32Array:
+	var cells := PackedInt32Array()
+	if ring == 0:
+		cells.append(cy * GRID_COLS + cx)
+		return cells
+	for x in range(cx - ring, cx + ring + 1):
+		if x < 0 or x >= GRID_COLS:
+			continue
+		if cy - ring >= 0:
+			cells.append((cy - ring) * GRID_COLS + x)
+		if cy + ring < GRID_ROWS:
+			cells.append((cy + ring) * GRID_COLS + x)
+	for y in range(cy - ring + 1, cy + ring):
+		if y < 0 or y >= GRID_ROWS:
+			continue
+		if cx - ring >= 0:
+			cells.append(y * GRID_COLS + cx - ring)
+		if cx + ring < GRID_COLS:
+			cells.append(y * GRID_COLS + cx + ring)
+	return cells
+
+
+func _insert_best(k: int, dist_sq: float, idx: int) -> void:
+	# Keep the k smallest distances sorted ascending
+	var at := _best_idx.size()
+	while at > 0 and _best_dist[at - 1] > dist_sq:
+		at -= 1
+	if at >= k:
+		return
+	_best_dist.insert(at, dist_sq)
+	_best_idx.insert(at, idx)
+	if _best_idx.size() > k:
+		_best_dist.resize(k)
+		_best_idx.resize(k)
+
+
+func _is_live(enemy, exclude: Node) -> bool:
+	return is_instance_valid(enemy) and enemy != exclude and enemy.current_state != EnemyBase.State.DEAD
+
+
+# ============================================================================
+# Debug / Stats
+# ============================================================================
+
+func benchmark(query_count: int = 1000, radius: float = 100.0) -> Dictionary:
+	## Time query_radius against a full container scan around current enemies
+	## and check both return the same enemies.
+	_rebuild()
+	var result := {
+		"enemies": _enemies.size(),
+		"queries": query_count,
+		"grid_usec": 0,
+		"scan_usec": 0,
+		"speedup": 0.0,
+		"mismatches": 0,
+	}
+	if _enemies.is_empty() or query_count <= 0:
+		return result
+
+	var centers := PackedVector2Array()
+	for i in range(query_count):
+		centers.append(_enemies[i % _enemies.size()].global_position)
+
+	var grid_counts := PackedInt32Array()
+	var start := Time.get_ticks_usec()
+	for center in centers:
+		grid_counts.append(query_radius(center, radius).size())
+	result["grid_usec"] = Time.get_ticks_usec() - start
+
+	var container := _get_container()
+	var radius_sq := radius * radius
+	var scan_counts := PackedInt32Array()
+	start = Time.get_ticks_usec()
+	for center in centers:
+		var hits := 0
+		for child in container.get_children():
+			if child is EnemyBase and child.current_state != EnemyBase.State.DEAD:
+				if child.global_position.distance_squared_to(center) < radius_sq:
+					hits += 1
+		scan_counts.append(hits)
+	result["scan_usec"] = Time.get_ticks_usec() - start
+
+	for i in range(query_count):
+		if grid_counts[i] != scan_counts[i]:
+			result["mismatches"] += 1
+	result["speedup"] = float(result["scan_usec"]) / maxf(1.0, float(result["grid_usec"]))
+	return result
@@ -0,0 +1,123 @@
+extends Node
+## EntityRegistry autoload - O(1) reads of the player, entity containers and
+## live entity counts
+## Entities report themselves: the player and GemField register in _ready,
+## balls and enemies count in on _enter_tree and out on release/despawn (or
+## _exit_tree if freed directly). Hot paths read these instead of walking
+## groups or container children every frame.
+
+enum BallCategory { MAIN, BABY, EVOLVED }
+
+const BALLS_CONTAINER := &"balls_container"
+const ENEMIES_CONTAINER := &"enemies_container"
+const GEMS_CONTAINER := &"gems_container"
+
+var _player = null  # Untyped: freed on scene change
+var _gem_field = null
+var _containers: Dictionary = {}  # container group name -> node (untyped values, may be freed)
+
+var _ball_counts := PackedInt32Array([0, 0, 0])  # Indexed by BallCategory
+var _ball_total: int = 0
+var _enemy_counts: Dictionary = {}  # enemy type (scene name) -> live count
+var _enemy_total: int = 0
+
+
+# ============================================================================
+# Player / containers
+# ============================================================================
+
+func register_player(player: Node2D) -> void:
+	_player = player
+
+
+func get_player() -> Node2D:
+	if _player != null and not is_instance_valid(_player):
+		_player = null
+	return _player
+
+
+func register_containers(balls: Node, enemies: Node, gems: Node) -> void:
+	## Game scenes hand over their containers in _ready
+	_containers[BALLS_CONTAINER] = balls
+	_containers[ENEMIES_CONTAINER] = enemies
+	_containers[GEMS_CONTAINER] = gems
+
+
+func get_container(group_name: StringName) -> Node:
+	## Registered container, else the first node in the group of that name (cached)
+	var container = _containers.get(group_name)
+	if container != null and is_instance_valid(container) and container.is_inside_tree():
+		return container
+	container = get_tree().get_first_node_in_group(group_name)
+	_containers[group_name] = container
+	return container
+
+
+func register_gem_field(gem_field: Node) -> void:
+	_gem_field = gem_field
+
+
+func get_gem_field() -> Node:
+	if _gem_field != null and not is_instance_valid(_gem_field):
+		_gem_field = null
+	return _gem_field
+
+
+# ============================================================================
+# Live counts
+# ============================================================================
+
+func ball_entered(category: BallCategory) -> void:
+	_ball_counts[category] += 1
+	_ball_total += 1
+
+
+func ball_exited(category: BallCategory) -> void:
+	_ball_counts[category] -= 1
+	_ball_total -= 1
+
+
+func get_ball_count(category: int = -1) -> int:
+	## Live balls of one BallCategory, or all balls for -1
+	if category < 0:
+		return _ball_total
+	return _ball_counts[category]
+
+
+func enemy_entered(enemy_type: StringName) -> void:
+	_enemy_counts[enemy_type] = _enemy_counts.get(enemy_type, 0) + 1
+	_enemy_total += 1
+
+
+func enemy_exited(enemy_type: StringName) -> void:
+	_enemy_counts[enemy_type] -= 1
+	_enemy_total -= 1
+
+
+func get_enemy_count(enemy_type: StringName = &"") -> int:
+	## Live enemies of one type (scene name, e.g. &"slime"), or all for &""
+	if enemy_type == &"":
+		return _enemy_total
+	return _enemy_counts.get(enemy_type, 0)
+
+
+func get_gem_count() -> int:
+	var gem_field = get_gem_field()
+	return gem_field.get_gem_count() if gem_field else 0
+
+
+# ============================================================================
+# Debug / Stats
+# ============================================================================
+
+func get_stats() -> Dictionary:
+	return {
+		"has_player": get_player() != null,
+		"balls": _ball_total,
+		"main_balls": _ball_counts[BallCategory.MAIN],
+		"baby_balls": _ball_counts[BallCategory.BABY],
+		"evolved_balls": _ball_counts[BallCategory.EVOLVED],
+		"enemies": _enemy_total,
+		"enemies_by_type": _enemy_counts.duplicate(),
+		"gems": get_gem_count(),
+	}
@@ -0,0 +1,243 @@
+extends Node
+## FormationSystem autoload - moves every spawn formation from packed arrays
+## Each member is a row (formation, offset from the leader). The leader moves
+## itself with its own _move(); once all enemies have moved this frame, every
+## follower is placed at leader position + offset, so a whole formation shares
+## the leader's velocity. Followers skip their own _move() (see
+## EnemyBase.formation_follower), so nothing fights over positions.
+## Members leave when they despawn, start a warning/attack, or get charmed.
+## Members share the spawner's parent, so local positions are used throughout.
+
+const DISSOLUTION_THRESHOLD: float = 0.5  # Dissolve when < 50% members remain
+const PHYSICS_PRIORITY: int = 100  # After enemies (priority 0) have run _move()
+
+# Per-member rows (swap-removed, so row order is arbitrary)
+var _members: Array = []  # Untyped: members can be freed without despawn() (scene change)
+var _member_ids := PackedInt64Array()
+var _member_formation := PackedInt32Array()
+var _offsets := PackedVector2Array()  # Offset from the formation's leader
+var _row_by_id: Dictionary = {}  # member instance id -> row
+
+# Per-formation slots (dissolved slots are reused via _free_formations)
+var _leaders: Array = []
+var _leader_ids := PackedInt64Array()
+var _initial_counts := PackedInt32Array()
+var _alive_counts := PackedInt32Array()  # 0 = slot is free
+var _anchors := PackedVector2Array()  # Scratch: leader position this frame
+var _free_formations := PackedInt32Array()
+
+# Stats
+var _formation_count: int = 0
+var _dissolved_total: int = 0
+var _update_usec: int = 0
+
+
+func _ready() -> void:
+	process_physics_priority = PHYSICS_PRIORITY
+	GameManager.game_started.connect(clear)
+
+
+func _physics_process(_delta: float) -> void:
+	if _members.is_empty() or GameManager.current_state != GameManager.GameState.PLAYING:
+		return
+
+	var start := Time.get_ticks_usec()
+	_drop_freed_members()
+
+	# One anchor read per formation...
+	for f in range(_leaders.size()):
+		if _alive_counts[f] > 0:
+			_anchors[f] = _leaders[f].position
+
+	# ...then one packed pass places every member
+	for row in range(_members.size()):
+		var member_id := _member_ids[row]
+		var f := _member_formation[row]
+		if member_id != _leader_ids[f]:
+			_members[row].position = _anchors[f] + _offsets[row]
+	_update_usec = Time.get_ticks_usec() - start
+
+
+# ============================================================================
+# Spawner / Enemy API
+# ============================================================================
+
+func add_formation(enemies: Array) -> int:
+	## Move enemies together from now on, led by enemies[0]. Returns the formation slot.
+	if enemies.size() < 2:
+		return -1
+
+	var f := _allocate_formation()
+	var leader = enemies[0]
+	_leaders[f] = leader
+	_leader_ids[f] = leader.get_instance_id()
+	_initial_counts[f] = enemies.size()
+	_alive_counts[f] = enemies.size()
+	_anchors[f] = leader.position
+	_formation_count += 1
+
+	for enemy in enemies:
+		var id: int = enemy.get_instance_id()
+		_row_by_id[id] = _members.size()
+		_members.append(enemy)
+		_member_ids.append(id)
+		_member_formation.append(f)
+		_offsets.append(enemy.position - leader.position)
+		enemy.formation_follower = enemy != leader
+	return f
+
+
+func remove_member(enemy: Node) -> void:
+	## Release an enemy from its formation (no-op if it isn't in one)
+	var id := enemy.get_instance_id()
+	if _row_by_id.has(id):
+		_remove_member_row(_row_by_id[id])
+
+
+func is_in_formation(enemy: Node) -> bool:
+	return _row_by_id.has(enemy.get_instance_id())
+
+
+func clear() -> void:
+	for row in range(_members.size()):
+		if is_instance_id_valid(_member_ids[row]):
+			_members[row].formation_follower = false
+	_members.clear()
+	_member_ids.clear()
+	_member_formation.clear()
+	_offsets.clear()
+	_row_by_id.clear()
+	_leaders.clear()
+	_leader_ids.clear()
+	_initial_counts.clear()
+	_alive_counts.clear()
+	_anchors.clear()
+	_free_formations.clear()
+	_formation_count = 0
+
+
+# ============================================================================
+# Internals
+# ============================================================================
+
+func _allocate_formation() -> int:
+	if not _free_formations.is_empty():
+		var f := _free_formations[_free_formations.size() - 1]
+		_free_formations.resize(_free_formations.size() - 1)
+		return f
+	_leaders.append(null)
+	_leader_ids.append(0)
+	_initial_counts.append(0)
+	_alive_counts.append(0)
+	_anchors.append(Vector2.ZERO)
+	return _leaders.size() - 1
+
+
+func _drop_freed_members() -> void:
+	# Non-pooled enemies freed outside despawn() never called remove_member()
+	var row := _members.size() - 1
+	while row >= 0:
+		if not is_instance_id_valid(_member_ids[row]):
+			_remove_member_row(row)
+			# A dissolve can remove several rows at once
+			row = mini(row, _members.size())
+		row -= 1
+
+
+func _remove_member_row(row: int) -> void:
+	var f := _member_formation[row]
+	var was_leader := _member_ids[row] == _leader_ids[f]
+	_remove_row(row)
+	_alive_counts[f] -= 1
+
+	if _alive_counts[f] <= 0 or float(_alive_counts[f]) / float(_initial_counts[f]) < DISSOLUTION_THRESHOLD:
+		_dissolve(f)
+	elif was_leader:
+		_promote_leader(f)
+
+
+func _promote_leader(f: int) -> void:
+	## Next live member leads; offsets are rebased so nobody jumps
+	var new_row := -1
+	for row in range(_members.size()):
+		if _member_formation[row] == f and is_instance_id_valid(_member_ids[row]):
+			new_row = row
+			break
+	if new_row < 0:
+		_dissolve(f)
+		return
+
+	var shift := _offsets[new_row]
+	for row in range(_members.size()):
+		if _member_formation[row] == f:
+			_offsets[row] -= shift
+	_leaders[f] = _members[new_row]
+	_leader_ids[f] = _member_ids[new_row]
+	_members[new_row].formation_follower = false
+
+
+func _dissolve(f: int) -> void:
+	## Release every member of a formation - they move independently again
+	var row := _members.size() - 1
+	while row >= 0:
+		if _member_formation[row] == f:
+			_remove_row(row)
+		row -= 1
+	_leaders[f] = null
+	_leader_ids[f] = 0
+	_alive_counts[f] = 0
+	_free_formations.append(f)
+	_formation_count -= 1
+	_dissolved_total += 1
+
+
+func _remove_row(row: int) -> void:
+	var member_id := _member_ids[row]
+	if is_instance_id_valid(member_id):
+		_members[row].formation_follower = false
+	_row_by_id.erase(member_id)
+
+	var last := _members.size() - 1
+	if row != last:
+		_members[row] = _members[last]
+		_member_ids[row] = _member_ids[last]
+		_member_formation[row] = _member_formation[last]
+		_offsets[row] = _offsets[last]
+		_row_by_id[_member_ids[row]] = row
+	_members.resize(last)
+	_member_ids.resize(last)
+	_member_formation.resize(last)
+	_offsets.resize(last)
+
+
+# ============================================================================
+# Debug / Stats
+# ============================================================================
+
+func get_stats() -> Dictionary:
+	return {
+		"formations": _formation_count,
+		"members": _members.size(),
+		"dissolved_total": _dissolved_total,
+		"update_usec": _update_usec,
+	}
+
+
+func get_member_offset(enemy: Node) -> Vector2:
+	## Offset from the leader, or Vector2.ZERO if not in a formation
+	var id := enemy.get_instance_id()
+	if not _row_by_id.has(id):
+		return Vector2.ZERO
+	return _offsets[_row_by_id[id]]
+
+
+func get_max_offset_error() -> float:
+	## Largest distance between a follower and its slot (leader position + offset)
+	var max_error := 0.0
+	for row in range(_members.size()):
+		var f := _member_formation[row]
+		if _member_ids[row] == _leader_ids[f] or not is_instance_id_valid(_member_ids[row]):
+			continue
+		var target: Vector2 = _leaders[f].position + _offsets[row]
+		max_error = maxf(max_error, _members[row].position.distance_to(target))
+	return max_error
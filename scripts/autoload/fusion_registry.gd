@@ -417,7 +417,11 @@ signal evolved_slots_changed()
 
 func _ready() -> void:
 	_init_passive_slots()  # Initialize slots on startup
+	_build_recipe_index()
 	GameManager.game_started.connect(_reset_for_new_run)
+	BallRegistry.ball_acquired.connect(_on_ball_registry_changed)
+	BallRegistry.ball_leveled_up.connect(_on_ball_registry_changed)
+	BallRegistry.slots_changed.connect(_on_ball_registry_changed)
 
 
 func _reset_for_new_run() -> void:
@@ -439,6 +443,7 @@ func reset() -> void:
 	unlocked_evolved_slots = 1
 	active_evolved_slots = [-1, -1, -1, -1, -1]
 	_init_passive_slots()
+	_invalidate_available()
 
 
 func reset_discoveries() -> void:
@@ -462,55 +467,39 @@ func get_recipe_key(ball_a: BallRegistry.BallType, ball_b: BallRegistry.BallType
 
 func has_evolution_recipe(ball_a: BallRegistry.BallType, ball_b: BallRegistry.BallType) -> bool:
 	"""Check if two ball types have a specific evolution recipe"""
-	var key := get_recipe_key(ball_a, ball_b)
-	return key in EVOLUTION_RECIPES
+	return _evolution_index.has(_pair_key(ball_a, ball_b))
 
 
 func get_evolution_result(ball_a: BallRegistry.BallType, ball_b: BallRegistry.BallType) -> EvolvedBallType:
 	"""Get the evolved ball type from a recipe (NONE if no recipe)"""
-	var key := get_recipe_key(ball_a, ball_b)
-	return EVOLUTION_RECIPES.get(key, EvolvedBallType.NONE)
+	var recipe: Dictionary = _evolution_index.get(_pair_key(ball_a, ball_b), {})
+	return recipe.get("result", EvolvedBallType.NONE)
 
 
 func get_available_evolutions() -> Array[Dictionary]:
-	"""Get all evolutions that can be created with current L3 balls"""
-	var available: Array[Dictionary] = []
-	var fusion_ready := BallRegistry.get_fusion_ready_balls()
-
-	for key in EVOLUTION_RECIPES:
-		var parts: PackedStringArray = key.split("_")
-		if parts.size() != 2:
-			continue
-
-		var type_a: int = -1
-		var type_b: int = -1
-
-		# Convert string names back to enum values
-		for ball_type in BallRegistry.BallType.values():
-			var type_name: String = BallRegistry.BallType.keys()[ball_type]
-			if type_name == parts[0]:
-				type_a = ball_type
-			elif type_name == parts[1]:
-				type_b = ball_type
+	"""Get all evolutions that can be created with current L3 balls (cached)"""
+	if not _available_cache.has("evolution"):
+		var available: Array[Dictionary] = []
+		var fusion_ready := BallRegistry.get_fusion_ready_balls()
+
+		for recipe in _evolution_entries:
+			# Check if both balls are fusion-ready
+			var has_a: bool = recipe["ball_a"] in fusion_ready
+			var has_b: bool = recipe["ball_b"] in fusion_ready
+
+			available.append({
+				"recipe_key": recipe["recipe_key"],
+				"ball_a": recipe["ball_a"],
+				"ball_b": recipe["ball_b"],
+				"result": recipe["result"],
+				"can_create": has_a and has_b,
+				"has_ball_a": has_a,
+				"has_ball_b": has_b
+			})
 
-		if type_a == -1 or type_b == -1:
-			continue
+		_available_cache["evolution"] = available
 
-		# Check if both balls are fusion-ready
-		var has_a := type_a in fusion_ready
-		var has_b := type_b in fusion_ready
-
-		available.append({
-			"recipe_key": key,
-			"ball_a": type_a,
-			"ball_b": type_b,
-			"result": EVOLUTION_RECIPES[key],
-			"can_create": has_a and has_b,
-			"has_ball_a": has_a,
-			"has_ball_b": has_b
-		})
-
-	return available
+	return _available_cache["evolution"].duplicate(true)
 
 
 func evolve_balls(ball_a: BallRegistry.BallType, ball_b: BallRegistry.BallType) -> EvolvedBallType:
@@ -526,6 +515,7 @@ func evolve_balls(ball_a: BallRegistry.BallType, ball_b: BallRegistry.BallType)
 	# Consume the balls from registry
 	BallRegistry.owned_balls.erase(ball_a)
 	BallRegistry.owned_balls.erase(ball_b)
+	_invalidate_available()
 
 	# Add evolved ball at Tier 1 and Level 1
 	owned_evolved_balls[result] = EvolutionTier.TIER_1
@@ -614,6 +604,7 @@ func upgrade_evolution(evolved_type: EvolvedBallType, sacrifice_ball: BallRegist
 
 	# Consume the sacrifice ball
 	BallRegistry.owned_balls.erase(sacrifice_ball)
+	_invalidate_available()
 
 	# Upgrade tier
 	owned_evolved_balls[evolved_type] = new_tier
@@ -665,73 +656,42 @@ func get_multi_evolution_recipe_key(evolved_type: EvolvedBallType, ball_type: Ba
 
 func has_multi_evolution_recipe(evolved_type: EvolvedBallType, ball_type: BallRegistry.BallType) -> bool:
 	"""Check if a multi-evolution recipe exists"""
-	var key := get_multi_evolution_recipe_key(evolved_type, ball_type)
-	return key in MULTI_EVOLUTION_RECIPES
+	return _multi_index.has(_multi_key(evolved_type, ball_type))
 
 
 func get_multi_evolution_result(evolved_type: EvolvedBallType, ball_type: BallRegistry.BallType) -> EvolvedBallType:
 	"""Get the result of a multi-evolution (NONE if no recipe)"""
-	var key := get_multi_evolution_recipe_key(evolved_type, ball_type)
-	return MULTI_EVOLUTION_RECIPES.get(key, EvolvedBallType.NONE)
+	var recipe: Dictionary = _multi_index.get(_multi_key(evolved_type, ball_type), {})
+	return recipe.get("result", EvolvedBallType.NONE)
 
 
 func get_available_multi_evolutions() -> Array[Dictionary]:
-	"""Get all multi-evolutions possible with current L3 evolved balls and L3 basic balls"""
-	var available: Array[Dictionary] = []
-	var fusion_ready_evolved := get_fusion_ready_evolved_balls()
-	var fusion_ready_basic := BallRegistry.get_fusion_ready_balls()
-
-	if fusion_ready_evolved.is_empty() or fusion_ready_basic.is_empty():
-		return available
-
-	for key in MULTI_EVOLUTION_RECIPES:
-		# Parse the key to get evolved type and ball type
-		var parts: PackedStringArray = key.split("_")
-		if parts.size() < 2:
-			continue
-
-		var evolved_name: String = parts[0]
-		var ball_name: String = parts[1]
-
-		# Find the evolved type
-		var evolved_type: int = -1
-		for et in EvolvedBallType.values():
-			if EvolvedBallType.keys()[et] == evolved_name:
-				evolved_type = et
-				break
-
-		if evolved_type == -1:
-			continue
-
-		# Find the ball type
-		var ball_type: int = -1
-		for bt in BallRegistry.BallType.values():
-			if BallRegistry.BallType.keys()[bt] == ball_name:
-				ball_type = bt
-				break
-
-		if ball_type == -1:
-			continue
-
-		# Check if we have both required balls at L3
-		var has_evolved := evolved_type in fusion_ready_evolved
-		var has_basic := ball_type in fusion_ready_basic
-
-		var result_type: EvolvedBallType = MULTI_EVOLUTION_RECIPES[key]
-		var result_data := get_evolved_ball_data(result_type)
-
-		available.append({
-			"recipe_key": key,
-			"evolved_type": evolved_type,
-			"ball_type": ball_type,
-			"result": result_type,
-			"result_name": result_data.get("name", "Unknown"),
-			"can_create": has_evolved and has_basic,
-			"has_evolved": has_evolved,
-			"has_basic": has_basic
-		})
-
-	return available
+	"""Get all multi-evolutions possible with current L3 evolved balls and L3 basic balls (cached)"""
+	if not _available_cache.has("multi_evolution"):
+		var available: Array[Dictionary] = []
+		var fusion_ready_evolved := get_fusion_ready_evolved_balls()
+		var fusion_ready_basic := BallRegistry.get_fusion_ready_balls()
+
+		if not fusion_ready_evolved.is_empty() and not fusion_ready_basic.is_empty():
+			for recipe in _multi_entries:
+				# Check if we have both required balls at L3
+				var has_evolved: bool = recipe["evolved_type"] in fusion_ready_evolved
+				var has_basic: bool = recipe["ball_type"] in fusion_ready_basic
+
+				available.append({
+					"recipe_key": recipe["recipe_key"],
+					"evolved_type": recipe["evolved_type"],
+					"ball_type": recipe["ball_type"],
+					"result": recipe["result"],
+					"result_name": recipe["result_name"],
+					"can_create": has_evolved and has_basic,
+					"has_evolved": has_evolved,
+					"has_basic": has_basic
+				})
+
+		_available_cache["multi_evolution"] = available
+
+	return _available_cache["multi_evolution"].duplicate(true)
 
 
 func multi_evolve_ball(evolved_type: EvolvedBallType, ball_type: BallRegistry.BallType) -> EvolvedBallType:
@@ -762,6 +722,7 @@ func multi_evolve_ball(evolved_type: EvolvedBallType, ball_type: BallRegistry.Ba
 
 	# Remove the basic ball from registry
 	BallRegistry.owned_balls.erase(ball_type)
+	_invalidate_available()
 
 	# Add the new multi-evolved ball at Tier 2 (multi-evolutions start at tier 2)
 	owned_evolved_balls[result] = EvolutionTier.TIER_2
@@ -796,66 +757,42 @@ func get_ultimate_recipe_key(type_a: EvolvedBallType, type_b: EvolvedBallType, t
 
 func has_ultimate_recipe(type_a: EvolvedBallType, type_b: EvolvedBallType, type_c: EvolvedBallType) -> bool:
 	"""Check if an ultimate three-way fusion recipe exists"""
-	var key := get_ultimate_recipe_key(type_a, type_b, type_c)
-	return key in ULTIMATE_RECIPES
+	return _ultimate_index.has(_triple_key(type_a, type_b, type_c))
 
 
 func get_ultimate_result(type_a: EvolvedBallType, type_b: EvolvedBallType, type_c: EvolvedBallType) -> EvolvedBallType:
 	"""Get the result of an ultimate fusion (NONE if no recipe)"""
-	var key := get_ultimate_recipe_key(type_a, type_b, type_c)
-	return ULTIMATE_RECIPES.get(key, EvolvedBallType.NONE)
+	var recipe: Dictionary = _ultimate_index.get(_triple_key(type_a, type_b, type_c), {})
+	return recipe.get("result", EvolvedBallType.NONE)
 
 
 func get_available_ultimate_fusions() -> Array[Dictionary]:
-	"""Get all ultimate fusions possible with current L3 evolved balls"""
-	var available: Array[Dictionary] = []
-	var fusion_ready_evolved := get_fusion_ready_evolved_balls()
-
-	if fusion_ready_evolved.size() < 3:
-		return available  # Need at least 3 L3 evolved balls
-
-	for key in ULTIMATE_RECIPES:
-		# Parse the key to get the three evolved types
-		var parts: PackedStringArray = key.split("_")
-		if parts.size() != 3:
-			continue
-
-		var types: Array[int] = []
-		var all_found := true
-
-		for part in parts:
-			var found := false
-			for et in EvolvedBallType.values():
-				if EvolvedBallType.keys()[et] == part:
-					types.append(et)
-					found = true
-					break
-			if not found:
-				all_found = false
-				break
-
-		if not all_found or types.size() != 3:
-			continue
-
-		# Check if we have all three evolved balls at L3
-		var has_all := true
-		for et in types:
-			if et not in fusion_ready_evolved:
-				has_all = false
-				break
-
-		var result_type: EvolvedBallType = ULTIMATE_RECIPES[key]
-		var result_data := get_evolved_ball_data(result_type)
-
-		available.append({
-			"recipe_key": key,
-			"evolved_types": types,
-			"result": result_type,
-			"result_name": result_data.get("name", "Unknown"),
-			"can_create": has_all
-		})
-
-	return available
+	"""Get all ultimate fusions possible with current L3 evolved balls (cached)"""
+	if not _available_cache.has("ultimate"):
+		var available: Array[Dictionary] = []
+		var fusion_ready_evolved := get_fusion_ready_evolved_balls()
+
+		# Need at least 3 L3 evolved balls
+		if fusion_ready_evolved.size() >= 3:
+			for recipe in _ultimate_entries:
+				# Check if we have all three evolved balls at L3
+				var has_all := true
+				for et in recipe["evolved_types"]:
+					if et not in fusion_ready_evolved:
+						has_all = false
+						break
+
+				available.append({
+					"recipe_key": recipe["recipe_key"],
+					"evolved_types": recipe["evolved_types"].duplicate(),
+					"result": recipe["result"],
+					"result_name": recipe["result_name"],
+					"can_create": has_all
+				})
+
+		_available_cache["ultimate"] = available
+
+	return _available_cache["ultimate"].duplicate(true)
 
 
 func ultimate_fuse_balls(type_a: EvolvedBallType, type_b: EvolvedBallType, type_c: EvolvedBallType) -> EvolvedBallType:
@@ -885,6 +822,7 @@ func ultimate_fuse_balls(type_a: EvolvedBallType, type_b: EvolvedBallType, type_
 		owned_evolved_balls.erase(source_type)
 		evolved_ball_levels.erase(source_type)
 		evolved_ball_xp.erase(source_type)
+	_invalidate_available()
 
 	# Add the new ultimate ball at Tier 4 (ultimate fusions are legendary tier)
 	owned_evolved_balls[result] = EvolutionTier.TIER_4
@@ -904,6 +842,161 @@ func ultimate_fuse_balls(type_a: EvolvedBallType, type_b: EvolvedBallType, type_
 	return result
 
 
+# ===== RECIPE INDEX =====
+# Built once from the recipe consts at startup. Lookups use packed enum keys
+# instead of building name strings, and the "available now" lists are cached
+# until a BallRegistry change or a fusion here invalidates them.
+
+const RECIPE_KEY_STRIDE: int = 256  # Larger than either enum, so packed keys never collide
+
+var _evolution_index: Dictionary = {}  # sorted pair key -> recipe
+var _multi_index: Dictionary = {}  # evolved * stride + ball -> recipe
+var _ultimate_index: Dictionary = {}  # sorted triple key -> recipe
+var _evolution_entries: Array[Dictionary] = []  # In recipe const order
+var _multi_entries: Array[Dictionary] = []
+var _ultimate_entries: Array[Dictionary] = []
+var _recipes_by_ball: Dictionary = {}  # BallType -> Array of recipe keys using it
+var _recipes_by_evolved: Dictionary = {}  # EvolvedBallType -> Array of recipe keys using it
+var _available_cache: Dictionary = {}  # "evolution" / "multi_evolution" / "ultimate" -> Array[Dictionary]
+
+
+func _build_recipe_index() -> void:
+	"""Parse every recipe key once into enum values and index it"""
+	var ball_names: Dictionary = BallRegistry.BallType
+	var evolved_names: Dictionary = EvolvedBallType
+
+	for key in EVOLUTION_RECIPES:
+		var types := _parse_recipe_key(key, [ball_names, ball_names])
+		if types.is_empty():
+			push_warning("FusionRegistry: could not index evolution recipe " + key)
+			continue
+		var recipe := {"recipe_key": key, "ball_a": types[0], "ball_b": types[1], "result": EVOLUTION_RECIPES[key]}
+		_evolution_entries.append(recipe)
+		_evolution_index[_pair_key(types[0], types[1])] = recipe
+		_add_reverse_entry(_recipes_by_ball, types[0], key)
+		_add_reverse_entry(_recipes_by_ball, types[1], key)
+
+	for key in MULTI_EVOLUTION_RECIPES:
+		var types := _parse_recipe_key(key, [evolved_names, ball_names])
+		if types.is_empty():
+			push_warning("FusionRegistry: could not index multi-evolution recipe " + key)
+			continue
+		var result: EvolvedBallType = MULTI_EVOLUTION_RECIPES[key]
+		var recipe := {
+			"recipe_key": key,
+			"evolved_type": types[0],
+			"ball_type": types[1],
+			"result": result,
+			"result_name": get_evolved_ball_data(result).get("name", "Unknown")
+		}
+		_multi_entries.append(recipe)
+		_multi_index[_multi_key(types[0], types[1])] = recipe
+		_add_reverse_entry(_recipes_by_evolved, types[0], key)
+		_add_reverse_entry(_recipes_by_ball, types[1], key)
+
+	for key in ULTIMATE_RECIPES:
+		var types := _parse_recipe_key(key, [evolved_names, evolved_names, evolved_names])
+		if types.is_empty():
+			push_warning("FusionRegistry: could not index ultimate recipe " + key)
+			continue
+		var result: EvolvedBallType = ULTIMATE_RECIPES[key]
+		var recipe := {
+			"recipe_key": key,
+			"evolved_types": types,
+			"result": result,
+			"result_name": get_evolved_ball_data(result).get("name", "Unknown")
+		}
+		_ultimate_entries.append(recipe)
+		_ultimate_index[_triple_key(types[0], types[1], types[2])] = recipe
+		for evolved_type in types:
+			_add_reverse_entry(_recipes_by_evolved, evolved_type, key)
+
+
+func _parse_recipe_key(key: String, name_maps: Array) -> Array[int]:
+	"""Split a recipe key into one enum value per name map (empty if no match).
+	Enum names can contain underscores (BLACK_HOLE), so every split is tried."""
+	var types: Array[int] = []
+	if not _match_key_tokens(key.split("_"), 0, name_maps, types):
+		types.clear()
+	return types
+
+
+func _match_key_tokens(tokens: PackedStringArray, start: int, name_maps: Array, types: Array[int]) -> bool:
+	var names: Dictionary = name_maps[types.size()]
+	var type_name := ""
+	for end in range(start, tokens.size()):
+		type_name = tokens[end] if end == start else type_name + "_" + tokens[end]
+		if not names.has(type_name):
+			continue
+		types.append(names[type_name])
+		if types.size() == name_maps.size():
+			if end == tokens.size() - 1:
+				return true
+		elif _match_key_tokens(tokens, end + 1, name_maps, types):
+			return true
+		types.pop_back()
+	return false
+
+
+func _add_reverse_entry(reverse_map: Dictionary, enum_value: int, recipe_key: String) -> void:
+	if not reverse_map.has(enum_value):
+		reverse_map[enum_value] = []
+	reverse_map[enum_value].append(recipe_key)
+
+
+func _pair_key(type_a: int, type_b: int) -> int:
+	return mini(type_a, type_b) * RECIPE_KEY_STRIDE + maxi(type_a, type_b)
+
+
+func _multi_key(evolved_type: int, ball_type: int) -> int:
+	return evolved_type * RECIPE_KEY_STRIDE + ball_type
+
+
+func _triple_key(type_a: int, type_b: int, type_c: int) -> int:
+	var low := mini(type_a, mini(type_b, type_c))
+	var high := maxi(type_a, maxi(type_b, type_c))
+	var mid := type_a + type_b + type_c - low - high
+	return (low * RECIPE_KEY_STRIDE + mid) * RECIPE_KEY_STRIDE + high
+
+
+func _on_ball_registry_changed(_ball_type: int = 0, _new_level: int = 0) -> void:
+	_invalidate_available()
+
+
+func _invalidate_available() -> void:
+	"""Drop cached "available now" lists (call after any owned/level change)"""
+	_available_cache.clear()
+
+
+func get_evolution_recipes() -> Array[Dictionary]:
+	"""All Tier 1 recipes as {recipe_key, ball_a, ball_b, result}, in definition order"""
+	return _evolution_entries.duplicate(true)
+
+
+func get_multi_evolution_recipes() -> Array[Dictionary]:
+	"""All multi-evolution recipes as {recipe_key, evolved_type, ball_type, result, result_name}"""
+	return _multi_entries.duplicate(true)
+
+
+func get_ultimate_recipes() -> Array[Dictionary]:
+	"""All ultimate recipes as {recipe_key, evolved_types, result, result_name}"""
+	return _ultimate_entries.duplicate(true)
+
+
+func get_recipes_using_ball(ball_type: BallRegistry.BallType) -> Array[String]:
+	"""Recipe keys (evolution and multi-evolution) that consume this basic ball"""
+	var keys: Array[String] = []
+	keys.assign(_recipes_by_ball.get(ball_type, []))
+	return keys
+
+
+func get_recipes_using_evolved(evolved_type: EvolvedBallType) -> Array[String]:
+	"""Recipe keys (multi-evolution and ultimate) that consume this evolved ball"""
+	var keys: Array[String] = []
+	keys.assign(_recipes_by_evolved.get(evolved_type, []))
+	return keys
+
+
 # ===== EVOLVED BALL LEVELING (L1 -> L2 -> L3) =====
 
 func get_evolved_ball_level(evolved_type: EvolvedBallType) -> int:
@@ -950,6 +1043,7 @@ func _level_up_evolved_ball(evolved_type: EvolvedBallType) -> void:
 	var new_level := current_level + 1
 	evolved_ball_levels[evolved_type] = new_level
 	evolved_ball_xp[evolved_type] = 0  # Reset XP for next level
+	_invalidate_available()
 
 	evolved_ball_leveled_up.emit(evolved_type, new_level)
 
@@ -1113,6 +1207,7 @@ func fuse_balls(ball_a: BallRegistry.BallType, ball_b: BallRegistry.BallType) ->
 	# Consume the balls from registry
 	BallRegistry.owned_balls.erase(ball_a)
 	BallRegistry.owned_balls.erase(ball_b)
+	_invalidate_available()
 
 	# Create and store fused ball data
 	owned_fused_balls[fused_id] = create_fused_ball_data(ball_a, ball_b)
@@ -1762,5 +1857,6 @@ func restore_session_state(data: Dictionary) -> void:
 				filled_evolved_count += 1
 		unlocked_evolved_slots = maxi(filled_evolved_count, 1)
 
+	_invalidate_available()
 	passive_slots_changed.emit()
 	evolved_slots_changed.emit()
@@ -19,6 +19,8 @@ signal level_up_completed
 signal player_damaged(amount: int)
 signal wave_changed(new_wave: int)
 signal hp_changed(current_hp: int, max_hp: int)
+signal xp_changed(current_xp: int, xp_to_next_level: int)
+signal level_changed(new_level: int)
 signal leadership_changed(new_value: float)
 signal invincibility_changed(is_invincible: bool)
 signal shooting_changed(is_shooting: bool)
@@ -81,12 +83,32 @@ var current_state: GameState = GameState.MENU:
 			current_state = value
 			_on_state_changed(old_state, value)
 
-var player_hp: int = 100
-var max_hp: int = 100
+var player_hp: int = 100:
+	set(value):
+		if player_hp != value:
+			player_hp = value
+			hp_changed.emit(player_hp, max_hp)
+var max_hp: int = 100:
+	set(value):
+		if max_hp != value:
+			max_hp = value
+			hp_changed.emit(player_hp, max_hp)
 var current_wave: int = 1
-var current_xp: int = 0
-var xp_to_next_level: int = 100
-var player_level: int = 1
+var current_xp: int = 0:
+	set(value):
+		if current_xp != value:
+			current_xp = value
+			xp_changed.emit(current_xp, xp_to_next_level)
+var xp_to_next_level: int = 100:
+	set(value):
+		if xp_to_next_level != value:
+			xp_to_next_level = value
+			xp_changed.emit(current_xp, xp_to_next_level)
+var player_level: int = 1:
+	set(value):
+		player_level = value
+		_combat_modifiers_dirty = true  # Dexterity crit scales with level
+		level_changed.emit(player_level)
 var gem_magnetism_range: float = 0.0
 var leadership: float = 0.0  # Affects baby ball spawn rate
 var is_boss_fight: bool = false  # Auto-magnet during boss fights
@@ -103,8 +125,14 @@ var dodge_chance: float = 0.0  # Chance to avoid damage
 var life_steal_percent: float = 0.0  # Heal from damage dealt
 
 # Character system
-var selected_character: Resource = null
-var secondary_character: Resource = null  # For dual character mode (Matchmaker)
+var selected_character: Resource = null:
+	set(value):
+		selected_character = value
+		_combat_modifiers_dirty = true
+var secondary_character: Resource = null:  # For dual character mode (Matchmaker)
+	set(value):
+		secondary_character = value
+		_combat_modifiers_dirty = true
 var character_damage_mult: float = 1.0
 var character_speed_mult: float = 1.0
 var character_crit_mult: float = 1.0
@@ -115,8 +143,19 @@ var secondary_starting_ball: int = -1  # Second ball for dual character mode (-1
 
 # Passive ability flags (set based on selected character)
 enum Passive { NONE, QUICK_LEARNER, SHATTER, JACKPOT, INFERNO, SQUAD_LEADER, LIFESTEAL, BOUNCE_MASTER, EXECUTIONER, COLLECTOR, EMPTY_NESTER, BERSERKER, SWARM_LORD, GRAVITY, SHIELD_BOUNCE, PANDEMIC, BLOODLUST }
-var active_passive: Passive = Passive.NONE
-var secondary_passive: Passive = Passive.NONE  # Second passive for dual character mode
+var active_passive: Passive = Passive.NONE:
+	set(value):
+		active_passive = value
+		_combat_modifiers_dirty = true
+var secondary_passive: Passive = Passive.NONE:  # Second passive for dual character mode
+	set(value):
+		secondary_passive = value
+		_combat_modifiers_dirty = true
+
+# Cached combat modifiers (rebuilt lazily after any input above changes)
+var _combat_modifiers: CombatModifiers = null
+var _combat_modifiers_dirty: bool = true
+var _combat_modifiers_version: int = 0
 
 # High score persistence
 var high_score_wave: int = 0
@@ -124,6 +163,7 @@ var high_score_level: int = 0
 var total_victories: int = 0
 var is_endless_mode: bool = false  # True after victory if player continues
 const HIGH_SCORE_PATH := "user://high_score.save"
+const HIGH_SCORE_SAVE_KEY := &"high_scores"
 
 # Session stats (reset each run)
 var stats := {
@@ -136,7 +176,11 @@ var stats := {
 
 
 func _ready() -> void:
+	SaveCoordinator.register(HIGH_SCORE_SAVE_KEY, HIGH_SCORE_PATH, _serialize_high_scores)
 	_load_high_scores()
+	# Meta upgrades and fusion passives also feed the combat modifier snapshot
+	MetaManager.bonuses_changed.connect(invalidate_combat_modifiers)
+	FusionRegistry.passive_slots_changed.connect(invalidate_combat_modifiers)
 
 
 func _process(delta: float) -> void:
@@ -161,7 +205,7 @@ func record_ball_fired() -> void:
 func record_damage_dealt(amount: int) -> void:
 	stats["damage_dealt"] += amount
 	# Lifesteal passive: heal 5% of damage dealt
-	var lifesteal := get_lifesteal_percent()
+	var lifesteal := get_combat_modifiers().lifesteal_percent
 	if lifesteal > 0:
 		var heal_amount := int(amount * lifesteal)
 		if heal_amount > 0:
@@ -476,10 +520,9 @@ func take_damage(amount: int) -> void:
 	if is_invincible:
 		return  # Ignore damage during i-frames
 
-	player_hp = max(0, player_hp - amount)
+	player_hp = max(0, player_hp - amount)  # Setter emits hp_changed
 	SoundManager.play(SoundManager.SoundType.PLAYER_DAMAGE)
 	player_damaged.emit(amount)
-	hp_changed.emit(player_hp, max_hp)
 	# Big screen shake on player damage
 	CameraShake.shake(15.0, 3.0)
 
@@ -493,8 +536,7 @@ func take_damage(amount: int) -> void:
 
 
 func heal(amount: int) -> void:
-	player_hp = min(max_hp, player_hp + amount)
-	hp_changed.emit(player_hp, max_hp)
+	player_hp = min(max_hp, player_hp + amount)  # Setter emits hp_changed
 
 
 func add_leadership(amount: float) -> void:
@@ -502,6 +544,24 @@ func add_leadership(amount: float) -> void:
 	leadership_changed.emit(leadership)
 
 
+# === Combat modifier snapshot ===
+
+func get_combat_modifiers() -> CombatModifiers:
+	## Run-wide hit/spawn modifiers as plain fields, rebuilt only when dirty.
+	## Treat the returned object as read-only; it is replaced on rebuild.
+	if _combat_modifiers_dirty or _combat_modifiers == null:
+		_combat_modifiers = CombatModifiers.capture(self, MetaManager)
+		_combat_modifiers_version += 1
+		_combat_modifiers.version = _combat_modifiers_version
+		_combat_modifiers_dirty = false
+	return _combat_modifiers
+
+
+func invalidate_combat_modifiers() -> void:
+	## Mark the snapshot stale (character, passive, level or meta bonus changed)
+	_combat_modifiers_dirty = true
+
+
 # === Passive ability helpers ===
 
 func get_xp_multiplier() -> float:
@@ -948,15 +1008,16 @@ func _check_high_scores() -> void:
 
 
 func _save_high_scores() -> void:
+	SaveCoordinator.mark_dirty(HIGH_SCORE_SAVE_KEY)
+
+
+func _serialize_high_scores() -> PackedByteArray:
 	var data := {
 		"wave": high_score_wave,
 		"level": high_score_level,
 		"victories": total_victories
 	}
-
-	var file := FileAccess.open(HIGH_SCORE_PATH, FileAccess.WRITE)
-	if file:
-		file.store_string(JSON.stringify(data))
+	return JSON.stringify(data).to_utf8_buffer()
 
 
 # =============================================================================
@@ -1050,3 +1111,71 @@ func restore_session_state(data: Dictionary) -> void:
 	hp_changed.emit(player_hp, max_hp)
 	wave_changed.emit(current_wave)
 	leadership_changed.emit(leadership)
+
+
+# =============================================================================
+# DEBUG / BENCHMARK
+# =============================================================================
+
+func get_combat_modifiers_dict() -> Dictionary:
+	"""Current snapshot as a Dictionary (for tests and debug overlays)"""
+	return get_combat_modifiers().to_dict()
+
+
+func benchmark_combat_modifiers(hit_count: int = 20000) -> Dictionary:
+	"""Time the per-hit modifier math through the getters vs the cached snapshot.
+	Every hit takes every branch (bounced, crit, fire, frozen/burning/bleeding)
+	so both paths read every modifier; results must match exactly."""
+	var result := {
+		"hits": hit_count,
+		"getter_usec": 0,
+		"snapshot_usec": 0,
+		"getter_hits_per_sec": 0.0,
+		"snapshot_hits_per_sec": 0.0,
+		"speedup": 0.0,
+		"mismatches": 0,
+	}
+	if hit_count <= 0:
+		return result
+
+	var getter_damage := PackedInt32Array()
+	getter_damage.resize(hit_count)
+	var start := Time.get_ticks_usec()
+	for i in range(hit_count):
+		var dmg := 100
+		var bounce_mult := get_bounce_damage_multiplier()
+		if bounce_mult > 0:
+			dmg = int(dmg * (1.0 + (i % 5) * bounce_mult))
+		if get_total_crit_chance() >= 0.0:
+			dmg = int(dmg * get_crit_damage_multiplier())
+		dmg = int(dmg * get_fire_damage_multiplier())
+		dmg = int(dmg * get_damage_vs_frozen())
+		dmg = int(dmg * get_damage_vs_burning())
+		dmg = int(dmg * get_damage_vs_bleeding())
+		getter_damage[i] = dmg
+	result["getter_usec"] = Time.get_ticks_usec() - start
+
+	var snapshot_damage := PackedInt32Array()
+	snapshot_damage.resize(hit_count)
+	start = Time.get_ticks_usec()
+	for i in range(hit_count):
+		var mods := get_combat_modifiers()
+		var dmg := 100
+		if mods.bounce_damage_mult > 0:
+			dmg = int(dmg * (1.0 + (i % 5) * mods.bounce_damage_mult))
+		if mods.crit_chance >= 0.0:
+			dmg = int(dmg * mods.crit_damage_mult)
+		dmg = int(dmg * mods.fire_damage_mult)
+		dmg = int(dmg * mods.damage_vs_frozen)
+		dmg = int(dmg * mods.damage_vs_burning)
+		dmg = int(dmg * mods.damage_vs_bleeding)
+		snapshot_damage[i] = dmg
+	result["snapshot_usec"] = Time.get_ticks_usec() - start
+
+	for i in range(hit_count):
+		if getter_damage[i] != snapshot_damage[i]:
+			result["mismatches"] += 1
+	result["getter_hits_per_sec"] = hit_count * 1000000.0 / maxf(1.0, float(result["getter_usec"]))
+	result["snapshot_hits_per_sec"] = hit_count * 1000000.0 / maxf(1.0, float(result["snapshot_usec"]))
+	result["speedup"] = float(result["getter_usec"]) / maxf(1.0, float(result["snapshot_usec"]))
+	return result
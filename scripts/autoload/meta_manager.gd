@@ -13,13 +13,40 @@ signal session_saved
 signal session_loaded
 signal session_cleared
 signal matchmaker_unlocked
+signal bonuses_changed  # Upgrade or evolution bonuses recalculated
 
 # Save slot system
 const SLOT_COUNT := 3
 const LEGACY_SAVE_PATH := "user://meta.save"
 const ACTIVE_SLOT_PATH := "user://active_slot.save"
+const MANIFEST_PATH := "user://slot_manifest.save"
+
+# SaveCoordinator keys (meta and session files of the current slot)
+const META_SAVE_KEY := &"meta"
+const SESSION_SAVE_KEY := &"session"
+const MANIFEST_SAVE_KEY := &"slot_manifest"
+
+# Save schemas (SaveFormat binary; schema 1 is the legacy JSON text format)
+const META_SCHEMA_VERSION: int = 2
+const SESSION_SCHEMA_VERSION: int = 2  # 2: payload split into sections
+const MANIFEST_SCHEMA_VERSION: int = 1
 
 var current_slot: int = 1
+var _pending_session: Dictionary = {}  # Last save_session() data, written by SaveCoordinator
+
+# Session autosave sections: these keys of the session dict are encoded on
+# their own and everything else goes in "game". The encoder (SaveCoordinator
+# worker) reuses a section's bytes while it equals the previous snapshot's.
+const SESSION_SECTIONS := ["ball_registry", "fusion_registry"]
+const SESSION_GAME_SECTION := "game"
+var _session_section_cache: Dictionary = {}  # section -> [snapshot, bytes], encoder only
+var _session_stats_mutex := Mutex.new()
+var _session_stats: Dictionary = {"encodes": 0, "encode_usec": 0, "sections_encoded": 0, "sections_reused": 0}
+# Slot manifest: slot -> preview fields, refreshed whenever a slot's meta or
+# session is written, so the slot screen never opens the full save files.
+# Each entry keeps the header checksum of the files it was built from.
+var _manifest: Dictionary = {}
+var _manifest_updates: Dictionary = {}  # save key -> [slot, data], applied once the file is on disk
 
 
 func _get_meta_path(slot: int = -1) -> String:
@@ -131,6 +158,12 @@ var evo_bonus_critical: float = 0.0  # +0.02 per Critical Mastery
 func _ready() -> void:
 	_migrate_legacy_save()
 	_load_active_slot()
+	SaveCoordinator.register(META_SAVE_KEY, _get_meta_path(), _serialize_meta)
+	SaveCoordinator.register(SESSION_SAVE_KEY, _get_session_path(), _snapshot_session, _encode_session)
+	# After meta/session: a full flush writes them first, then the manifest they update
+	SaveCoordinator.register(MANIFEST_SAVE_KEY, MANIFEST_PATH, _serialize_manifest)
+	SaveCoordinator.write_completed.connect(_on_save_written)
+	_load_manifest()
 	load_data()
 	_calculate_bonuses()
 	_session_start_time = Time.get_unix_time_from_system()
@@ -255,16 +288,13 @@ func record_difficulty_completion(character_name: String, stage_index: int, diff
 
 	var char_data: Dictionary = difficulty_completions[character_name]
 
-	# Convert stage_index to string for JSON compatibility
-	var stage_key := str(stage_index)
-
 	# Check if this is a new high
-	var current_highest: int = char_data.get(stage_key, 0)
+	var current_highest: int = char_data.get(stage_index, 0)
 	if difficulty_level <= current_highest:
 		return false  # Already beaten this or higher
 
 	# New record!
-	char_data[stage_key] = difficulty_level
+	char_data[stage_index] = difficulty_level
 	difficulty_completions[character_name] = char_data
 
 	# Also record stage completion for gear system if first time
@@ -281,8 +311,7 @@ func get_highest_difficulty_beaten(character_name: String, stage_index: int) ->
 		return 0
 
 	var char_data: Dictionary = difficulty_completions[character_name]
-	var stage_key := str(stage_index)
-	return char_data.get(stage_key, 0)
+	return char_data.get(stage_index, 0)
 
 
 func has_beaten_difficulty(stage_index: int, difficulty_level: int) -> bool:
@@ -516,6 +545,8 @@ func _calculate_evolution_bonuses() -> void:
 			"critical":
 				evo_bonus_critical += evolution.effect_value
 
+	bonuses_changed.emit()
+
 
 func is_passive_evolution_unlocked(evolution_id: String) -> bool:
 	"""Check if a passive evolution is unlocked."""
@@ -753,6 +784,11 @@ func get_achievement_progress(achievement_id: String) -> Dictionary:
 
 
 func save_data() -> void:
+	## Mark meta progression for saving; SaveCoordinator coalesces and writes it
+	SaveCoordinator.mark_dirty(META_SAVE_KEY)
+
+
+func _serialize_meta() -> PackedByteArray:
 	# Update playtime before saving
 	_update_playtime()
 
@@ -763,7 +799,13 @@ func save_data() -> void:
 	if created_at.is_empty():
 		created_at = last_played
 
-	var data := {
+	var data := _get_meta_dict()
+	_manifest_updates[META_SAVE_KEY] = [current_slot, data]
+	return _encode_meta(data)
+
+
+func _get_meta_dict() -> Dictionary:
+	return {
 		"coins": pit_coins,
 		"runs": total_runs,
 		"best_wave": best_wave,
@@ -783,28 +825,17 @@ func save_data() -> void:
 		"total_playtime": total_playtime
 	}
 
-	var file := FileAccess.open(_get_meta_path(), FileAccess.WRITE)
-	if file:
-		file.store_string(JSON.stringify(data))
-		file.close()
-
 
 func load_data() -> void:
 	var path := _get_meta_path()
+	SaveCoordinator.flush_path(path)
 	if not FileAccess.file_exists(path):
 		# Reset to defaults for empty slot
 		_reset_slot_data()
 		return
 
-	var file := FileAccess.open(path, FileAccess.READ)
-	if not file:
-		return
-
-	var json_string := file.get_as_text()
-	file.close()
-
-	var data = JSON.parse_string(json_string)
-	if data is Dictionary:
+	var data := _read_meta_file(path)
+	if not data.is_empty():
 		pit_coins = data.get("coins", 0)
 		total_runs = data.get("runs", 0)
 		best_wave = data.get("best_wave", 0)
@@ -823,6 +854,8 @@ func load_data() -> void:
 		last_played = data.get("last_played", "")
 		total_playtime = data.get("total_playtime", 0.0)
 		coins_changed.emit(pit_coins)
+		if data["_from_schema"] < META_SCHEMA_VERSION:
+			save_data()  # Rewrite imported/older saves in the current format
 
 
 func _reset_slot_data() -> void:
@@ -858,6 +891,7 @@ func _reset_slot_data() -> void:
 	evo_bonus_piercing = 0
 	evo_bonus_ricochet = 0
 	evo_bonus_critical = 0.0
+	_calculate_bonuses()  # Also resets building stat bonuses and emits bonuses_changed
 	coins_changed.emit(pit_coins)
 
 
@@ -867,11 +901,14 @@ func reset_data() -> void:
 
 	var meta_path := _get_meta_path()
 	var session_path := _get_session_path()
+	SaveCoordinator.discard_path(meta_path)
+	SaveCoordinator.discard_path(session_path)
 
 	if FileAccess.file_exists(meta_path):
 		DirAccess.remove_absolute(meta_path)
 	if FileAccess.file_exists(session_path):
 		DirAccess.remove_absolute(session_path)
+	_remove_manifest_slot(current_slot)
 
 
 # =============================================================================
@@ -888,7 +925,12 @@ func set_active_slot(slot: int) -> void:
 	_update_playtime()
 	save_data()
 
+	# Pending writes land in the old slot's files (and manifest entry) before
+	# the keys move over
+	SaveCoordinator.set_path(META_SAVE_KEY, _get_meta_path(slot))
+	SaveCoordinator.set_path(SESSION_SAVE_KEY, _get_session_path(slot))
 	current_slot = slot
+	_pending_session = {}
 	_save_active_slot()
 	load_data()
 	_calculate_bonuses()
@@ -897,73 +939,29 @@ func set_active_slot(slot: int) -> void:
 
 
 func get_slot_preview(slot: int) -> Dictionary:
-	"""Get preview info for a slot without fully loading it.
+	"""Get preview info for a slot from the slot manifest (no save file is read).
 	Returns empty dict if slot is empty."""
-	var path := _get_meta_path(slot)
-	if not FileAccess.file_exists(path):
-		return {}
-
-	var file := FileAccess.open(path, FileAccess.READ)
-	if not file:
-		return {}
-
-	var json_string := file.get_as_text()
-	file.close()
-
-	var data = JSON.parse_string(json_string)
-	if not data is Dictionary:
+	_flush_slot(slot)
+	var entry: Dictionary = _manifest.get(slot, {})
+	if not entry.has("coins"):
 		return {}
-
-	# Check if there's an active session
-	var has_session := has_active_session(slot)
-	var session_preview := {}
-	if has_session:
-		session_preview = _get_session_preview(slot)
-
-	return {
-		"slot": slot,
-		"coins": data.get("coins", 0),
-		"runs": data.get("runs", 0),
-		"best_wave": data.get("best_wave", 0),
-		"highest_stage": data.get("highest_stage", 0),
-		"total_playtime": data.get("total_playtime", 0.0),
-		"last_played": data.get("last_played", ""),
-		"created_at": data.get("created_at", ""),
-		"has_active_session": has_session,
-		"session": session_preview
-	}
+	var preview := entry.duplicate(true)
+	preview["slot"] = slot
+	return preview
 
 
-func _get_session_preview(slot: int) -> Dictionary:
-	"""Get preview info from a session save file."""
-	var path := _get_session_path(slot)
-	if not FileAccess.file_exists(path):
-		return {}
-
-	var file := FileAccess.open(path, FileAccess.READ)
-	if not file:
-		return {}
-
-	var json_string := file.get_as_text()
-	file.close()
-
-	var data = JSON.parse_string(json_string)
-	if not data is Dictionary:
-		return {}
-
-	return {
-		"character_path": data.get("character_path", ""),
-		"current_wave": data.get("current_wave", 1),
-		"player_level": data.get("player_level", 1),
-		"player_hp": data.get("player_hp", 100),
-		"max_hp": data.get("max_hp", 100),
-		"current_stage": data.get("current_stage", 0)
-	}
+func get_slot_previews() -> Array[Dictionary]:
+	"""Previews for slots 1..SLOT_COUNT in order (empty dicts for empty slots)."""
+	var previews: Array[Dictionary] = []
+	for slot in range(1, SLOT_COUNT + 1):
+		previews.append(get_slot_preview(slot))
+	return previews
 
 
 func is_slot_empty(slot: int) -> bool:
 	"""Check if a slot has no save data."""
-	return not FileAccess.file_exists(_get_meta_path(slot))
+	_flush_slot(slot)
+	return not _manifest.get(slot, {}).has("coins")
 
 
 func are_all_slots_empty() -> bool:
@@ -976,7 +974,10 @@ func are_all_slots_empty() -> bool:
 
 func has_active_session(slot: int = -1) -> bool:
 	"""Check if a slot has a mid-run session save."""
-	return FileAccess.file_exists(_get_session_path(slot))
+	if slot == -1:
+		slot = current_slot
+	_flush_slot(slot)
+	return _manifest.get(slot, {}).get("has_active_session", false)
 
 
 func delete_slot(slot: int) -> void:
@@ -987,11 +988,14 @@ func delete_slot(slot: int) -> void:
 
 	var meta_path := _get_meta_path(slot)
 	var session_path := _get_session_path(slot)
+	SaveCoordinator.discard_path(meta_path)
+	SaveCoordinator.discard_path(session_path)
 
 	if FileAccess.file_exists(meta_path):
 		DirAccess.remove_absolute(meta_path)
 	if FileAccess.file_exists(session_path):
 		DirAccess.remove_absolute(session_path)
+	_remove_manifest_slot(slot)
 
 	# If deleting current slot, reset in-memory data
 	if slot == current_slot:
@@ -1063,44 +1067,496 @@ func _migrate_legacy_save() -> void:
 # =============================================================================
 
 func save_session(session_data: Dictionary) -> void:
-	"""Save mid-run session state."""
+	"""Save mid-run session state (written behind by SaveCoordinator;
+	session_saved fires once it is on disk)."""
 	session_data["saved_at"] = Time.get_datetime_string_from_system(true)
-
-	var file := FileAccess.open(_get_session_path(), FileAccess.WRITE)
-	if file:
-		file.store_string(JSON.stringify(session_data))
-		file.close()
+	_pending_session = session_data
+	SaveCoordinator.mark_dirty(SESSION_SAVE_KEY)
+
+
+func _snapshot_session() -> Dictionary:
+	# Main thread: save_session() data is already a copy of live state
+	_manifest_updates[SESSION_SAVE_KEY] = [current_slot, _pending_session]
+	return _pending_session
+
+
+func _encode_session(snapshot: Dictionary) -> PackedByteArray:
+	"""Runs on a SaveCoordinator worker. Sections equal to the previous
+	snapshot's (e.g. slot layout between waves) reuse their encoded bytes."""
+	var start := Time.get_ticks_usec()
+	var sections := {SESSION_GAME_SECTION: {}}
+	for key in snapshot:
+		if key in SESSION_SECTIONS:
+			sections[key] = snapshot[key]
+		else:
+			sections[SESSION_GAME_SECTION][key] = snapshot[key]
+
+	var writer := SaveFormat.Writer.new()
+	var encoded := 0
+	writer.put_u16(sections.size())
+	for section_name in sections:
+		var section = sections[section_name]
+		var cached: Array = _session_section_cache.get(section_name, [])
+		var bytes: PackedByteArray
+		if not cached.is_empty() and cached[0] == section:
+			bytes = cached[1]
+		else:
+			bytes = var_to_bytes(section)
+			_session_section_cache[section_name] = [section, bytes]
+			encoded += 1
+		writer.put_string(section_name)
+		writer.put_bytes(bytes)
+	var packed := SaveFormat.pack(SaveFormat.Kind.SESSION, SESSION_SCHEMA_VERSION, writer.get_bytes())
+
+	_session_stats_mutex.lock()
+	_session_stats["encodes"] += 1
+	_session_stats["encode_usec"] = Time.get_ticks_usec() - start
+	_session_stats["sections_encoded"] += encoded
+	_session_stats["sections_reused"] += sections.size() - encoded
+	_session_stats_mutex.unlock()
+	return packed
+
+
+func _decode_session(payload: PackedByteArray, schema_version: int):
+	if schema_version < 2:
+		return bytes_to_var(payload)
+	var reader := SaveFormat.Reader.new(payload)
+	var data := {}
+	for i in range(reader.get_u16()):
+		var section_name := reader.get_string()
+		var section = bytes_to_var(reader.get_bytes())
+		if section_name == SESSION_GAME_SECTION and section is Dictionary:
+			data.merge(section)
+		else:
+			data[section_name] = section
+	return data
+
+
+func _on_save_written(key: StringName, ok: bool) -> void:
+	# The manifest entry and its stamp change together, after the slot file.
+	# A failed write left the old file (and its stamp) in place: keep the old entry.
+	var update: Array = _manifest_updates.get(key, [])
+	_manifest_updates.erase(key)
+	if not ok:
+		return
+	if key == META_SAVE_KEY and not update.is_empty():
+		_set_manifest_meta(update[0], update[1])
+	elif key == SESSION_SAVE_KEY:
+		if not update.is_empty():
+			_set_manifest_session(update[0], update[1])
 		session_saved.emit()
 
 
 func load_session() -> Dictionary:
 	"""Load mid-run session state. Returns empty dict if none exists."""
-	var path := _get_session_path()
-	if not FileAccess.file_exists(path):
-		return {}
-
-	var file := FileAccess.open(path, FileAccess.READ)
-	if not file:
-		return {}
-
-	var json_string := file.get_as_text()
-	file.close()
-
-	var data = JSON.parse_string(json_string)
-	if data is Dictionary:
+	var data := _read_session_file(_get_session_path())
+	if not data.is_empty():
 		session_loaded.emit()
-		return data
-	return {}
+	return data
 
 
 func clear_session() -> void:
 	"""Delete the mid-run session save (called on run end)."""
 	var path := _get_session_path()
+	# A session still waiting on its debounced write counts as saved too
+	var had_session := SaveCoordinator.is_dirty(SESSION_SAVE_KEY)
+	SaveCoordinator.discard_path(path)
+	_pending_session = {}
+	_set_manifest_session(current_slot, {})
 	if FileAccess.file_exists(path):
 		DirAccess.remove_absolute(path)
+		had_session = true
+	if had_session:
 		session_cleared.emit()
 
 
+# =============================================================================
+# SLOT MANIFEST (preview fields for every slot in one small file)
+# =============================================================================
+
+func _flush_slot(slot: int) -> void:
+	# A pending meta/session write refreshes the slot's manifest entry
+	SaveCoordinator.flush_path(_get_meta_path(slot))
+	SaveCoordinator.flush_path(_get_session_path(slot))
+
+
+func _set_manifest_meta(slot: int, data: Dictionary) -> void:
+	var entry: Dictionary = _manifest.get(slot, {"has_active_session": false, "session": {}})
+	entry["meta_stamp"] = _get_save_stamp(_get_meta_path(slot))
+	entry["coins"] = data.get("coins", 0)
+	entry["runs"] = data.get("runs", 0)
+	entry["best_wave"] = data.get("best_wave", 0)
+	entry["highest_stage"] = data.get("highest_stage", 0)
+	entry["total_playtime"] = data.get("total_playtime", 0.0)
+	entry["last_played"] = data.get("last_played", "")
+	entry["created_at"] = data.get("created_at", "")
+	_manifest[slot] = entry
+	SaveCoordinator.mark_dirty(MANIFEST_SAVE_KEY)
+
+
+func _set_manifest_session(slot: int, session_data: Dictionary) -> void:
+	"""Record a slot's session summary ({} = no active session)."""
+	var entry: Dictionary = _manifest.get(slot, {})
+	entry["has_active_session"] = not session_data.is_empty()
+	entry["session"] = _get_session_summary(session_data) if not session_data.is_empty() else {}
+	entry["session_stamp"] = _get_save_stamp(_get_session_path(slot)) if not session_data.is_empty() else PackedByteArray()
+	_manifest[slot] = entry
+	SaveCoordinator.mark_dirty(MANIFEST_SAVE_KEY)
+
+
+func _remove_manifest_slot(slot: int) -> void:
+	if _manifest.erase(slot):
+		SaveCoordinator.mark_dirty(MANIFEST_SAVE_KEY)
+
+
+func _get_session_summary(data: Dictionary) -> Dictionary:
+	return {
+		"character_path": data.get("character_path", ""),
+		"current_wave": data.get("current_wave", 1),
+		"player_level": data.get("player_level", 1),
+		"player_hp": data.get("player_hp", 100),
+		"max_hp": data.get("max_hp", 100),
+		"current_stage": data.get("current_stage", 0)
+	}
+
+
+func _get_save_stamp(path: String) -> PackedByteArray:
+	"""Header checksum of a save file (changes on every write, read without the
+	payload). Empty if the file is missing or not a SaveFormat file."""
+	if not FileAccess.file_exists(path):
+		return PackedByteArray()
+	var file := FileAccess.open(path, FileAccess.READ)
+	if not file:
+		return PackedByteArray()
+	return SaveFormat.get_checksum(file.get_buffer(SaveFormat.HEADER_SIZE))
+
+
+func _serialize_manifest() -> PackedByteArray:
+	return SaveFormat.pack(SaveFormat.Kind.MANIFEST, MANIFEST_SCHEMA_VERSION, var_to_bytes(_manifest))
+
+
+func _load_manifest() -> void:
+	"""Read the manifest, rebuilding entries whose stamps disagree with the slot
+	file headers (first launch with a manifest, or a crash between a save and its
+	manifest write). Unreadable meta files leave the slot without a preview."""
+	_manifest = {}
+	if FileAccess.file_exists(MANIFEST_PATH):
+		var save := SaveFormat.unpack(FileAccess.get_file_as_bytes(MANIFEST_PATH), SaveFormat.Kind.MANIFEST)
+		if not save.is_empty() and save["schema_version"] <= MANIFEST_SCHEMA_VERSION:
+			var data = bytes_to_var(save["payload"])
+			if data is Dictionary:
+				_manifest = data
+
+	for slot in range(1, SLOT_COUNT + 1):
+		var entry: Dictionary = _manifest.get(slot, {})
+		var has_meta := FileAccess.file_exists(_get_meta_path(slot))
+		var has_session := FileAccess.file_exists(_get_session_path(slot))
+		if entry.has("coins") == has_meta and entry.get("has_active_session", false) == has_session \
+				and entry.get("meta_stamp", PackedByteArray()) == _get_save_stamp(_get_meta_path(slot)) \
+				and entry.get("session_stamp", PackedByteArray()) == _get_save_stamp(_get_session_path(slot)):
+			continue
+		_manifest.erase(slot)
+		var meta := _read_meta_file(_get_meta_path(slot)) if has_meta else {}
+		if not meta.is_empty():
+			_set_manifest_meta(slot, meta)
+		var session := _read_session_file(_get_session_path(slot)) if has_session else {}
+		if not session.is_empty():
+			_set_manifest_session(slot, session)
+		SaveCoordinator.mark_dirty(MANIFEST_SAVE_KEY)
+
+
+# =============================================================================
+# SAVE FORMAT (SaveFormat binary, with import of legacy JSON saves)
+# =============================================================================
+
+func _read_meta_file(path: String) -> Dictionary:
+	"""Meta data migrated to META_SCHEMA_VERSION, or {} if missing/unreadable.
+	"_from_schema" holds the version the file was written with."""
+	SaveCoordinator.flush_path(path)
+	if not FileAccess.file_exists(path):
+		return {}
+
+	var bytes := FileAccess.get_file_as_bytes(path)
+	var data: Dictionary
+	var schema_version: int
+	if SaveFormat.is_packed(bytes):
+		var save := SaveFormat.unpack(bytes, SaveFormat.Kind.META)
+		if save.is_empty():
+			push_warning("Meta save failed its checksum: %s" % path)
+			return {}
+		schema_version = save["schema_version"]
+		if schema_version > META_SCHEMA_VERSION:
+			push_warning("Meta save is from a newer version: %s" % path)
+			return {}
+		data = _decode_meta(save["payload"])
+	else:
+		# Legacy JSON text (schema 1) - imported here, rewritten as binary on next save
+		var parsed = JSON.parse_string(bytes.get_string_from_utf8())
+		if not parsed is Dictionary:
+			return {}
+		data = parsed
+		schema_version = 1
+
+	data = _migrate_meta(data, schema_version)
+	data["_from_schema"] = schema_version
+	return data
+
+
+func _read_session_file(path: String) -> Dictionary:
+	"""Session data from a binary or legacy JSON save, or {} if missing/unreadable."""
+	SaveCoordinator.flush_path(path)
+	if not FileAccess.file_exists(path):
+		return {}
+
+	var bytes := FileAccess.get_file_as_bytes(path)
+	var data
+	if SaveFormat.is_packed(bytes):
+		var save := SaveFormat.unpack(bytes, SaveFormat.Kind.SESSION)
+		if save.is_empty() or save["schema_version"] > SESSION_SCHEMA_VERSION:
+			push_warning("Session save is corrupt or from a newer version: %s" % path)
+			return {}
+		data = _decode_session(save["payload"], save["schema_version"])
+	else:
+		data = JSON.parse_string(bytes.get_string_from_utf8())
+	return data if data is Dictionary else {}
+
+
+func _migrate_meta(data: Dictionary, from_version: int) -> Dictionary:
+	"""Apply forward migrations one schema step at a time."""
+	var version := from_version
+	while version < META_SCHEMA_VERSION:
+		match version:
+			1:
+				data = _migrate_meta_v1_to_v2(data)
+		version += 1
+	return data
+
+
+func _migrate_meta_v1_to_v2(data: Dictionary) -> Dictionary:
+	"""JSON saves: numbers come back as floats and completion stage keys as strings."""
+	var upgrades := {}
+	var json_upgrades: Dictionary = data.get("upgrades", {})
+	for upgrade_id in json_upgrades:
+		upgrades[upgrade_id] = int(json_upgrades[upgrade_id])
+
+	var stages := {}
+	var json_stages: Dictionary = data.get("stage_completions", {})
+	for stage_key in json_stages:
+		stages[int(stage_key)] = Array(json_stages[stage_key])
+
+	var difficulties := {}
+	var json_difficulties: Dictionary = data.get("difficulty_completions", {})
+	for character_name in json_difficulties:
+		var char_data := {}
+		for stage_key in json_difficulties[character_name]:
+			char_data[int(stage_key)] = int(json_difficulties[character_name][stage_key])
+		difficulties[character_name] = char_data
+
+	return {
+		"coins": int(data.get("coins", 0)),
+		"runs": int(data.get("runs", 0)),
+		"best_wave": int(data.get("best_wave", 0)),
+		"highest_stage": int(data.get("highest_stage", 0)),
+		"upgrades": upgrades,
+		"unlocked_characters": Array(data.get("unlocked_characters", [])),
+		"unlocked_passive_evolutions": Array(data.get("unlocked_passive_evolutions", [])),
+		"stage_completions": stages,
+		"difficulty_completions": difficulties,
+		"lifetime_kills": int(data.get("lifetime_kills", 0)),
+		"lifetime_gems": int(data.get("lifetime_gems", 0)),
+		"lifetime_damage": int(data.get("lifetime_damage", 0)),
+		"unlocked_achievements": Array(data.get("unlocked_achievements", [])),
+		"matchmaker_purchased": bool(data.get("matchmaker_purchased", false)),
+		"created_at": str(data.get("created_at", "")),
+		"last_played": str(data.get("last_played", "")),
+		"total_playtime": float(data.get("total_playtime", 0.0)),
+	}
+
+
+func _encode_meta(data: Dictionary) -> PackedByteArray:
+	"""Schema 2 layout; _decode_meta must read fields in the same order."""
+	var writer := SaveFormat.Writer.new()
+	writer.put_s64(data["coins"])
+	writer.put_u32(data["runs"])
+	writer.put_u32(data["best_wave"])
+	writer.put_u8(data["highest_stage"])
+	writer.put_s64(data["lifetime_kills"])
+	writer.put_s64(data["lifetime_gems"])
+	writer.put_s64(data["lifetime_damage"])
+	writer.put_bool(data["matchmaker_purchased"])
+	writer.put_f64(data["total_playtime"])
+	writer.put_string(data["created_at"])
+	writer.put_string(data["last_played"])
+
+	var upgrades: Dictionary = data["upgrades"]
+	writer.put_u16(upgrades.size())
+	for upgrade_id in upgrades:
+		writer.put_string(upgrade_id)
+		writer.put_u16(upgrades[upgrade_id])
+
+	writer.put_string_list(data["unlocked_characters"])
+	writer.put_string_list(data["unlocked_passive_evolutions"])
+	writer.put_string_list(data["unlocked_achievements"])
+
+	var stages: Dictionary = data["stage_completions"]
+	writer.put_u16(stages.size())
+	for stage_index in stages:
+		writer.put_u8(stage_index)
+		writer.put_string_list(stages[stage_index])
+
+	var difficulties: Dictionary = data["difficulty_completions"]
+	writer.put_u16(difficulties.size())
+	for character_name in difficulties:
+		var char_data: Dictionary = difficulties[character_name]
+		writer.put_string(character_name)
+		writer.put_u16(char_data.size())
+		for stage_index in char_data:
+			writer.put_u8(stage_index)
+			writer.put_u16(char_data[stage_index])
+
+	return SaveFormat.pack(SaveFormat.Kind.META, META_SCHEMA_VERSION, writer.get_bytes())
+
+
+func _decode_meta(payload: PackedByteArray) -> Dictionary:
+	var reader := SaveFormat.Reader.new(payload)
+	var data := {
+		"coins": reader.get_s64(),
+		"runs": reader.get_u32(),
+		"best_wave": reader.get_u32(),
+		"highest_stage": reader.get_u8(),
+		"lifetime_kills": reader.get_s64(),
+		"lifetime_gems": reader.get_s64(),
+		"lifetime_damage": reader.get_s64(),
+		"matchmaker_purchased": reader.get_bool(),
+		"total_playtime": reader.get_f64(),
+		"created_at": reader.get_string(),
+		"last_played": reader.get_string(),
+	}
+
+	var upgrades := {}
+	for i in range(reader.get_u16()):
+		var upgrade_id := reader.get_string()
+		upgrades[upgrade_id] = reader.get_u16()
+	data["upgrades"] = upgrades
+
+	data["unlocked_characters"] = reader.get_string_list()
+	data["unlocked_passive_evolutions"] = reader.get_string_list()
+	data["unlocked_achievements"] = reader.get_string_list()
+
+	var stages := {}
+	for i in range(reader.get_u16()):
+		var stage_index := reader.get_u8()
+		stages[stage_index] = reader.get_string_list()
+	data["stage_completions"] = stages
+
+	var difficulties := {}
+	for i in range(reader.get_u16()):
+		var character_name := reader.get_string()
+		var char_data := {}
+		for j in range(reader.get_u16()):
+			var stage_index := reader.get_u8()
+			char_data[stage_index] = reader.get_u16()
+		difficulties[character_name] = char_data
+	data["difficulty_completions"] = difficulties
+	return data
+
+
+func benchmark_save_format(characters: int = 40, achievements: int = 400, iterations: int = 20) -> Dictionary:
+	## Save/load time and file size of the legacy JSON format vs SaveFormat for a
+	## synthetic profile with long completion and achievement lists (live data untouched)
+	var data := _make_benchmark_profile(characters, achievements)
+	var json_path := "user://save_benchmark.json"
+	var binary_path := "user://save_benchmark.bin"
+	var result := {"iterations": iterations}
+
+	var start := Time.get_ticks_usec()
+	for i in range(iterations):
+		var file := FileAccess.open(json_path, FileAccess.WRITE)
+		file.store_string(JSON.stringify(data))
+		file.close()
+	result["json_save_usec"] = Time.get_ticks_usec() - start
+
+	var json_loaded := {}
+	start = Time.get_ticks_usec()
+	for i in range(iterations):
+		json_loaded = _migrate_meta(JSON.parse_string(FileAccess.get_file_as_string(json_path)), 1)
+	result["json_load_usec"] = Time.get_ticks_usec() - start
+
+	start = Time.get_ticks_usec()
+	for i in range(iterations):
+		var file := FileAccess.open(binary_path, FileAccess.WRITE)
+		file.store_buffer(_encode_meta(data))
+		file.close()
+	result["binary_save_usec"] = Time.get_ticks_usec() - start
+
+	var binary_loaded := {}
+	start = Time.get_ticks_usec()
+	for i in range(iterations):
+		var save := SaveFormat.unpack(FileAccess.get_file_as_bytes(binary_path), SaveFormat.Kind.META)
+		binary_loaded = _decode_meta(save["payload"])
+	result["binary_load_usec"] = Time.get_ticks_usec() - start
+
+	result["json_bytes"] = FileAccess.get_file_as_bytes(json_path).size()
+	result["binary_bytes"] = FileAccess.get_file_as_bytes(binary_path).size()
+	result["json_round_trip_ok"] = json_loaded == data
+	result["binary_round_trip_ok"] = binary_loaded == data
+	DirAccess.remove_absolute(json_path)
+	DirAccess.remove_absolute(binary_path)
+	return result
+
+
+func _make_benchmark_profile(characters: int, achievements: int) -> Dictionary:
+	var names: Array = []
+	var difficulties := {}
+	for c in range(characters):
+		var character_name := "Character %d" % c
+		names.append(character_name)
+		var char_data := {}
+		for stage_index in range(StageManager.get_total_stages()):
+			char_data[stage_index] = (c + stage_index) % 10 + 1
+		difficulties[character_name] = char_data
+
+	var stages := {}
+	for stage_index in range(StageManager.get_total_stages()):
+		stages[stage_index] = names.duplicate()
+
+	var achievement_ids: Array = []
+	for a in range(achievements):
+		achievement_ids.append("achievement_%d" % a)
+
+	var upgrades := {}
+	for upgrade_id in PermanentUpgrades.UPGRADES:
+		upgrades[upgrade_id] = 3
+
+	return {
+		"coins": 123456,
+		"runs": 987,
+		"best_wave": 120,
+		"highest_stage": 8,
+		"upgrades": upgrades,
+		"unlocked_characters": names,
+		"unlocked_passive_evolutions": ["power_mastery", "rapid_mastery"],
+		"stage_completions": stages,
+		"difficulty_completions": difficulties,
+		"lifetime_kills": 5000000,
+		"lifetime_gems": 2500000,
+		"lifetime_damage": 9876543210,
+		"unlocked_achievements": achievement_ids,
+		"matchmaker_purchased": true,
+		"created_at": "2026-01-01T00:00:00",
+		"last_played": "2026-10-18T12:00:00",
+		"total_playtime": 360000.5,
+	}
+
+
+func get_session_save_stats() -> Dictionary:
+	## Worker-side session encode stats (last encode time, section reuse totals)
+	_session_stats_mutex.lock()
+	var stats := _session_stats.duplicate()
+	_session_stats_mutex.unlock()
+	return stats
+
+
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
@@ -1,8 +1,13 @@
 extends Node
 ## MusicManager - Procedural background music that intensifies with gameplay
+## Each biome's bass and drum bar (normal and boss variants) is rendered once
+## off the main thread and played as a looping buffer; until a loop is ready
+## the old per-beat synthesis keeps the music going.
 
 const SAMPLE_RATE := 44100.0
 const DEFAULT_BPM := 120.0
+const LOOP_STEPS := 8  # Eighth-note steps per rendered bar (pattern length)
+const BOSS_TEMPO_MULT := 1.25  # Boss mode beats are 20% shorter (wait_time * 0.8)
 
 # Biome-specific music parameters for distinct musical character per stage
 const BIOME_MUSIC := {
@@ -70,10 +75,21 @@ var _pre_boss_melody_volume: float = -10.0
 var _crossfading: bool = false
 var _crossfade_tween: Tween
 
+# Pre-rendered loops
+var _loop_cache: Dictionary = {}  # loop key -> {"bass", "drums": AudioStreamWAV, "melody": Array[AudioStreamWAV]}
+var _rendered: Dictionary = {}  # loop key -> raw render job output, guarded by _render_mutex
+var _render_mutex := Mutex.new()
+var _render_tasks: Dictionary = {}  # loop key -> WorkerThreadPool task id
+var _main_thread_jobs: Array[Dictionary] = []  # Time-sliced fallback for builds without threads
+var _render_usec: int = 0  # Total time spent rendering loops (worker + main thread)
+var _active_loop_key: String = ""
+var _rng := RandomNumberGenerator.new()  # Noise for per-beat fallback synthesis
+
 
 func _ready() -> void:
 	_setup_players()
 	_setup_timer()
+	_queue_loop_renders()
 	# Connect to biome changes for per-biome music
 	StageManager.biome_changed.connect(_on_biome_changed)
 	# Connect to boss events for intense music
@@ -112,11 +128,15 @@ func start_music() -> void:
 	current_intensity = 1.0
 	_current_beat = 0
 	_beat_timer.start()
+	_start_loops()
 
 
 func stop_music() -> void:
 	is_playing = false
 	_beat_timer.stop()
+	_active_loop_key = ""
+	_bass_player.stop()
+	_drum_player.stop()
 
 
 func set_intensity(intensity: float) -> void:
@@ -163,6 +183,8 @@ func _crossfade_to_biome(biome_name: String) -> void:
 		_current_tempo = target_tempo
 		current_intensity = target_intensity
 		_beat_timer.wait_time = 60.0 / _current_tempo / 2.0
+		if is_playing:
+			_start_loops()
 	)
 
 	# Fade in new (0.5s)
@@ -207,20 +229,29 @@ func set_boss_mode(enabled: bool) -> void:
 		_drum_player.volume_db = _pre_boss_drum_volume
 		_melody_player.volume_db = _pre_boss_melody_volume
 
+	if is_playing:
+		_start_loops()
+
 
 func _on_beat() -> void:
 	if not is_playing:
 		return
 
+	# Switch to the cached loop as soon as its render finishes (on a bar boundary)
+	if _active_loop_key.is_empty() and _current_beat % LOOP_STEPS == 0:
+		_start_loops()
+
 	var beat_index: int = _current_beat % _bass_pattern.size()
 
-	# Play bass on every beat
-	_play_bass(_bass_pattern[beat_index])
+	if _active_loop_key.is_empty():
+		# Fallback until the loop is rendered: synthesize this beat
+		# Play bass on every beat
+		_play_bass(_bass_pattern[beat_index])
 
-	# Play drums - use boss pattern during boss fights
-	var pattern: Array[int] = _boss_drum_pattern if is_boss_fight else _drum_pattern
-	var drum_type: int = pattern[beat_index]
-	_play_drum(drum_type)
+		# Play drums - use boss pattern during boss fights
+		var pattern: Array[int] = _boss_drum_pattern if is_boss_fight else _drum_pattern
+		var drum_type: int = pattern[beat_index]
+		_play_drum(drum_type)
 
 	# Occasional melody at higher intensity (suppressed during boss fights)
 	if not is_boss_fight and current_intensity >= 2.0 and randf() < 0.2:
@@ -232,36 +263,241 @@ func _on_beat() -> void:
 func _play_bass(semitone: int) -> void:
 	var freq: float = _root_note * pow(2.0, semitone / 12.0)
 	var beat_duration: float = 60.0 / _current_tempo
-	_bass_player.stream = _generate_bass_note(freq, beat_duration * 0.45)
+	_bass_player.stream = _make_stream(_generate_bass_note(freq, beat_duration * 0.45))
 	_bass_player.play()
 
 
 func _play_drum(drum_type: int) -> void:
-	match drum_type:
-		1:  # Kick
-			_drum_player.stream = _generate_kick()
-		2:  # Snare
-			_drum_player.stream = _generate_snare()
-		3:  # Hihat
-			_drum_player.stream = _generate_hihat()
+	_drum_player.stream = _make_stream(_generate_drum(drum_type, _rng))
 	_drum_player.play()
 
 
 func _play_melody_note() -> void:
 	# Use current biome's scale for melody notes
-	var note: int = _current_scale[randi() % _current_scale.size()]
-	var freq: float = _root_note * 4.0 * pow(2.0, note / 12.0)  # Two octaves up
-	var beat_duration: float = 60.0 / _current_tempo
-	_melody_player.stream = _generate_melody_note(freq, beat_duration * 0.3)
+	var degree: int = randi() % _current_scale.size()
+	var cached: Dictionary = _loop_cache.get(_loop_key(_current_biome, false), {})
+	var notes: Array = cached.get("melody", [])
+	if degree < notes.size():
+		_melody_player.stream = notes[degree]
+	else:
+		var note: int = _current_scale[degree]
+		var freq: float = _root_note * 4.0 * pow(2.0, note / 12.0)  # Two octaves up
+		var beat_duration: float = 60.0 / _current_tempo
+		_melody_player.stream = _make_stream(_generate_melody_note(freq, beat_duration * 0.3))
 	_melody_player.play()
 
 
-func _generate_bass_note(freq: float, duration: float) -> AudioStreamWAV:
+# ============================================================================
+# Loop Rendering
+# ============================================================================
+
+func _loop_key(biome_name: String, boss: bool) -> String:
+	return "%s|%s" % [biome_name, "boss" if boss else "normal"]
+
+
+func _queue_loop_renders() -> void:
+	## Render every biome's loops, current biome first
+	var biome_names: Array = BIOME_MUSIC.keys()
+	biome_names.erase(_current_biome)
+	biome_names.push_front(_current_biome)
+
+	var use_threads := not OS.has_feature("web") or OS.has_feature("threads")
+	for biome_name in biome_names:
+		for boss in [false, true]:
+			var job := _new_render_job(biome_name, boss)
+			if use_threads:
+				_render_tasks[job["key"]] = WorkerThreadPool.add_task(_run_render_job.bind(job), false, "MusicLoopRender")
+			else:
+				_main_thread_jobs.append(job)
+	set_process(not _main_thread_jobs.is_empty())
+
+
+func _process(_delta: float) -> void:
+	# No threads (single-threaded web export): render one step per frame
+	if _main_thread_jobs.is_empty():
+		set_process(false)
+		return
+	var job: Dictionary = _main_thread_jobs[0]
+	if _render_job_step(job):
+		_main_thread_jobs.pop_front()
+		_store_rendered(job)
+
+
+func _exit_tree() -> void:
+	for task_id in _render_tasks.values():
+		WorkerThreadPool.wait_for_task_completion(task_id)
+	_render_tasks.clear()
+
+
+func _new_render_job(biome_name: String, boss: bool) -> Dictionary:
+	var params: Dictionary = BIOME_MUSIC[biome_name]
+	var tempo: float = params["tempo"]
+	var step_tempo: float = tempo * (BOSS_TEMPO_MULT if boss else 1.0)
+	var rng := RandomNumberGenerator.new()
+	rng.seed = hash(_loop_key(biome_name, boss))
+	return {
+		"key": _loop_key(biome_name, boss),
+		"root": float(params["root"]),
+		"scale": SCALES[params["scale"]],
+		"tempo": tempo,  # Note lengths follow the biome tempo, as with per-beat playback
+		"boss": boss,
+		"step_bytes": int(SAMPLE_RATE * 60.0 / step_tempo / 2.0) * 2,
+		"step": 0,
+		"bass_steps": [],
+		"drum_steps": [],
+		"melody": [],
+		"rng": rng,
+		"usec": 0,
+	}
+
+
+func _run_render_job(job: Dictionary) -> void:
+	# Runs on a WorkerThreadPool thread - must not touch nodes
+	while not _render_job_step(job):
+		pass
+	_store_rendered(job)
+
+
+func _render_job_step(job: Dictionary) -> bool:
+	## Render one eighth-note step (or the melody notes last). Returns true when done.
+	var start := Time.get_ticks_usec()
+	var step: int = job["step"]
+	var root: float = job["root"]
+	var tempo: float = job["tempo"]
+	var step_bytes: int = job["step_bytes"]
+
+	if step < LOOP_STEPS:
+		var semitone: int = _bass_pattern[step % _bass_pattern.size()]
+		var freq: float = root * pow(2.0, semitone / 12.0)
+		job["bass_steps"].append(_fit_to_step(_generate_bass_note(freq, 60.0 / tempo * 0.45), step_bytes))
+		var pattern: Array[int] = _boss_drum_pattern if job["boss"] else _drum_pattern
+		var drum := _generate_drum(pattern[step % pattern.size()], job["rng"])
+		job["drum_steps"].append(_fit_to_step(drum, step_bytes))
+	elif not job["boss"]:
+		# Melody notes are only played outside boss fights
+		for note in job["scale"]:
+			var freq: float = root * 4.0 * pow(2.0, note / 12.0)  # Two octaves up
+			job["melody"].append(_generate_melody_note(freq, 60.0 / tempo * 0.3))
+
+	job["step"] = step + 1
+	job["usec"] += Time.get_ticks_usec() - start
+	return step >= LOOP_STEPS
+
+
+func _fit_to_step(data: PackedByteArray, step_bytes: int) -> PackedByteArray:
+	# Truncate notes that would ring past the next step (the per-beat player cut them off too)
+	if data.size() > step_bytes:
+		return data.slice(0, step_bytes)
+	data.resize(step_bytes)  # Zero-pad to the step boundary
+	return data
+
+
+func _store_rendered(job: Dictionary) -> void:
+	_render_mutex.lock()
+	_rendered[job["key"]] = job
+	_render_mutex.unlock()
+
+
+func _get_loop(key: String) -> Dictionary:
+	## Cached loop streams for key, or {} while the render is still running
+	if _loop_cache.has(key):
+		return _loop_cache[key]
+
+	if _render_tasks.has(key):
+		if not WorkerThreadPool.is_task_completed(_render_tasks[key]):
+			return {}
+		WorkerThreadPool.wait_for_task_completion(_render_tasks[key])
+		_render_tasks.erase(key)
+
+	_render_mutex.lock()
+	var job: Dictionary = _rendered.get(key, {})
+	_rendered.erase(key)
+	_render_mutex.unlock()
+	if job.is_empty():
+		return {}
+
+	var bass := PackedByteArray()
+	for chunk in job["bass_steps"]:
+		bass.append_array(chunk)
+	var drums := PackedByteArray()
+	for chunk in job["drum_steps"]:
+		drums.append_array(chunk)
+	var melody: Array[AudioStreamWAV] = []
+	for note_data in job["melody"]:
+		melody.append(_make_stream(note_data))
+
+	var loop := {
+		"bass": _make_stream(bass, true),
+		"drums": _make_stream(drums, true),
+		"melody": melody,
+	}
+	_loop_cache[key] = loop
+	_render_usec += job["usec"]
+	return loop
+
+
+func _start_loops() -> void:
+	## Restart bass and drums on the loop for the current biome/boss state.
+	## Leaves _active_loop_key empty (per-beat fallback) if it isn't rendered yet.
+	var key := _loop_key(_current_biome, is_boss_fight)
+	var loop := _get_loop(key)
+	if loop.is_empty():
+		_active_loop_key = ""
+		return
+	_bass_player.stream = loop["bass"]
+	_drum_player.stream = loop["drums"]
+	_bass_player.play()
+	_drum_player.play()
+	_active_loop_key = key
+	_current_beat = 0
+
+
+func get_loop_cache_stats() -> Dictionary:
+	## Rendered loop count, sample memory and total render time
+	var bytes := 0
+	for loop in _loop_cache.values():
+		bytes += loop["bass"].data.size() + loop["drums"].data.size()
+		for note in loop["melody"]:
+			bytes += note.data.size()
+	return {
+		"loops_cached": _loop_cache.size(),
+		"loops_total": BIOME_MUSIC.size() * 2,
+		"loops_pending": _render_tasks.size() + _main_thread_jobs.size(),
+		"bytes": bytes,
+		"render_msec": _render_usec / 1000.0,
+		"active_loop": _active_loop_key,
+	}
+
+
+func _make_stream(data: PackedByteArray, loop: bool = false) -> AudioStreamWAV:
 	var wav := AudioStreamWAV.new()
 	wav.format = AudioStreamWAV.FORMAT_16_BITS
 	wav.mix_rate = int(SAMPLE_RATE)
 	wav.stereo = false
+	wav.data = data
+	if loop:
+		wav.loop_mode = AudioStreamWAV.LOOP_FORWARD
+		wav.loop_begin = 0
+		wav.loop_end = data.size() / 2  # In samples
+	return wav
+
+
+# ============================================================================
+# Synthesis (pure functions - safe to call from worker threads)
+# ============================================================================
+
+func _generate_drum(drum_type: int, rng: RandomNumberGenerator) -> PackedByteArray:
+	match drum_type:
+		1:  # Kick
+			return _generate_kick()
+		2:  # Snare
+			return _generate_snare(rng)
+		3:  # Hihat
+			return _generate_hihat(rng)
+	return PackedByteArray()
 
+
+func _generate_bass_note(freq: float, duration: float) -> PackedByteArray:
 	var samples := int(SAMPLE_RATE * duration)
 	var data := PackedByteArray()
 	data.resize(samples * 2)
@@ -287,16 +523,10 @@ func _generate_bass_note(freq: float, duration: float) -> AudioStreamWAV:
 		var sample_16: int = int(clampf(sample, -1.0, 1.0) * 32767)
 		data.encode_s16(i * 2, sample_16)
 
-	wav.data = data
-	return wav
+	return data
 
 
-func _generate_kick() -> AudioStreamWAV:
-	var wav := AudioStreamWAV.new()
-	wav.format = AudioStreamWAV.FORMAT_16_BITS
-	wav.mix_rate = int(SAMPLE_RATE)
-	wav.stereo = false
-
+func _generate_kick() -> PackedByteArray:
 	var duration: float = 0.15
 	var samples := int(SAMPLE_RATE * duration)
 	var data := PackedByteArray()
@@ -314,16 +544,10 @@ func _generate_kick() -> AudioStreamWAV:
 		var sample_16: int = int(clampf(sample, -1.0, 1.0) * 32767)
 		data.encode_s16(i * 2, sample_16)
 
-	wav.data = data
-	return wav
-
+	return data
 
-func _generate_snare() -> AudioStreamWAV:
-	var wav := AudioStreamWAV.new()
-	wav.format = AudioStreamWAV.FORMAT_16_BITS
-	wav.mix_rate = int(SAMPLE_RATE)
-	wav.stereo = false
 
+func _generate_snare(rng: RandomNumberGenerator) -> PackedByteArray:
 	var duration: float = 0.12
 	var samples := int(SAMPLE_RATE * duration)
 	var data := PackedByteArray()
@@ -334,23 +558,17 @@ func _generate_snare() -> AudioStreamWAV:
 		var envelope: float = pow(1.0 - progress, 1.5)
 
 		# Noise with some tonal component
-		var noise: float = (randf() * 2.0 - 1.0) * 0.6
+		var noise: float = (rng.randf() * 2.0 - 1.0) * 0.6
 		var tone: float = sin(float(i) / SAMPLE_RATE * 200.0 * TAU) * 0.3
 
 		var sample: float = (noise + tone) * envelope * 0.3
 		var sample_16: int = int(clampf(sample, -1.0, 1.0) * 32767)
 		data.encode_s16(i * 2, sample_16)
 
-	wav.data = data
-	return wav
+	return data
 
 
-func _generate_hihat() -> AudioStreamWAV:
-	var wav := AudioStreamWAV.new()
-	wav.format = AudioStreamWAV.FORMAT_16_BITS
-	wav.mix_rate = int(SAMPLE_RATE)
-	wav.stereo = false
-
+func _generate_hihat(rng: RandomNumberGenerator) -> PackedByteArray:
 	var duration: float = 0.05
 	var samples := int(SAMPLE_RATE * duration)
 	var data := PackedByteArray()
@@ -361,20 +579,14 @@ func _generate_hihat() -> AudioStreamWAV:
 		var envelope: float = pow(1.0 - progress, 3.0)
 
 		# High-frequency noise
-		var sample: float = (randf() * 2.0 - 1.0) * envelope * 0.15
+		var sample: float = (rng.randf() * 2.0 - 1.0) * envelope * 0.15
 		var sample_16: int = int(clampf(sample, -1.0, 1.0) * 32767)
 		data.encode_s16(i * 2, sample_16)
 
-	wav.data = data
-	return wav
-
+	return data
 
-func _generate_melody_note(freq: float, duration: float) -> AudioStreamWAV:
-	var wav := AudioStreamWAV.new()
-	wav.format = AudioStreamWAV.FORMAT_16_BITS
-	wav.mix_rate = int(SAMPLE_RATE)
-	wav.stereo = false
 
+func _generate_melody_note(freq: float, duration: float) -> PackedByteArray:
 	var samples := int(SAMPLE_RATE * duration)
 	var data := PackedByteArray()
 	data.resize(samples * 2)
@@ -397,5 +609,4 @@ func _generate_melody_note(freq: float, duration: float) -> AudioStreamWAV:
 		var sample_16: int = int(clampf(sample, -1.0, 1.0) * 32767)
 		data.encode_s16(i * 2, sample_16)
 
-	wav.data = data
-	return wav
+	return data
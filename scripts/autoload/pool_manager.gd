@@ -5,52 +5,63 @@ extends Node
 # Pool for balls
 var _ball_pool: Array[Node] = []
 var _ball_scene: PackedScene
-
-# Pool for damage numbers
-var _damage_pool: Array[Label] = []
-var _damage_scene: PackedScene
+var _ball_pool_hits: int = 0  # Per run (reset on game start)
+var _ball_pool_misses: int = 0  # Per run - should stay 0 once the pool is warm
+var _ball_pool_overflow: int = 0  # Per run - released balls freed because the pool was full
 
 # Pool for gems
 var _gem_pool: Array[Node] = []
 var _gem_scene: PackedScene
 
+# Pools for enemies, one per scene (keyed by scene resource path)
+var _enemy_pools: Dictionary = {}  # String -> Array[Node]
+var _enemy_pool_hits: int = 0
+var _enemy_pool_misses: int = 0
+
+# Collision shapes shared by radius - handed out, never resized in place
+var _circle_shapes: Dictionary = {}  # float (snapped radius) -> CircleShape2D
+
+# Pools for particle emitters, one per scene, with a global cap on live emitters
+var _particle_pools: Dictionary = {}  # String -> Array[GPUParticles2D]
+var _live_particles: Array = []  # Checked-out emitters (untyped: may be freed with their parent)
+var _particles_dropped: int = 0
+
 # Configuration
 const BALL_POOL_INITIAL_SIZE := 20
 const BALL_POOL_MAX_SIZE := 50
-const DAMAGE_POOL_INITIAL_SIZE := 30
-const DAMAGE_POOL_MAX_SIZE := 100
 const GEM_POOL_INITIAL_SIZE := 30
 const GEM_POOL_MAX_SIZE := 100
+const ENEMY_POOL_PREWARM_PER_SCENE := 6
+const ENEMY_POOL_MAX_PER_SCENE := 40
+const SHAPE_RADIUS_STEP := 0.5  # Radii are snapped to this before lookup
+const PARTICLE_POOL_MAX_PER_SCENE := 32
+const PARTICLE_LIVE_CAP := 96  # Emitters alive at once; extra requests are dropped
 
 
 func _ready() -> void:
 	# Preload scenes
 	_ball_scene = load("res://scenes/entities/ball.tscn")
-	_damage_scene = load("res://scenes/effects/damage_number.tscn")
 	_gem_scene = load("res://scenes/entities/gem.tscn")
 
 	# Pre-warm pools
 	_prewarm_ball_pool()
-	_prewarm_damage_pool()
 	_prewarm_gem_pool()
 
+	GameManager.game_started.connect(reset_run_stats)
+
+	# Enemy pools follow the current biome's roster
+	StageManager.biome_changed.connect(_on_biome_changed)
+	if StageManager.current_biome:
+		prewarm_enemies(StageManager.current_biome.enemy_scenes)
+
 
 func _prewarm_ball_pool() -> void:
 	for i in range(BALL_POOL_INITIAL_SIZE):
-		var ball := _ball_scene.instantiate()
-		ball.set_meta("pooled", true)
+		var ball := _new_ball()
 		_deactivate_ball(ball)
 		_ball_pool.append(ball)
 
 
-func _prewarm_damage_pool() -> void:
-	for i in range(DAMAGE_POOL_INITIAL_SIZE):
-		var label: Label = _damage_scene.instantiate()
-		label.set_meta("pooled", true)
-		_deactivate_damage(label)
-		_damage_pool.append(label)
-
-
 # ============================================================================
 # Ball Pool Methods
 # ============================================================================
@@ -60,10 +71,11 @@ func get_ball() -> Node:
 
 	if _ball_pool.size() > 0:
 		ball = _ball_pool.pop_back()
+		_ball_pool_hits += 1
 	else:
 		# Pool exhausted, create new instance
-		ball = _ball_scene.instantiate()
-		ball.set_meta("pooled", true)
+		ball = _new_ball()
+		_ball_pool_misses += 1
 
 	_activate_ball(ball)
 	return ball
@@ -80,6 +92,7 @@ func release_ball(ball: Node) -> void:
 
 	# Enforce max pool size
 	if _ball_pool.size() >= BALL_POOL_MAX_SIZE:
+		_ball_pool_overflow += 1
 		ball.queue_free()
 		return
 
@@ -87,6 +100,14 @@ func release_ball(ball: Node) -> void:
 	_ball_pool.append(ball)
 
 
+func _new_ball() -> Node:
+	var ball := _ball_scene.instantiate()
+	ball.set_meta("pooled", true)
+	# Own a cached shape instead of the scene's shared sub-resource
+	ball.set_collision_radius(ball.radius)
+	return ball
+
+
 func _activate_ball(ball: Node) -> void:
 	ball.set_physics_process(true)
 	ball.set_process(true)
@@ -104,58 +125,6 @@ func _deactivate_ball(ball: Node) -> void:
 		ball.get_parent().remove_child(ball)
 
 
-# ============================================================================
-# Damage Number Pool Methods
-# ============================================================================
-
-func get_damage_number() -> Label:
-	var label: Label
-
-	if _damage_pool.size() > 0:
-		label = _damage_pool.pop_back()
-	else:
-		# Pool exhausted, create new instance
-		label = _damage_scene.instantiate()
-		label.set_meta("pooled", true)
-
-	_activate_damage(label)
-	return label
-
-
-func release_damage_number(label: Label) -> void:
-	if not is_instance_valid(label):
-		return
-
-	# Don't pool non-pooled labels
-	if not label.has_meta("pooled"):
-		label.queue_free()
-		return
-
-	# Enforce max pool size
-	if _damage_pool.size() >= DAMAGE_POOL_MAX_SIZE:
-		label.queue_free()
-		return
-
-	_deactivate_damage(label)
-	_damage_pool.append(label)
-
-
-func _activate_damage(label: Label) -> void:
-	label.visible = true
-	label.modulate.a = 1.0
-	label.scale = Vector2.ONE
-
-
-func _deactivate_damage(label: Label) -> void:
-	label.visible = false
-
-	# Tween cleanup is handled by the label's reset() method
-
-	# Remove from parent if attached
-	if label.get_parent():
-		label.get_parent().remove_child(label)
-
-
 # ============================================================================
 # Gem Pool Methods
 # ============================================================================
@@ -214,13 +183,218 @@ func _deactivate_gem(gem: Node) -> void:
 		gem.get_parent().remove_child(gem)
 
 
+# ============================================================================
+# Enemy Pool Methods
+# ============================================================================
+
+func _on_biome_changed(biome: Biome) -> void:
+	prewarm_enemies(biome.enemy_scenes)
+
+
+func prewarm_enemies(scenes: Array[PackedScene], count: int = ENEMY_POOL_PREWARM_PER_SCENE) -> void:
+	## Top up each scene's pool to count idle enemies
+	for scene in scenes:
+		if not scene:
+			continue
+		var pool := _get_enemy_pool(scene.resource_path)
+		while pool.size() < count:
+			var enemy := _instantiate_enemy(scene)
+			_deactivate_enemy(enemy)
+			pool.append(enemy)
+
+
+func get_enemy(scene: PackedScene) -> Node:
+	## Pooled enemy instance of scene; position it, then add it to the tree
+	var pool := _get_enemy_pool(scene.resource_path)
+	var enemy: Node
+
+	if pool.size() > 0:
+		enemy = pool.pop_back()
+		_enemy_pool_hits += 1
+	else:
+		# Pool exhausted, create new instance
+		enemy = _instantiate_enemy(scene)
+		_enemy_pool_misses += 1
+
+	_activate_enemy(enemy)
+	return enemy
+
+
+func release_enemy(enemy: Node) -> void:
+	if not is_instance_valid(enemy):
+		return
+
+	# Don't pool non-pooled enemies (bosses, test spawns)
+	if not enemy.has_meta("pooled"):
+		enemy.queue_free()
+		return
+
+	# Enforce max pool size
+	var pool := _get_enemy_pool(enemy.scene_file_path)
+	if pool.size() >= ENEMY_POOL_MAX_PER_SCENE:
+		enemy.queue_free()
+		return
+
+	enemy.reset()
+	_deactivate_enemy(enemy)
+	pool.append(enemy)
+
+
+func _get_enemy_pool(scene_path: String) -> Array:
+	if not _enemy_pools.has(scene_path):
+		var pool: Array[Node] = []
+		_enemy_pools[scene_path] = pool
+	return _enemy_pools[scene_path]
+
+
+func _instantiate_enemy(scene: PackedScene) -> Node:
+	var enemy := scene.instantiate()
+	enemy.set_meta("pooled", true)
+	return enemy
+
+
+func _activate_enemy(enemy: Node) -> void:
+	enemy.set_physics_process(true)
+	enemy.set_process(true)
+	enemy.visible = true
+	# _ready re-runs on add_child and applies wave scaling
+
+
+func _deactivate_enemy(enemy: Node) -> void:
+	enemy.set_physics_process(false)
+	enemy.set_process(false)
+	enemy.visible = false
+
+	# Remove from parent if attached
+	if enemy.get_parent():
+		enemy.get_parent().remove_child(enemy)
+
+
+# ============================================================================
+# Particle Pool Methods
+# ============================================================================
+
+func get_particles(scene: PackedScene) -> GPUParticles2D:
+	## Pooled emitter of scene, or null when PARTICLE_LIVE_CAP emitters are live
+	if _live_particles.size() >= PARTICLE_LIVE_CAP:
+		_prune_live_particles()
+		if _live_particles.size() >= PARTICLE_LIVE_CAP:
+			_particles_dropped += 1
+			return null
+
+	var pool := _get_particle_pool(scene.resource_path)
+	var particles: GPUParticles2D
+	if pool.size() > 0:
+		particles = pool.pop_back()
+	else:
+		# Pool exhausted, create new instance
+		particles = scene.instantiate()
+		particles.set_meta("pooled", true)
+
+	particles.visible = true
+	_live_particles.append(particles)
+	return particles
+
+
+func spawn_one_shot_particles(scene: PackedScene, parent: Node, pos: Vector2) -> GPUParticles2D:
+	## Play a one-shot emitter at pos; it returns to the pool on finished
+	var particles := get_particles(scene)
+	if not particles:
+		return null
+	if not particles.has_meta("one_shot_connected"):
+		particles.set_meta("one_shot_connected", true)
+		particles.finished.connect(release_particles.bind(particles))
+	particles.one_shot = true
+	particles.position = pos
+	parent.add_child(particles)
+	particles.restart()
+	return particles
+
+
+func release_particles(particles) -> void:  # Untyped: may already be freed
+	if not is_instance_valid(particles):
+		return
+	_live_particles.erase(particles)
+
+	# Don't pool non-pooled emitters
+	if not particles.has_meta("pooled"):
+		particles.queue_free()
+		return
+
+	# Enforce max pool size
+	var pool := _get_particle_pool(particles.scene_file_path)
+	if pool.size() >= PARTICLE_POOL_MAX_PER_SCENE:
+		particles.queue_free()
+		return
+
+	particles.emitting = false
+	particles.visible = false
+	if particles.get_parent():
+		particles.get_parent().remove_child(particles)
+	pool.append(particles)
+
+
+func _get_particle_pool(scene_path: String) -> Array:
+	if not _particle_pools.has(scene_path):
+		var pool: Array[GPUParticles2D] = []
+		_particle_pools[scene_path] = pool
+	return _particle_pools[scene_path]
+
+
+func _prune_live_particles() -> void:
+	# Emitters freed along with their parent (scene change, non-pooled enemies)
+	# never come back through release_particles
+	var live: Array = []
+	for particles in _live_particles:
+		if is_instance_valid(particles):
+			live.append(particles)
+	_live_particles = live
+
+
+# ============================================================================
+# Collision Shape Cache
+# ============================================================================
+
+func get_circle_shape(radius: float) -> CircleShape2D:
+	## Shared CircleShape2D for radius. Callers must not modify it.
+	var key := snappedf(radius, SHAPE_RADIUS_STEP)
+	if not _circle_shapes.has(key):
+		var shape := CircleShape2D.new()
+		shape.radius = key
+		_circle_shapes[key] = shape
+	return _circle_shapes[key]
+
+
 # ============================================================================
 # Debug / Stats
 # ============================================================================
 
+func reset_run_stats() -> void:
+	_ball_pool_hits = 0
+	_ball_pool_misses = 0
+	_ball_pool_overflow = 0
+
+
 func get_pool_stats() -> Dictionary:
+	var enemies_available := 0
+	for pool in _enemy_pools.values():
+		enemies_available += pool.size()
+	var particles_available := 0
+	for pool in _particle_pools.values():
+		particles_available += pool.size()
+	_prune_live_particles()
 	return {
 		"ball_pool_available": _ball_pool.size(),
-		"damage_pool_available": _damage_pool.size(),
+		"ball_pool_hits": _ball_pool_hits,
+		"ball_pool_misses": _ball_pool_misses,
+		"ball_pool_overflow": _ball_pool_overflow,
 		"gem_pool_available": _gem_pool.size(),
+		"enemy_pool_available": enemies_available,
+		"enemy_pool_scenes": _enemy_pools.size(),
+		"enemy_pool_hits": _enemy_pool_hits,
+		"enemy_pool_misses": _enemy_pool_misses,
+		"circle_shapes": _circle_shapes.size(),
+		"particle_pool_available": particles_available,
+		"particles_live": _live_particles.size(),
+		"particles_dropped": _particles_dropped,
 	}
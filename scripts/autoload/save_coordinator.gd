@@ -0,0 +1,231 @@
+extends Node
+## SaveCoordinator autoload - write-behind persistence for every save file
+## Subsystems register a key with a target path and a serializer, then call
+## mark_dirty(key) whenever their data changes. Marks within DEBOUNCE_MSEC of
+## the first one coalesce into a single write: the serializer runs once on the
+## main thread (so it sees consistent data) and the file is written on the
+## WorkerThreadPool to a temp file that is then renamed over the target, so a
+## crash mid-write never leaves a truncated save. Keys with an encoder split
+## this in two: the serializer only takes a snapshot and the encoder turns it
+## into bytes on the worker.
+## Pending writes are flushed synchronously on focus loss, pause, quit, and
+## before anything reads or deletes a registered path (flush_path/discard_path).
+## Registered before every other autoload so their _ready can register.
+
+signal write_completed(key: StringName, ok: bool)  # ok = false if the file was not replaced
+
+const DEBOUNCE_MSEC: int = 750
+const TEMP_SUFFIX := ".tmp"
+
+var _paths: Dictionary = {}  # key -> target path
+var _serializers: Dictionary = {}  # key -> Callable() -> PackedByteArray (or snapshot)
+var _encoders: Dictionary = {}  # key -> Callable(snapshot) -> PackedByteArray, run on the worker
+var _key_by_path: Dictionary = {}  # target path -> key
+var _dirty_since: Dictionary = {}  # key -> ticks_msec of the first unwritten mark
+var _tasks: Dictionary = {}  # key -> WorkerThreadPool task id of its in-flight write
+var _interrupts: Dictionary = {}  # key -> fraction of the temp file its next write stops at (debug)
+
+# Stats (_failed_total and _write_ok are also written from worker threads)
+var _marks_total: int = 0
+var _writes_total: int = 0
+var _writes_by_key: Dictionary = {}  # key -> writes (background and sync)
+var _sync_writes_total: int = 0
+var _flushes_total: int = 0
+var _failed_total: int = 0
+var _write_ok: Dictionary = {}  # key -> result of its last write, until write_completed
+var _failed_mutex := Mutex.new()
+
+
+func _ready() -> void:
+	process_mode = Node.PROCESS_MODE_ALWAYS  # Settings change in paused menus too
+	set_process(false)
+
+
+func _process(_delta: float) -> void:
+	_reap_tasks()
+	var now := Time.get_ticks_msec()
+	for key in _dirty_since.keys():
+		# One write per key at a time keeps writes to a file in order
+		if now - _dirty_since[key] >= DEBOUNCE_MSEC and not _tasks.has(key):
+			_dispatch(key)
+	if _dirty_since.is_empty() and _tasks.is_empty():
+		set_process(false)
+
+
+func _notification(what: int) -> void:
+	match what:
+		NOTIFICATION_APPLICATION_FOCUS_OUT, NOTIFICATION_APPLICATION_PAUSED, NOTIFICATION_WM_CLOSE_REQUEST:
+			flush()
+
+
+func _exit_tree() -> void:
+	flush()
+
+
+# ============================================================================
+# Subsystem API
+# ============================================================================
+
+func register(key: StringName, path: String, serializer: Callable, encoder: Callable = Callable()) -> void:
+	## serializer() is called on the main thread when the key is written. It
+	## returns the file's PackedByteArray, or with an encoder a snapshot that
+	## encoder(snapshot) -> PackedByteArray turns into bytes off the main thread.
+	## An encoder may keep state between calls: it never runs twice at once.
+	_paths[key] = path
+	_serializers[key] = serializer
+	_key_by_path[path] = key
+	if encoder.is_valid():
+		_encoders[key] = encoder
+
+
+func set_path(key: StringName, path: String) -> void:
+	## Retarget a key (e.g. save slot switch); pending data goes to the old path first
+	flush(key)
+	_key_by_path.erase(_paths[key])
+	_paths[key] = path
+	_key_by_path[path] = key
+
+
+func mark_dirty(key: StringName) -> void:
+	## Schedule a write of this key (coalesced with other marks in the window)
+	_marks_total += 1
+	if not _dirty_since.has(key):
+		_dirty_since[key] = Time.get_ticks_msec()
+		set_process(true)
+
+
+func is_dirty(key: StringName) -> bool:
+	return _dirty_since.has(key)
+
+
+func flush(key: StringName = &"") -> void:
+	## Write pending data now, on the calling thread (all keys, or one key)
+	_flushes_total += 1
+	var keys: Array = [key] if key != &"" else _paths.keys()
+	for k in keys:
+		_wait_for_task(k)
+		if _dirty_since.has(k):
+			_dirty_since.erase(k)
+			_sync_writes_total += 1
+			_writes_by_key[k] = _writes_by_key.get(k, 0) + 1
+			_encode_and_write(k, _paths[k], _serializers[k].call(), _encoders.get(k, Callable()), _take_interrupt(k))
+			_emit_completed(k)
+
+
+func flush_path(path: String) -> void:
+	## Call before reading a file that may have a pending write
+	var key: StringName = _key_by_path.get(path, &"")
+	if key != &"" and (_dirty_since.has(key) or _tasks.has(key)):
+		flush(key)
+
+
+func discard_path(path: String) -> void:
+	## Call before deleting a file: drops its pending write and waits out any in flight
+	var key: StringName = _key_by_path.get(path, &"")
+	if key == &"":
+		return
+	_dirty_since.erase(key)
+	_wait_for_task(key)
+
+
+# ============================================================================
+# Internals
+# ============================================================================
+
+func _dispatch(key: StringName) -> void:
+	_dirty_since.erase(key)
+	var data = _serializers[key].call()
+	var task := _encode_and_write.bind(key, _paths[key], data, _encoders.get(key, Callable()), _take_interrupt(key))
+	_tasks[key] = WorkerThreadPool.add_task(task, false, "Save %s" % key)
+	_writes_total += 1
+	_writes_by_key[key] = _writes_by_key.get(key, 0) + 1
+
+
+func _reap_tasks() -> void:
+	for key in _tasks.keys():
+		if WorkerThreadPool.is_task_completed(_tasks[key]):
+			WorkerThreadPool.wait_for_task_completion(_tasks[key])
+			_tasks.erase(key)
+			_emit_completed(key)
+
+
+func _wait_for_task(key: StringName) -> void:
+	if _tasks.has(key):
+		WorkerThreadPool.wait_for_task_completion(_tasks[key])
+		_tasks.erase(key)
+		_emit_completed(key)
+
+
+func _take_interrupt(key: StringName) -> float:
+	var interrupt_at: float = _interrupts.get(key, -1.0)
+	_interrupts.erase(key)
+	return interrupt_at
+
+
+func _encode_and_write(key: StringName, path: String, data, encoder: Callable, interrupt_at: float = -1.0) -> void:
+	# Encoders run here, off the main thread, on the snapshot the serializer took
+	var ok := _write_atomic(path, encoder.call(data) if encoder.is_valid() else data, interrupt_at)
+	_failed_mutex.lock()
+	_write_ok[key] = ok
+	if not ok:
+		_failed_total += 1
+	_failed_mutex.unlock()
+
+
+func _write_atomic(path: String, bytes: PackedByteArray, interrupt_at: float = -1.0) -> bool:
+	# Runs on worker threads: touches only its arguments
+	var temp_path := path + TEMP_SUFFIX
+	var file := FileAccess.open(temp_path, FileAccess.WRITE)
+	if not file:
+		return false
+	if interrupt_at >= 0.0:
+		# interrupt_next_write: stop as if the game died here, before the rename
+		file.store_buffer(bytes.slice(0, int(bytes.size() * interrupt_at)))
+		file.close()
+		return false
+	file.store_buffer(bytes)
+	var error := file.get_error()
+	file.close()
+	return error == OK and DirAccess.rename_absolute(temp_path, path) == OK
+
+
+func _emit_completed(key: StringName) -> void:
+	_failed_mutex.lock()
+	var ok: bool = _write_ok.get(key, false)
+	_write_ok.erase(key)
+	_failed_mutex.unlock()
+	write_completed.emit(key, ok)
+
+
+# ============================================================================
+# Debug / Stats
+# ============================================================================
+
+func interrupt_next_write(key: StringName, fraction: float = 1.0) -> void:
+	## Crash test (debug builds only): the key's next write stops after storing
+	## this fraction of its temp file and never renames it, as if the game died
+	## mid-save (1.0 = between the temp write and the rename)
+	if OS.is_debug_build():
+		_interrupts[key] = clampf(fraction, 0.0, 1.0)
+
+
+func has_leftover_temp(key: StringName) -> bool:
+	## True if an interrupted write left the key's temp file behind
+	return FileAccess.file_exists(_paths[key] + TEMP_SUFFIX)
+
+
+func get_stats() -> Dictionary:
+	_failed_mutex.lock()
+	var failed := _failed_total
+	_failed_mutex.unlock()
+	return {
+		"registered": _paths.size(),
+		"dirty": _dirty_since.size(),
+		"in_flight": _tasks.size(),
+		"marks_total": _marks_total,
+		"writes_total": _writes_total,
+		"sync_writes_total": _sync_writes_total,
+		"writes_by_key": _writes_by_key.duplicate(),
+		"flushes_total": _flushes_total,
+		"failed_total": failed,
+	}
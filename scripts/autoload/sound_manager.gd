@@ -7,8 +7,23 @@ signal aim_sensitivity_changed(value: float)
 
 var _players: Array[AudioStreamPlayer] = []
 const MAX_PLAYERS := 8
+
+# Voice bookkeeping, indexed like _players
+var _voice_types := PackedInt32Array()  # SoundType currently assigned to each player (-1 = none)
+var _voice_priorities := PackedInt32Array()
+var _voice_started := PackedInt64Array()  # Time.get_ticks_usec() when the voice started
+var _requested_this_frame: Dictionary = {}  # SoundType -> true, cleared every process frame
+var _request_frame: int = -1
+var _voice_stats := {
+	"played": 0,
+	"merged": 0,  # Same SoundType requested again in the same frame
+	"dropped": 0,  # Over max_voices, or all voices busy with higher priority sounds
+	"stolen": 0,  # Played by cutting off a lower-priority or older voice
+}
 const SAMPLE_RATE := 44100.0
 const SETTINGS_PATH := "user://audio_settings.save"
+const SETTINGS_SAVE_KEY := &"audio_settings"
+var _loading_settings: bool = false  # Set while _load_settings applies values through the setters
 
 # Audio settings
 var master_volume: float = 1.0:
@@ -82,18 +97,25 @@ enum SoundType {
 	UNPAUSE          # Unpause/resume game
 }
 
-# Per-sound pitch/volume variance settings
+# Voice priorities: higher priority sounds may steal voices from lower ones
+const PRIORITY_SPAM := 0  # Per-collision sounds that fire many times a second
+const PRIORITY_NORMAL := 1
+const PRIORITY_FEEDBACK := 2
+const PRIORITY_CRITICAL := 3  # Must never be cut off (level up, game over, ...)
+const DEFAULT_MAX_VOICES := 2  # Concurrent voices per SoundType unless overridden
+
+# Per-sound pitch/volume variance, voice priority and max concurrent voices
 const SOUND_SETTINGS := {
-	SoundType.FIRE: {"pitch_var": 0.15, "vol_var": 0.1},
-	SoundType.HIT_WALL: {"pitch_var": 0.2, "vol_var": 0.15},
-	SoundType.HIT_ENEMY: {"pitch_var": 0.1, "vol_var": 0.1},
-	SoundType.ENEMY_DEATH: {"pitch_var": 0.05, "vol_var": 0.05},
-	SoundType.GEM_COLLECT: {"pitch_var": 0.2, "vol_var": 0.1},
-	SoundType.PLAYER_DAMAGE: {"pitch_var": 0.05, "vol_var": 0.0},
-	SoundType.LEVEL_UP: {"pitch_var": 0.0, "vol_var": 0.0},
-	SoundType.GAME_OVER: {"pitch_var": 0.0, "vol_var": 0.0},
-	SoundType.WAVE_COMPLETE: {"pitch_var": 0.0, "vol_var": 0.0},
-	SoundType.BLOCKED: {"pitch_var": 0.1, "vol_var": 0.0},
+	SoundType.FIRE: {"pitch_var": 0.15, "vol_var": 0.1, "max_voices": 3},
+	SoundType.HIT_WALL: {"pitch_var": 0.2, "vol_var": 0.15, "priority": PRIORITY_SPAM},
+	SoundType.HIT_ENEMY: {"pitch_var": 0.1, "vol_var": 0.1, "priority": PRIORITY_SPAM, "max_voices": 3},
+	SoundType.ENEMY_DEATH: {"pitch_var": 0.05, "vol_var": 0.05, "max_voices": 3},
+	SoundType.GEM_COLLECT: {"pitch_var": 0.2, "vol_var": 0.1, "priority": PRIORITY_SPAM},
+	SoundType.PLAYER_DAMAGE: {"pitch_var": 0.05, "vol_var": 0.0, "priority": PRIORITY_FEEDBACK, "max_voices": 1},
+	SoundType.LEVEL_UP: {"pitch_var": 0.0, "vol_var": 0.0, "priority": PRIORITY_CRITICAL, "max_voices": 1},
+	SoundType.GAME_OVER: {"pitch_var": 0.0, "vol_var": 0.0, "priority": PRIORITY_CRITICAL, "max_voices": 1},
+	SoundType.WAVE_COMPLETE: {"pitch_var": 0.0, "vol_var": 0.0, "priority": PRIORITY_CRITICAL, "max_voices": 1},
+	SoundType.BLOCKED: {"pitch_var": 0.1, "vol_var": 0.0, "priority": PRIORITY_SPAM},
 	# Ball type sounds
 	SoundType.FIRE_BALL: {"pitch_var": 0.1, "vol_var": 0.1},
 	SoundType.ICE_BALL: {"pitch_var": 0.15, "vol_var": 0.1},
@@ -107,21 +129,57 @@ const SOUND_SETTINGS := {
 	SoundType.POISON_APPLY: {"pitch_var": 0.1, "vol_var": 0.1},
 	SoundType.BLEED_APPLY: {"pitch_var": 0.1, "vol_var": 0.1},
 	# Fusion sounds
-	SoundType.FUSION_REACTOR: {"pitch_var": 0.05, "vol_var": 0.05},
-	SoundType.EVOLUTION: {"pitch_var": 0.0, "vol_var": 0.0},
-	SoundType.FISSION: {"pitch_var": 0.1, "vol_var": 0.1},
+	SoundType.FUSION_REACTOR: {"pitch_var": 0.05, "vol_var": 0.05, "priority": PRIORITY_FEEDBACK},
+	SoundType.EVOLUTION: {"pitch_var": 0.0, "vol_var": 0.0, "priority": PRIORITY_CRITICAL, "max_voices": 1},
+	SoundType.FISSION: {"pitch_var": 0.1, "vol_var": 0.1, "priority": PRIORITY_FEEDBACK},
 	# Combat feedback
-	SoundType.WEAK_POINT_HIT: {"pitch_var": 0.1, "vol_var": 0.05}
+	SoundType.WEAK_POINT_HIT: {"pitch_var": 0.1, "vol_var": 0.05, "priority": PRIORITY_FEEDBACK},
+	# UI sounds
+	SoundType.BUTTON_CLICK: {"priority": PRIORITY_FEEDBACK},
+	SoundType.PAUSE: {"priority": PRIORITY_CRITICAL, "max_voices": 1},
+	SoundType.UNPAUSE: {"priority": PRIORITY_CRITICAL, "max_voices": 1},
+}
+
+# Sound bank: every SoundType is synthesized once and cached as AudioStreamWAV.
+# Sounds built from noise get a few takes so repeats don't sound identical.
+const SOUND_BANK_PATH := "user://sound_bank.cache"
+const SOUND_BANK_VERSION := 1  # Bump when any _generate_* function changes
+const NOISE_VARIANTS := 3
+const NOISY_SOUNDS: Array[int] = [
+	SoundType.PLAYER_DAMAGE,
+	SoundType.FIRE_BALL,
+	SoundType.LIGHTNING_BALL,
+	SoundType.BLEED_BALL,
+	SoundType.BURN_APPLY,
+	SoundType.FREEZE_APPLY,
+	SoundType.POISON_APPLY,
+	SoundType.BLEED_APPLY,
+	SoundType.FISSION,
+]
+var persist_sound_bank: bool = true  # Save synthesized samples to user:// for faster launches
+var _sound_bank: Dictionary = {}  # SoundType -> Array[AudioStreamWAV]
+var _sound_bank_stats := {
+	"sounds": 0,
+	"variants": 0,
+	"bytes": 0,
+	"build_msec": 0.0,
+	"from_cache": false,
 }
 
 
 func _ready() -> void:
+	SaveCoordinator.register(SETTINGS_SAVE_KEY, SETTINGS_PATH, _serialize_settings)
 	_load_settings()
+	_build_sound_bank()
 	for i in MAX_PLAYERS:
 		var player := AudioStreamPlayer.new()
 		player.bus = "SFX"  # Use SFX bus for sound effects
 		add_child(player)
 		_players.append(player)
+	_voice_types.resize(MAX_PLAYERS)
+	_voice_types.fill(-1)
+	_voice_priorities.resize(MAX_PLAYERS)
+	_voice_started.resize(MAX_PLAYERS)
 
 
 func _apply_bus_volume(bus_idx: int, volume: float) -> void:
@@ -180,6 +238,12 @@ func play_status_effect_sound(effect_type: int) -> void:
 
 
 func _save_settings() -> void:
+	# Slider drags mark every tick; SaveCoordinator writes once they settle
+	if not _loading_settings:
+		SaveCoordinator.mark_dirty(SETTINGS_SAVE_KEY)
+
+
+func _serialize_settings() -> PackedByteArray:
 	var data := {
 		"muted": is_muted,
 		"master": master_volume,
@@ -187,9 +251,7 @@ func _save_settings() -> void:
 		"music": music_volume,
 		"aim_sensitivity": aim_sensitivity
 	}
-	var file := FileAccess.open(SETTINGS_PATH, FileAccess.WRITE)
-	if file:
-		file.store_string(JSON.stringify(data))
+	return JSON.stringify(data).to_utf8_buffer()
 
 
 func _load_settings() -> void:
@@ -204,7 +266,8 @@ func _load_settings() -> void:
 	if not data:
 		return
 
-	# Load and apply settings without triggering save (use backing fields)
+	# Setters apply the values; don't write back what we just read
+	_loading_settings = true
 	if data.has("muted"):
 		is_muted = data["muted"]
 	if data.has("master"):
@@ -215,6 +278,7 @@ func _load_settings() -> void:
 		music_volume = data["music"]
 	if data.has("aim_sensitivity"):
 		aim_sensitivity = data["aim_sensitivity"]
+	_loading_settings = false
 
 	# Apply loaded settings to audio buses
 	AudioServer.set_bus_mute(0, is_muted)
@@ -230,14 +294,35 @@ func _load_settings() -> void:
 
 
 func play(sound_type: SoundType) -> void:
-	var player := _get_available_player()
-	if not player:
+	if _players.is_empty():
 		return
 
-	player.stream = _generate_sound(sound_type)
+	# Coalesce identical requests within one frame (e.g. 30 balls hitting walls)
+	var frame := Engine.get_process_frames()
+	if frame != _request_frame:
+		_request_frame = frame
+		_requested_this_frame.clear()
+	if _requested_this_frame.has(sound_type):
+		_voice_stats["merged"] += 1
+		return
+	_requested_this_frame[sound_type] = true
 
-	# Apply pitch and volume variance
 	var settings: Dictionary = SOUND_SETTINGS.get(sound_type, {})
+	var priority: int = settings.get("priority", PRIORITY_NORMAL)
+	var max_voices: int = settings.get("max_voices", DEFAULT_MAX_VOICES)
+	if _count_voices(sound_type) >= max_voices:
+		_voice_stats["dropped"] += 1
+		return
+
+	var voice := _get_voice(priority)
+	if voice < 0:
+		_voice_stats["dropped"] += 1
+		return
+
+	var player := _players[voice]
+	player.stream = _get_bank_stream(sound_type)
+
+	# Apply pitch and volume variance
 	var pitch_var: float = settings.get("pitch_var", 0.1)
 	var vol_var: float = settings.get("vol_var", 0.1)
 
@@ -245,21 +330,157 @@ func play(sound_type: SoundType) -> void:
 	player.volume_db = randf_range(-vol_var * 6.0, vol_var * 6.0)
 
 	player.play()
+	_voice_types[voice] = sound_type
+	_voice_priorities[voice] = priority
+	_voice_started[voice] = Time.get_ticks_usec()
+	_voice_stats["played"] += 1
+
+
+func _count_voices(sound_type: SoundType) -> int:
+	var count := 0
+	for i in _players.size():
+		if _players[i].playing and _voice_types[i] == sound_type:
+			count += 1
+	return count
+
+
+func _get_voice(priority: int) -> int:
+	## Free voice if any, otherwise steal the lowest-priority (then oldest) voice.
+	## Returns -1 when every voice is busy with a higher priority sound.
+	var steal := -1
+	for i in _players.size():
+		if not _players[i].playing:
+			return i
+		if _voice_priorities[i] > priority:
+			continue
+		if steal < 0 or _voice_priorities[i] < _voice_priorities[steal] \
+				or (_voice_priorities[i] == _voice_priorities[steal] and _voice_started[i] < _voice_started[steal]):
+			steal = i
+	if steal >= 0:
+		_players[steal].stop()
+		_voice_stats["stolen"] += 1
+	return steal
+
+
+func get_voice_stats() -> Dictionary:
+	## Counters for played, merged (same-frame duplicate), dropped and stolen plays
+	return _voice_stats.duplicate()
 
 
-func _get_available_player() -> AudioStreamPlayer:
-	for player in _players:
-		if not player.playing:
-			return player
-	return _players[0]  # Fallback to first player
+func reset_voice_stats() -> void:
+	for key in _voice_stats:
+		_voice_stats[key] = 0
 
 
-func _generate_sound(sound_type: SoundType) -> AudioStreamWAV:
+# ============================================================================
+# Sound Bank
+# ============================================================================
+
+func _build_sound_bank() -> void:
+	var start := Time.get_ticks_usec()
+	_sound_bank.clear()
+
+	var cached := _load_sound_bank_cache() if persist_sound_bank else {}
+	var from_cache := not cached.is_empty()
+	var variants := 0
+	var total_bytes := 0
+
+	for sound_type in SoundType.values():
+		var takes: Array = cached.get(sound_type, [])
+		if takes.is_empty():
+			var take_count := NOISE_VARIANTS if sound_type in NOISY_SOUNDS else 1
+			for i in take_count:
+				takes.append(_synthesize(sound_type))
+
+		var streams: Array[AudioStreamWAV] = []
+		for data in takes:
+			streams.append(_make_stream(data))
+			total_bytes += data.size()
+		_sound_bank[sound_type] = streams
+		variants += streams.size()
+
+	if persist_sound_bank and not from_cache:
+		_save_sound_bank_cache()
+
+	_sound_bank_stats = {
+		"sounds": _sound_bank.size(),
+		"variants": variants,
+		"bytes": total_bytes,
+		"build_msec": (Time.get_ticks_usec() - start) / 1000.0,
+		"from_cache": from_cache,
+	}
+
+
+func _get_bank_stream(sound_type: SoundType) -> AudioStreamWAV:
+	var streams: Array = _sound_bank.get(sound_type, [])
+	if streams.is_empty():
+		# Not banked yet (e.g. played before _ready) - synthesize and keep it
+		streams = [_make_stream(_synthesize(sound_type))]
+		_sound_bank[sound_type] = streams
+	return streams[randi() % streams.size()]
+
+
+func _load_sound_bank_cache() -> Dictionary:
+	## Returns SoundType -> Array[PackedByteArray], or {} if missing or stale
+	if not FileAccess.file_exists(SOUND_BANK_PATH):
+		return {}
+
+	var file := FileAccess.open(SOUND_BANK_PATH, FileAccess.READ)
+	if not file:
+		return {}
+
+	var data = file.get_var()
+	if not data is Dictionary:
+		return {}
+	if data.get("version", -1) != SOUND_BANK_VERSION or data.get("mix_rate", 0) != int(SAMPLE_RATE):
+		return {}
+
+	var sounds: Dictionary = data.get("sounds", {})
+	for sound_type in SoundType.values():
+		var takes = sounds.get(sound_type)
+		if not takes is Array or takes.is_empty():
+			return {}
+	return sounds
+
+
+func _save_sound_bank_cache() -> void:
+	var sounds := {}
+	for sound_type in _sound_bank:
+		var takes: Array = []
+		for stream in _sound_bank[sound_type]:
+			takes.append(stream.data)
+		sounds[sound_type] = takes
+
+	var file := FileAccess.open(SOUND_BANK_PATH, FileAccess.WRITE)
+	if file:
+		file.store_var({
+			"version": SOUND_BANK_VERSION,
+			"mix_rate": int(SAMPLE_RATE),
+			"sounds": sounds,
+		})
+
+
+func get_sound_bank_stats() -> Dictionary:
+	## Build time (ms), sample memory (bytes) and variant counts for the bank
+	return _sound_bank_stats.duplicate()
+
+
+func clear_sound_bank_cache() -> void:
+	## Delete the persisted bank so the next launch re-synthesizes
+	if FileAccess.file_exists(SOUND_BANK_PATH):
+		DirAccess.remove_absolute(SOUND_BANK_PATH)
+
+
+func _make_stream(data: PackedByteArray) -> AudioStreamWAV:
 	var wav := AudioStreamWAV.new()
 	wav.format = AudioStreamWAV.FORMAT_16_BITS
 	wav.mix_rate = int(SAMPLE_RATE)
 	wav.stereo = false
+	wav.data = data
+	return wav
+
 
+func _synthesize(sound_type: SoundType) -> PackedByteArray:
 	var data: PackedByteArray
 
 	match sound_type:
@@ -323,8 +544,7 @@ func _generate_sound(sound_type: SoundType) -> AudioStreamWAV:
 		SoundType.UNPAUSE:
 			data = _generate_sweep(0.12, 300.0, 500.0)  # Ascending tone
 
-	wav.data = data
-	return wav
+	return data
 
 
 func _generate_blip(duration: float, freq_start: float, freq_end: float) -> PackedByteArray:
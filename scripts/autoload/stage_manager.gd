@@ -6,13 +6,25 @@ signal boss_wave_reached(stage: int)
 signal mini_boss_wave_reached(stage: int, mini_boss_index: int)
 signal stage_completed(stage: int)
 signal game_won
+signal progress_changed(stage: int, wave_in_stage: int)
 
 # Mini-boss waves within each stage (waves 4 and 7 of 10)
 const MINI_BOSS_WAVES: Array[int] = [4, 7]
 
 var stages: Array[Biome] = []
-var current_stage: int = 0
-var wave_in_stage: int = 1
+var current_stage: int = 0:
+	set(value):
+		if current_stage != value:
+			current_stage = value
+			if not _setting_progress:
+				progress_changed.emit(current_stage, wave_in_stage)
+var wave_in_stage: int = 1:
+	set(value):
+		if wave_in_stage != value:
+			wave_in_stage = value
+			if not _setting_progress:
+				progress_changed.emit(current_stage, wave_in_stage)
+var _setting_progress: bool = false  # set_progress emits once for both fields
 
 var current_biome: Biome:
 	get:
@@ -41,8 +53,7 @@ func _load_stages() -> void:
 
 
 func _on_game_started() -> void:
-	current_stage = 0
-	wave_in_stage = 1
+	set_progress(0, 1)
 	_apply_biome()
 
 
@@ -64,8 +75,7 @@ func _on_wave_changed(global_wave: int) -> void:
 func complete_stage() -> void:
 	## Call this when boss is defeated (or stage marker reached for now)
 	stage_completed.emit(current_stage)
-	current_stage += 1
-	wave_in_stage = 1
+	set_progress(current_stage + 1, 1)
 
 	if current_stage >= stages.size():
 		game_won.emit()
@@ -73,6 +83,25 @@ func complete_stage() -> void:
 		_apply_biome()
 
 
+func set_progress(stage: int, wave: int) -> void:
+	## Change stage and wave together so listeners never see a half-updated pair
+	## (e.g. BossPrefetcher seeing the next stage at the old stage's boss wave)
+	if stage == current_stage and wave == wave_in_stage:
+		return
+	_setting_progress = true
+	current_stage = stage
+	wave_in_stage = wave
+	_setting_progress = false
+	progress_changed.emit(current_stage, wave_in_stage)
+
+
+func set_stage_at_wave(stage: int, global_wave: int) -> void:
+	## Jump to a stage mid-run (session restore), deriving wave_in_stage from the global wave
+	var biome: Biome = stages[stage] if stage >= 0 and stage < stages.size() else null
+	var waves_per_stage: int = biome.waves_before_boss if biome else 10
+	set_progress(stage, ((global_wave - 1) % waves_per_stage) + 1)
+
+
 func _apply_biome() -> void:
 	if current_biome:
 		biome_changed.emit(current_biome)
@@ -0,0 +1,292 @@
+extends Node
+## StatusEffectSystem autoload - owns every active status effect on every enemy
+## Effects live in packed per-slot arrays and advance in one loop per physics
+## frame; DoT damage is summed per enemy and delivered once per frame.
+## Enemies keep only their active types and slot indices (see EnemyBase).
+## Tick math mirrors StatusEffect.update() exactly (float64 timers) -
+## run_parity_check() compares the two.
+
+const StatusEffect := preload("res://scripts/effects/status_effect.gd")
+
+const DOT_SHAKE_INTENSITY: float = 1.0  # Very subtle - one shake per frame covers all DoT ticks
+const DOT_SHAKE_DECAY: float = 10.0
+
+# Per-slot state (swap-removed, so slot order is arbitrary)
+var _enemies: Array = []  # Untyped: non-pooled enemies can be freed before we notice
+var _enemy_ids := PackedInt64Array()
+var _types := PackedInt32Array()
+var _stacks := PackedInt32Array()
+var _max_stacks := PackedInt32Array()
+var _durations := PackedFloat64Array()  # INF = until death
+var _remaining := PackedFloat64Array()
+var _tick_timers := PackedFloat64Array()
+var _tick_intervals := PackedFloat64Array()
+var _damage_per_tick := PackedFloat64Array()
+var _slow := PackedFloat64Array()
+var _amp_per_stack := PackedFloat64Array()
+var _tick_damage := PackedInt32Array()  # Scratch: damage each slot ticked this frame
+
+# Per-frame delivery scratch
+var _dot_index: Dictionary = {}  # enemy instance id -> index into _dot_targets
+var _dot_targets: Array = []
+var _dot_ids := PackedInt64Array()
+var _dot_amounts := PackedInt32Array()
+var _changed: Array = []  # Enemies that lost an effect this frame
+
+# Stats
+var _ticks_last_frame: int = 0
+var _dot_events_last_frame: int = 0
+
+
+func _physics_process(delta: float) -> void:
+	if GameManager.current_state != GameManager.GameState.PLAYING:
+		return
+	if _types.is_empty():
+		_ticks_last_frame = 0
+		_dot_events_last_frame = 0
+		return
+
+	_advance(delta)
+	_deliver_dot_damage()
+	_remove_expired()
+
+
+# ============================================================================
+# Enemy API
+# ============================================================================
+
+func add_effect(enemy: Node, effect: StatusEffect) -> int:
+	## Start tracking a new effect (effect.apply() semantics). Returns its slot.
+	var slot := _types.size()
+	_enemies.append(enemy)
+	_enemy_ids.append(enemy.get_instance_id() if enemy else 0)
+	_types.append(effect.type)
+	_stacks.append(effect.stacks)
+	_max_stacks.append(effect.max_stacks)
+	_durations.append(effect.duration)
+	_remaining.append(effect.duration)
+	_tick_timers.append(0.0)
+	_tick_intervals.append(effect.tick_interval)
+	_damage_per_tick.append(effect.damage_per_tick)
+	_slow.append(effect.slow_multiplier)
+	_amp_per_stack.append(effect.damage_amp_per_stack)
+	_tick_damage.append(0)
+	if enemy:
+		enemy._on_status_added(effect.type, slot)
+	return slot
+
+
+func add_stack(slot: int) -> bool:
+	## StatusEffect.add_stack() for a tracked effect
+	if _stacks[slot] < _max_stacks[slot]:
+		_stacks[slot] += 1
+		return true
+	return false
+
+
+func refresh(slot: int) -> void:
+	## StatusEffect.refresh() - restart duration, keep tick timer and stacks
+	_remaining[slot] = _durations[slot]
+
+
+func get_stacks(slot: int) -> int:
+	return _stacks[slot]
+
+
+func get_damage_amplification(slots: PackedInt32Array) -> float:
+	## Summed amp multiplier for an enemy's slots (in its application order)
+	var amp_mult: float = 1.0
+	for slot in slots:
+		amp_mult += _amp_per_stack[slot] * _stacks[slot]
+	return amp_mult
+
+
+func get_slow_multiplier(slots: PackedInt32Array) -> float:
+	var slow_mult: float = 1.0
+	for slot in slots:
+		if _slow[slot] < slow_mult:
+			slow_mult = _slow[slot]
+	return slow_mult
+
+
+func make_effect(slot: int) -> StatusEffect:
+	## Detached StatusEffect copy of a tracked effect (for inspection only)
+	var effect := StatusEffect.new(_types[slot] as StatusEffect.Type)
+	effect.stacks = _stacks[slot]
+	effect.max_stacks = _max_stacks[slot]
+	effect.duration = _durations[slot]
+	effect.time_remaining = _remaining[slot]
+	effect.tick_timer = _tick_timers[slot]
+	effect.tick_interval = _tick_intervals[slot]
+	effect.damage_per_tick = _damage_per_tick[slot]
+	effect.slow_multiplier = _slow[slot]
+	effect.damage_amp_per_stack = _amp_per_stack[slot]
+	return effect
+
+
+func remove_enemy(enemy: Node, slots: PackedInt32Array) -> void:
+	## Drop all of an enemy's effects (clear, death reset). Caller clears its own lists.
+	var sorted := slots.duplicate()
+	sorted.sort()
+	# Highest first, so swap-removes never move a slot we still have to remove
+	for i in range(sorted.size() - 1, -1, -1):
+		var slot := sorted[i]
+		if slot < _types.size() and _enemies[slot] == enemy:
+			_remove_slot(slot, false)
+
+
+# ============================================================================
+# Simulation
+# ============================================================================
+
+func _advance(delta: float) -> void:
+	# Same arithmetic and order as StatusEffect.update()
+	_ticks_last_frame = 0
+	for slot in range(_types.size()):
+		if _durations[slot] != INF:
+			_remaining[slot] -= delta
+		_tick_timers[slot] += delta
+		var damage := 0
+		if _tick_timers[slot] >= _tick_intervals[slot] and _damage_per_tick[slot] > 0:
+			_tick_timers[slot] -= _tick_intervals[slot]
+			damage = int(_damage_per_tick[slot] * _stacks[slot])
+			_ticks_last_frame += 1
+		_tick_damage[slot] = damage
+
+
+func _deliver_dot_damage() -> void:
+	# Sum this frame's ticks per enemy, then hit each enemy once
+	_dot_index.clear()
+	_dot_targets.clear()
+	_dot_ids.clear()
+	_dot_amounts.clear()
+	for slot in range(_types.size()):
+		var damage := _tick_damage[slot]
+		if damage <= 0:
+			continue
+		var id := _enemy_ids[slot]
+		if not _dot_index.has(id):
+			_dot_index[id] = _dot_targets.size()
+			_dot_targets.append(_enemies[slot])
+			_dot_ids.append(id)
+			_dot_amounts.append(0)
+		_dot_amounts[_dot_index[id]] += damage
+
+	_dot_events_last_frame = _dot_targets.size()
+	if _dot_targets.is_empty():
+		return
+	CameraShake.shake(DOT_SHAKE_INTENSITY, DOT_SHAKE_DECAY)
+	for i in range(_dot_targets.size()):
+		if not is_instance_id_valid(_dot_ids[i]):
+			continue
+		var enemy = _dot_targets[i]
+		# Skip enemies already killed this frame (hp setter would re-run _die)
+		if enemy.current_state != EnemyBase.State.DEAD:
+			enemy._take_dot_damage(_dot_amounts[i])
+
+
+func _remove_expired() -> void:
+	_changed.clear()
+	var slot := _types.size() - 1
+	while slot >= 0:
+		var enemy_gone := not is_instance_id_valid(_enemy_ids[slot])
+		var expired := _durations[slot] != INF and _remaining[slot] <= 0
+		if enemy_gone or expired:
+			if not enemy_gone and not _changed.has(_enemies[slot]):
+				_changed.append(_enemies[slot])
+			_remove_slot(slot, not enemy_gone)
+		slot -= 1
+	for enemy in _changed:
+		enemy._on_status_effects_changed()
+
+
+func _remove_slot(slot: int, notify: bool) -> void:
+	var enemy = _enemies[slot]
+	var type := _types[slot]
+	var last := _types.size() - 1
+	if slot != last:
+		_enemies[slot] = _enemies[last]
+		_enemy_ids[slot] = _enemy_ids[last]
+		_types[slot] = _types[last]
+		_stacks[slot] = _stacks[last]
+		_max_stacks[slot] = _max_stacks[last]
+		_durations[slot] = _durations[last]
+		_remaining[slot] = _remaining[last]
+		_tick_timers[slot] = _tick_timers[last]
+		_tick_intervals[slot] = _tick_intervals[last]
+		_damage_per_tick[slot] = _damage_per_tick[last]
+		_slow[slot] = _slow[last]
+		_amp_per_stack[slot] = _amp_per_stack[last]
+		_tick_damage[slot] = _tick_damage[last]
+		if is_instance_id_valid(_enemy_ids[slot]):
+			_enemies[slot]._on_status_slot_moved(_types[slot], slot)
+	_enemies.resize(last)
+	_enemy_ids.resize(last)
+	_types.resize(last)
+	_stacks.resize(last)
+	_max_stacks.resize(last)
+	_durations.resize(last)
+	_remaining.resize(last)
+	_tick_timers.resize(last)
+	_tick_intervals.resize(last)
+	_damage_per_tick.resize(last)
+	_slow.resize(last)
+	_amp_per_stack.resize(last)
+	_tick_damage.resize(last)
+	if notify:
+		enemy._on_status_removed(type)
+
+
+# ============================================================================
+# Debug / Stats
+# ============================================================================
+
+func get_stats() -> Dictionary:
+	return {
+		"active_effects": _types.size(),
+		"ticks_last_frame": _ticks_last_frame,
+		"dot_events_last_frame": _dot_events_last_frame,
+	}
+
+
+func run_parity_check(frames: int = 600) -> Dictionary:
+	"""Step StatusEffect objects and a detached system side by side and compare
+	per-frame tick damage and expiry for every type, with stacking and refreshes."""
+	var result := {"frames": frames, "effects": 0, "legacy_damage": 0, "system_damage": 0, "mismatches": 0}
+	var system = get_script().new()
+	var legacy: Array = []
+	for effect_type in StatusEffect.Type.values():
+		for stacks in [1, 3]:
+			var effect := StatusEffect.new(effect_type)
+			effect.apply()
+			var twin := StatusEffect.new(effect_type)
+			system.add_effect(null, twin)
+			for i in range(stacks - 1):
+				effect.add_stack()
+				system.add_stack(legacy.size())
+			legacy.append(effect)
+	result["effects"] = legacy.size()
+
+	var rng := RandomNumberGenerator.new()
+	rng.seed = 12345
+	for frame in range(frames):
+		# Mix of fixed-step and jittery deltas
+		var delta := 1.0 / 60.0 if frame % 3 != 0 else rng.randf_range(0.004, 0.05)
+		if frame % 90 == 45:
+			for i in range(legacy.size()):
+				if legacy[i].max_stacks > 1:
+					legacy[i].add_stack()
+					system.add_stack(i)
+				legacy[i].refresh()
+				system.refresh(i)
+		system._advance(delta)
+		for i in range(legacy.size()):
+			var legacy_damage: int = legacy[i].update(delta)
+			var system_damage: int = system._tick_damage[i]
+			result["legacy_damage"] += legacy_damage
+			result["system_damage"] += system_damage
+			var system_expired: bool = system._durations[i] != INF and system._remaining[i] <= 0
+			if legacy_damage != system_damage or legacy[i].is_expired() != system_expired:
+				result["mismatches"] += 1
+	system.free()
+	return result
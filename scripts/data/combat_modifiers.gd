@@ -0,0 +1,84 @@
+class_name CombatModifiers
+extends RefCounted
+## Snapshot of every run-wide combat modifier read on the hit and spawn paths
+## Built by GameManager.get_combat_modifiers() and rebuilt only after a
+## character, passive, level, meta upgrade or fusion passive change.
+## Hit and spawn code reads these as plain fields instead of calling getters.
+
+# Hit path (GameManager passive helpers)
+var bounce_damage_mult: float = 0.0  # Per-bounce bonus (Bounce Master)
+var crit_chance: float = 0.0  # Dexterity crit + passive bonus (get_total_crit_chance)
+var crit_damage_mult: float = 2.0
+var fire_damage_mult: float = 1.0
+var damage_vs_frozen: float = 1.25
+var damage_vs_burning: float = 1.0
+var damage_vs_bleeding: float = 1.15
+var execute_threshold: float = 0.0
+var lifesteal_percent: float = 0.0
+var health_gem_chance: float = 0.0
+
+# Status effects (Intelligence scaling, read by StatusEffect on creation)
+var status_duration_mult: float = 1.0
+var status_damage_mult: float = 1.0
+var freeze_duration_bonus: float = 1.0
+
+# Spawn path (MetaManager permanent bonuses)
+var meta_damage_bonus: float = 0.0
+var meta_speed_bonus: float = 0.0
+var meta_pierce_bonus: int = 0
+var meta_ricochet_bonus: int = 0
+var meta_crit_bonus: float = 0.0
+var meta_multi_shot_bonus: int = 0
+
+var version: int = 0  # Bumped by GameManager on every rebuild
+
+
+static func capture(game: Node, meta: Node) -> CombatModifiers:
+	"""Evaluate the getters once; meta may be null before MetaManager is ready"""
+	var mods := CombatModifiers.new()
+	mods.bounce_damage_mult = game.get_bounce_damage_multiplier()
+	mods.crit_chance = game.get_total_crit_chance()
+	mods.crit_damage_mult = game.get_crit_damage_multiplier()
+	mods.fire_damage_mult = game.get_fire_damage_multiplier()
+	mods.damage_vs_frozen = game.get_damage_vs_frozen()
+	mods.damage_vs_burning = game.get_damage_vs_burning()
+	mods.damage_vs_bleeding = game.get_damage_vs_bleeding()
+	mods.execute_threshold = game.get_execute_threshold()
+	mods.lifesteal_percent = game.get_lifesteal_percent()
+	mods.health_gem_chance = game.get_health_gem_chance()
+	mods.status_duration_mult = game.get_status_duration_mult()
+	mods.status_damage_mult = game.get_status_damage_mult()
+	mods.freeze_duration_bonus = game.get_freeze_duration_bonus()
+	if meta:
+		mods.meta_damage_bonus = meta.get_damage_bonus()
+		mods.meta_speed_bonus = meta.get_ball_speed_bonus()
+		mods.meta_pierce_bonus = meta.get_piercing_bonus()
+		mods.meta_ricochet_bonus = meta.get_ricochet_bonus()
+		mods.meta_crit_bonus = meta.get_critical_bonus()
+		mods.meta_multi_shot_bonus = meta.get_multi_shot_bonus()
+	return mods
+
+
+func to_dict() -> Dictionary:
+	return {
+		"bounce_damage_mult": bounce_damage_mult,
+		"crit_chance": crit_chance,
+		"crit_damage_mult": crit_damage_mult,
+		"fire_damage_mult": fire_damage_mult,
+		"damage_vs_frozen": damage_vs_frozen,
+		"damage_vs_burning": damage_vs_burning,
+		"damage_vs_bleeding": damage_vs_bleeding,
+		"execute_threshold": execute_threshold,
+		"lifesteal_percent": lifesteal_percent,
+		"health_gem_chance": health_gem_chance,
+		"status_duration_mult": status_duration_mult,
+		"status_damage_mult": status_damage_mult,
+		"freeze_duration_bonus": freeze_duration_bonus,
+		"meta_damage_bonus": meta_damage_bonus,
+		"meta_speed_bonus": meta_speed_bonus,
+		"meta_pierce_bonus": meta_pierce_bonus,
+		"meta_ricochet_bonus": meta_ricochet_bonus,
+		"meta_crit_bonus": meta_crit_bonus,
+		"meta_multi_shot_bonus": meta_multi_shot_bonus,
+		"version": version,
+	}
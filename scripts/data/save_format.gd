@@ -0,0 +1,163 @@
+class_name SaveFormat
+extends RefCounted
+## Versioned binary container for save files
+## Layout: "GPSV" magic, format version (u8), kind (u8), schema version (u16),
+## payload size (u32), checksum (first 8 bytes of the payload's SHA-256),
+## then the payload. The schema version belongs to whoever owns the payload
+## (e.g. MetaManager.META_SCHEMA_VERSION) and drives its forward migrations.
+## Writer/Reader build payloads from typed fields with a string table, so
+## repeated names (characters, achievement ids) are stored once.
+
+enum Kind { META, SESSION, MANIFEST }
+
+const MAGIC := "GPSV"
+const FORMAT_VERSION: int = 1
+const CHECKSUM_SIZE: int = 8
+const HEADER_SIZE: int = 4 + 1 + 1 + 2 + 4 + CHECKSUM_SIZE
+
+
+static func pack(kind: Kind, schema_version: int, payload: PackedByteArray) -> PackedByteArray:
+	var buffer := StreamPeerBuffer.new()
+	buffer.put_data(MAGIC.to_ascii_buffer())
+	buffer.put_u8(FORMAT_VERSION)
+	buffer.put_u8(kind)
+	buffer.put_u16(schema_version)
+	buffer.put_u32(payload.size())
+	buffer.put_data(_checksum(payload))
+	buffer.put_data(payload)
+	return buffer.data_array
+
+
+static func is_packed(bytes: PackedByteArray) -> bool:
+	"""True if bytes start with the container magic (anything else is a legacy JSON save)"""
+	return bytes.size() >= HEADER_SIZE and bytes.slice(0, MAGIC.length()) == MAGIC.to_ascii_buffer()
+
+
+static func get_checksum(header: PackedByteArray) -> PackedByteArray:
+	"""Checksum field of a header (the first HEADER_SIZE bytes), or empty if not packed"""
+	if not is_packed(header):
+		return PackedByteArray()
+	return header.slice(HEADER_SIZE - CHECKSUM_SIZE, HEADER_SIZE)
+
+
+static func unpack(bytes: PackedByteArray, kind: Kind) -> Dictionary:
+	"""{schema_version, payload}, or {} if the header, size or checksum don't match"""
+	if not is_packed(bytes):
+		return {}
+	var buffer := StreamPeerBuffer.new()
+	buffer.data_array = bytes
+	buffer.seek(MAGIC.length())
+	if buffer.get_u8() != FORMAT_VERSION or buffer.get_u8() != kind:
+		return {}
+	var schema_version := buffer.get_u16()
+	var size := buffer.get_u32()
+	var checksum := bytes.slice(buffer.get_position(), HEADER_SIZE)
+	if bytes.size() != HEADER_SIZE + size:
+		return {}
+	var payload := bytes.slice(HEADER_SIZE)
+	if _checksum(payload) != checksum:
+		return {}
+	return {"schema_version": schema_version, "payload": payload}
+
+
+static func _checksum(payload: PackedByteArray) -> PackedByteArray:
+	var ctx := HashingContext.new()
+	ctx.start(HashingContext.HASH_SHA256)
+	if not payload.is_empty():
+		ctx.update(payload)
+	return ctx.finish().slice(0, CHECKSUM_SIZE)
+
+
+class Writer:
+	## Typed field writer; get_bytes() prepends the string table
+	var _body := StreamPeerBuffer.new()
+	var _strings := PackedStringArray()
+	var _string_index: Dictionary = {}  # String -> index in _strings
+
+	func put_u8(value: int) -> void:
+		_body.put_u8(value)
+
+	func put_u16(value: int) -> void:
+		_body.put_u16(value)
+
+	func put_u32(value: int) -> void:
+		_body.put_u32(value)
+
+	func put_s64(value: int) -> void:
+		_body.put_64(value)
+
+	func put_f64(value: float) -> void:
+		_body.put_double(value)
+
+	func put_bool(value: bool) -> void:
+		_body.put_u8(1 if value else 0)
+
+	func put_string(value: String) -> void:
+		var index: int = _string_index.get(value, -1)
+		if index < 0:
+			index = _strings.size()
+			_string_index[value] = index
+			_strings.append(value)
+		_body.put_u16(index)
+
+	func put_string_list(values: Array) -> void:
+		_body.put_u16(values.size())
+		for value in values:
+			put_string(value)
+
+	func put_bytes(value: PackedByteArray) -> void:
+		_body.put_u32(value.size())
+		_body.put_data(value)
+
+	func get_bytes() -> PackedByteArray:
+		var out := StreamPeerBuffer.new()
+		out.put_u16(_strings.size())
+		for value in _strings:
+			var utf8 := value.to_utf8_buffer()
+			out.put_u16(utf8.size())
+			out.put_data(utf8)
+		out.put_data(_body.data_array)
+		return out.data_array
+
+
+class Reader:
+	## Reads fields in the order a Writer wrote them
+	var _buffer := StreamPeerBuffer.new()
+	var _strings := PackedStringArray()
+
+	func _init(payload: PackedByteArray) -> void:
+		_buffer.data_array = payload
+		for i in range(_buffer.get_u16()):
+			_strings.append(_buffer.get_utf8_string(_buffer.get_u16()))
+
+	func get_u8() -> int:
+		return _buffer.get_u8()
+
+	func get_u16() -> int:
+		return _buffer.get_u16()
+
+	func get_u32() -> int:
+		return _buffer.get_u32()
+
+	func get_s64() -> int:
+		return _buffer.get_64()
+
+	func get_f64() -> float:
+		return _buffer.get_double()
+
+	func get_bool() -> bool:
+		return _buffer.get_u8() != 0
+
+	func get_string() -> String:
+		var index := _buffer.get_u16()
+		return _strings[index] if index < _strings.size() else ""
+
+	func get_string_list() -> Array:
+		var values: Array = []
+		for i in range(_buffer.get_u16()):
+			values.append(get_string())
+		return values
+
+	func get_bytes() -> PackedByteArray:
+		var result := _buffer.get_data(_buffer.get_u32())
+		return result[1] if result[0] == OK else PackedByteArray()
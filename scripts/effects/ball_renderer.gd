@@ -0,0 +1,79 @@
+extends Node2D
+## Opt-in batched renderer for balls - draws every ball, level ring and trail
+## in one canvas item per frame instead of one re-recorded canvas item per ball.
+## Ball nodes keep physics; in batched mode their own _draw is empty.
+## Toggle with set_batched() and compare get_render_stats() for A/B runs.
+
+static var batched: bool = false
+static var node_redraws: int = 0  # Per-ball queue_redraw calls (non-batched mode)
+
+var balls_container: Node2D
+var _batch_redraws: int = 0
+var _stats_window_start: int = 0
+var _last_stats := {"node_redraws_per_sec": 0.0, "batch_redraws_per_sec": 0.0}
+
+
+func _ready() -> void:
+	add_to_group("ball_renderer")
+	_stats_window_start = Time.get_ticks_msec()
+
+
+func set_batched(enabled: bool) -> void:
+	batched = enabled
+	# Clear or restore each ball's own canvas item
+	if balls_container:
+		for ball in balls_container.get_children():
+			if ball.has_method("draw_visuals"):
+				ball.queue_redraw()
+	queue_redraw()
+
+
+func _process(_delta: float) -> void:
+	_update_stats_window()
+	if batched:
+		_batch_redraws += 1
+		queue_redraw()
+
+
+func _draw() -> void:
+	if not batched or not balls_container:
+		return
+	for ball in balls_container.get_children():
+		if not ball.visible or not ball.has_method("draw_visuals"):
+			continue
+		# Mirror the ball's own transform (balls don't rotate; scale is used for effects)
+		draw_set_transform(to_local(ball.global_position), 0.0, ball.scale)
+		ball.draw_visuals(self, Vector2.ZERO, ball.modulate)
+	draw_set_transform(Vector2.ZERO)
+
+
+func _update_stats_window() -> void:
+	var now := Time.get_ticks_msec()
+	var elapsed := now - _stats_window_start
+	if elapsed < 1000:
+		return
+	var seconds := elapsed / 1000.0
+	_last_stats = {
+		"node_redraws_per_sec": node_redraws / seconds,
+		"batch_redraws_per_sec": _batch_redraws / seconds,
+	}
+	node_redraws = 0
+	_batch_redraws = 0
+	_stats_window_start = now
+
+
+func get_render_stats() -> Dictionary:
+	## Canvas items re-recorded per second (last full second) plus engine draw counters
+	var ball_count := 0
+	if balls_container:
+		for ball in balls_container.get_children():
+			if ball.has_method("draw_visuals"):
+				ball_count += 1
+	return {
+		"batched": batched,
+		"balls": ball_count,
+		"node_redraws_per_sec": _last_stats["node_redraws_per_sec"],
+		"batch_redraws_per_sec": _last_stats["batch_redraws_per_sec"],
+		"draw_calls": Performance.get_monitor(Performance.RENDER_TOTAL_DRAW_CALLS_IN_FRAME),
+		"render_objects": Performance.get_monitor(Performance.RENDER_TOTAL_OBJECTS_IN_FRAME),
+	}
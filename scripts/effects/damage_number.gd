@@ -1,91 +1,41 @@
-extends Label
-## Floating damage number that rises and fades out
+extends RefCounted
+## Floating damage numbers that rise and fade out
+## Static entry points; all numbers under a parent are drawn by one
+## DamageNumberLayer node instead of a Label + Tween each.
 
-var _tween: Tween
+const DamageNumberLayer := preload("res://scripts/effects/damage_number_layer.gd")
 
 
-func _ready() -> void:
-	# Set up appearance
-	horizontal_alignment = HORIZONTAL_ALIGNMENT_CENTER
-	vertical_alignment = VERTICAL_ALIGNMENT_CENTER
-
-
-func animate() -> void:
-	"""Start the rise and fade animation - call after configuring text/position"""
-	# Kill any existing tween
-	if _tween and _tween.is_valid():
-		_tween.kill()
-
-	# Animate: rise up and fade out
-	_tween = create_tween()
-	_tween.set_parallel(true)
-	_tween.tween_property(self, "position:y", position.y - 60, 0.6).set_ease(Tween.EASE_OUT)
-	_tween.tween_property(self, "modulate:a", 0.0, 0.6).set_delay(0.2)
-	_tween.set_parallel(false)
-	_tween.tween_callback(_on_animation_complete)
-
-
-func _on_animation_complete() -> void:
-	"""Return to pool or free when animation completes"""
-	if has_meta("pooled") and PoolManager:
-		reset()
-		PoolManager.release_damage_number(self)
-	else:
-		queue_free()
-
-
-func reset() -> void:
-	"""Reset for object pool reuse"""
-	# Kill any running tween
-	if _tween and _tween.is_valid():
-		_tween.kill()
-		_tween = null
-
-	# Reset visual state
-	text = ""
-	modulate = Color.WHITE
-	scale = Vector2.ONE
-	position = Vector2.ZERO
+static func spawn(parent: Node, pos: Vector2, value: int, text_color: Color = Color.WHITE, prefix: String = "") -> void:
+	var layer = _get_layer(parent)
+	layer.add_number(_jitter(pos), value, text_color, prefix)
 
 
-static func spawn(parent: Node, pos: Vector2, value: int, text_color: Color = Color.WHITE, prefix: String = "") -> void:
-	var label: Label
+static func spawn_text(parent: Node, pos: Vector2, text: String, text_color: Color = Color.WHITE) -> void:
+	"""Spawn floating text (like 'EXECUTE') instead of a number"""
+	var layer = _get_layer(parent)
+	layer.add_text(_jitter(pos), text, text_color)
 
-	# Get from pool if available
-	if PoolManager:
-		label = PoolManager.get_damage_number()
-	else:
-		var scene := preload("res://scenes/effects/damage_number.tscn")
-		label = scene.instantiate()
 
-	label.text = prefix + str(value)
-	label.position = pos + Vector2(randf_range(-10, 10), randf_range(-10, 10))
-	label.modulate = text_color
-	label.z_index = 100
-	parent.add_child(label)
+static func spawn_tick(parent: Node, source: Object, pos: Vector2, value: int, text_color: Color = Color.WHITE) -> void:
+	"""Spawn a DoT tick number; ticks from the same source in a short window are summed"""
+	var layer = _get_layer(parent)
+	layer.add_number(_jitter(pos), value, text_color, "", source.get_instance_id())
 
-	# Start animation (pooled or not)
-	if label.has_method("animate"):
-		label.animate()
 
+static func get_active_count(parent: Node) -> int:
+	var layer = parent.get_node_or_null(DamageNumberLayer.LAYER_NAME)
+	return layer.get_active_count() if layer else 0
 
-static func spawn_text(parent: Node, pos: Vector2, text: String, text_color: Color = Color.WHITE) -> void:
-	"""Spawn floating text (like 'EXECUTE') instead of a number"""
-	var label: Label
 
-	# Get from pool if available
-	if PoolManager:
-		label = PoolManager.get_damage_number()
-	else:
-		var scene := preload("res://scenes/effects/damage_number.tscn")
-		label = scene.instantiate()
+static func _get_layer(parent: Node) -> Node2D:
+	var layer = parent.get_node_or_null(DamageNumberLayer.LAYER_NAME)
+	if not layer:
+		layer = DamageNumberLayer.new()
+		layer.name = DamageNumberLayer.LAYER_NAME
+		parent.add_child(layer)
+	return layer
 
-	label.text = text
-	label.position = pos + Vector2(randf_range(-10, 10), randf_range(-10, 10))
-	label.modulate = text_color
-	label.z_index = 100
-	parent.add_child(label)
 
-	# Start animation (pooled or not)
-	if label.has_method("animate"):
-		label.animate()
+static func _jitter(pos: Vector2) -> Vector2:
+	return pos + Vector2(randf_range(-10, 10), randf_range(-10, 10))
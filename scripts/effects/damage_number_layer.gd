@@ -0,0 +1,141 @@
+extends Node2D
+## Draws every floating damage number for its parent in a single _draw pass
+## Numbers live in packed arrays (no Label or Tween per number). Created on
+## demand by DamageNumber.spawn() as a child of the spawn parent.
+
+const LAYER_NAME := "DamageNumberLayer"
+const MAX_NUMBERS := 128  # Hard cap; the oldest number is replaced when full
+const LIFETIME := 0.8  # Rise 0.6s, fade from 0.2s to 0.8s (matches the old Label tween)
+const RISE_DURATION := 0.6
+const RISE_DISTANCE := 60.0
+const FADE_DELAY := 0.2
+const AGGREGATE_WINDOW := 0.3  # Ticks from the same source within this window are summed
+const FONT_SIZE := 32
+const OUTLINE_SIZE := 5
+const TEXT_OFFSET := Vector2(65, 25)  # Center of the old 130x50 Label rect
+
+static var aggregate_ticks: bool = true  # Toggle DoT tick aggregation
+
+var _positions := PackedVector2Array()
+var _colors := PackedColorArray()
+var _ages := PackedFloat32Array()
+var _widths := PackedFloat32Array()
+var _texts := PackedStringArray()
+var _prefixes := PackedStringArray()
+var _values := PackedInt32Array()
+var _keys := PackedInt64Array()  # Aggregation key (source instance id), 0 = none
+var _font: Font = ThemeDB.fallback_font
+var _dropped: int = 0
+
+
+func _ready() -> void:
+	z_index = 100
+	set_process(not _ages.is_empty())
+
+
+func add_number(pos: Vector2, value: int, color: Color, prefix: String = "", key: int = 0) -> void:
+	## Queue a floating number; with a key, merges into a recent number from the same source
+	if key != 0 and aggregate_ticks:
+		for i in range(_keys.size()):
+			if _keys[i] == key and _ages[i] < AGGREGATE_WINDOW:
+				_values[i] += value
+				_set_text(i, _prefixes[i] + str(_values[i]))
+				return
+	_append(pos, prefix + str(value), color, prefix, value, key)
+
+
+func add_text(pos: Vector2, text: String, color: Color) -> void:
+	_append(pos, text, color, "", 0, 0)
+
+
+func get_active_count() -> int:
+	return _ages.size()
+
+
+func get_stats() -> Dictionary:
+	return {
+		"active": _ages.size(),
+		"max": MAX_NUMBERS,
+		"dropped": _dropped,
+	}
+
+
+func _append(pos: Vector2, text: String, color: Color, prefix: String, value: int, key: int) -> void:
+	if _ages.size() >= MAX_NUMBERS:
+		_remove_at(_oldest_index())
+		_dropped += 1
+
+	_positions.append(pos)
+	_colors.append(color)
+	_ages.append(0.0)
+	_widths.append(0.0)
+	_texts.append("")
+	_prefixes.append(prefix)
+	_values.append(value)
+	_keys.append(key)
+	_set_text(_ages.size() - 1, text)
+	set_process(true)
+	queue_redraw()
+
+
+func _set_text(index: int, text: String) -> void:
+	_texts[index] = text
+	_widths[index] = _font.get_string_size(text, HORIZONTAL_ALIGNMENT_LEFT, -1, FONT_SIZE).x
+
+
+func _oldest_index() -> int:
+	var oldest := 0
+	for i in range(1, _ages.size()):
+		if _ages[i] > _ages[oldest]:
+			oldest = i
+	return oldest
+
+
+func _remove_at(index: int) -> void:
+	# Swap-remove: draw order doesn't matter for short-lived numbers
+	var last := _ages.size() - 1
+	if index != last:
+		_positions[index] = _positions[last]
+		_colors[index] = _colors[last]
+		_ages[index] = _ages[last]
+		_widths[index] = _widths[last]
+		_texts[index] = _texts[last]
+		_prefixes[index] = _prefixes[last]
+		_values[index] = _values[last]
+		_keys[index] = _keys[last]
+	_positions.resize(last)
+	_colors.resize(last)
+	_ages.resize(last)
+	_widths.resize(last)
+	_texts.resize(last)
+	_prefixes.resize(last)
+	_values.resize(last)
+	_keys.resize(last)
+
+
+func _process(delta: float) -> void:
+	var i := 0
+	while i < _ages.size():
+		_ages[i] += delta
+		if _ages[i] >= LIFETIME:
+			_remove_at(i)
+		else:
+			i += 1
+
+	if _ages.is_empty():
+		set_process(false)
+	queue_redraw()
+
+
+func _draw() -> void:
+	var baseline := (_font.get_ascent(FONT_SIZE) - _font.get_descent(FONT_SIZE)) * 0.5
+	for i in range(_ages.size()):
+		var age := _ages[i]
+		var rise := RISE_DISTANCE * minf(age / RISE_DURATION, 1.0)
+		var alpha := 1.0 - clampf((age - FADE_DELAY) / (LIFETIME - FADE_DELAY), 0.0, 1.0)
+		var color := _colors[i]
+		color.a *= alpha
+		var outline := Color(0, 0, 0, color.a)
+		var at := _positions[i] + TEXT_OFFSET + Vector2(-_widths[i] * 0.5, baseline - rise)
+		draw_string_outline(_font, at, _texts[i], HORIZONTAL_ALIGNMENT_LEFT, -1, FONT_SIZE, OUTLINE_SIZE, outline)
+		draw_string(_font, at, _texts[i], HORIZONTAL_ALIGNMENT_LEFT, -1, FONT_SIZE, color)
@@ -1,9 +1,12 @@
 extends GPUParticles2D
 ## Hit effect particles - auto-frees after emission
+## Pooled instances are restarted and reclaimed by PoolManager instead
 
 
 func _ready() -> void:
-	emitting = true
 	one_shot = true
+	if has_meta("pooled"):
+		return
+	emitting = true
 	# Free after particles are done
 	finished.connect(queue_free)
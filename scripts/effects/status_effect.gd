@@ -26,9 +26,11 @@ func _init(effect_type: Type = Type.BURN) -> void:
 
 
 func _configure() -> void:
-	# Get intelligence multipliers for duration and damage scaling
-	var duration_mult: float = GameManager.get_status_duration_mult() if GameManager else 1.0
-	var damage_mult: float = GameManager.get_status_damage_mult() if GameManager else 1.0
+	# Get intelligence multipliers for duration and damage scaling (cached snapshot)
+	var mods: CombatModifiers = GameManager.get_combat_modifiers() if GameManager else null
+	var duration_mult: float = mods.status_duration_mult if mods else 1.0
+	var damage_mult: float = mods.status_damage_mult if mods else 1.0
+	var freeze_bonus: float = mods.freeze_duration_bonus if mods else 1.0
 
 	match type:
 		Type.BURN:
@@ -38,7 +40,7 @@ func _configure() -> void:
 			max_stacks = 5  # BallxPit cap: 5 stacks
 		Type.FREEZE:
 			# Shatter passive: +30% freeze duration
-			duration = 2.0 * duration_mult * GameManager.get_freeze_duration_bonus()
+			duration = 2.0 * duration_mult * freeze_bonus
 			damage_per_tick = 0.0
 			slow_multiplier = 0.5  # 50% slow
 			max_stacks = 1  # Freeze doesn't stack - refreshes duration
@@ -136,7 +138,12 @@ func is_expired() -> bool:
 
 func get_color() -> Color:
 	"""Get the visual tint color for this effect"""
-	match type:
+	return get_type_color(type)
+
+
+static func get_type_color(effect_type: int) -> Color:
+	"""Visual tint color for an effect type"""
+	match effect_type:
 		Type.BURN:
 			return Color(1.5, 0.6, 0.2)  # Orange
 		Type.FREEZE:
@@ -55,16 +55,7 @@ func get_max_baby_balls() -> int:
 
 func get_current_baby_count() -> int:
 	"""Returns count of active baby balls on screen"""
-	if not _ball_spawner or not "balls_container" in _ball_spawner:
-		return 0
-	var container: Node = _ball_spawner.balls_container
-	if not container:
-		return 0
-	var count: int = 0
-	for child in container.get_children():
-		if child.get("is_baby_ball") == true:
-			count += 1
-	return count
+	return EntityRegistry.get_ball_count(EntityRegistry.BallCategory.BABY)
 
 
 func get_leadership_damage_bonus() -> float:
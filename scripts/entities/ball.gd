@@ -2,6 +2,7 @@ extends CharacterBody2D
 ## Ball entity - moves in a direction and bounces off walls
 
 const StatusEffect := preload("res://scripts/effects/status_effect.gd")
+const BallRenderer := preload("res://scripts/effects/ball_renderer.gd")
 
 signal hit_enemy(enemy: Node2D)
 signal hit_gem(gem: Node2D)
@@ -26,7 +27,9 @@ var _bounce_count: int = 0
 var ball_type: BallType = BallType.NORMAL
 var ball_level: int = 1  # 1-3, affects visuals
 var registry_type: int = -1  # BallRegistry.BallType if set from registry
-var _trail_points: Array[Vector2] = []
+var _trail_ring := PackedVector2Array()  # Ring buffer of recent global positions
+var _trail_head: int = 0  # Next write slot
+var _trail_count: int = 0
 const MAX_TRAIL_POINTS: int = 8
 var _particle_trail: GPUParticles2D = null
 var _trail_redraw_counter: int = 0  # Throttle trail redraws for performance
@@ -38,7 +41,17 @@ const RETURN_COMPLETE_Y: float = 350.0  # Near player position - complete return
 const CATCH_ZONE_Y: float = 600.0  # Ball is catchable when y < this (in catch zone)
 const RETURN_SPEED_MULT: float = 1.5  # Return speed is faster than normal
 const CATCH_MAGNETISM_RADIUS: float = 80.0  # Auto-catch radius around player (BallxPit style)
+# Off-screen bounds (50px past the 1280px-tall screen) - balls past these despawn
+const DESPAWN_TOP_Y: float = -50.0
+const DESPAWN_BOTTOM_Y: float = 1330.0
 var is_returning: bool = false  # True when ball is flying back to player
+
+# Lifecycle: fired -> IN_FLIGHT -> RETURNING -> CAUGHT/DESPAWNED -> POOLED
+# Every exit goes through _release(), which hands pooled balls back to PoolManager
+enum Lifecycle { POOLED, IN_FLIGHT, RETURNING, CAUGHT, DESPAWNED }
+var lifecycle: Lifecycle = Lifecycle.POOLED
+var _default_collision_layer: int = 0
+var _default_collision_mask: int = 0
 var is_catchable: bool = false  # True when ball can be caught (after first bounce)
 
 
@@ -64,13 +77,41 @@ var evolved_type: int = 0  # FusionRegistry.EvolvedBallType
 var is_fused: bool = false
 var fused_id: String = ""
 var fused_effects: Array = []  # Array of effect strings for fused balls
+var _registry_category: int = -1  # EntityRegistry.BallCategory while counted, -1 otherwise
 
 
 func _ready() -> void:
+	_default_collision_layer = collision_layer
+	_default_collision_mask = collision_mask
 	_apply_ball_type_visuals()
 	queue_redraw()
 
 
+func _enter_tree() -> void:
+	# Fired: fresh or pooled balls enter flight when added to the tree
+	if lifecycle == Lifecycle.POOLED:
+		lifecycle = Lifecycle.IN_FLIGHT
+	# Spawners set is_baby_ball / is_evolved before add_child
+	if _registry_category < 0:
+		if is_baby_ball:
+			_registry_category = EntityRegistry.BallCategory.BABY
+		elif is_evolved:
+			_registry_category = EntityRegistry.BallCategory.EVOLVED
+		else:
+			_registry_category = EntityRegistry.BallCategory.MAIN
+		EntityRegistry.ball_entered(_registry_category)
+
+
+func _exit_tree() -> void:
+	_unregister_ball()
+
+
+func _unregister_ball() -> void:
+	if _registry_category >= 0:
+		EntityRegistry.ball_exited(_registry_category)
+		_registry_category = -1
+
+
 func set_ball_type(new_type: BallType) -> void:
 	ball_type = new_type
 	_apply_ball_type_visuals()
@@ -159,75 +200,100 @@ func _spawn_particle_trail() -> void:
 
 
 func _draw() -> void:
+	# Batched mode: BallRenderer draws every ball in one pass
+	if BallRenderer.batched:
+		return
+	draw_visuals(self, Vector2.ZERO, Color.WHITE)
+
+
+func draw_visuals(canvas: CanvasItem, origin: Vector2, tint: Color) -> void:
+	"""Draw this ball onto canvas at origin (self in per-node mode, BallRenderer when batched).
+	tint stands in for this node's modulate when drawing on another canvas item."""
+	var color := ball_color * tint
+
 	# Baby balls are smaller and have a subtle glow
 	if is_baby_ball:
 		var baby_radius := radius * 0.5
 		# Outer glow
-		draw_circle(Vector2.ZERO, baby_radius + 3, Color(ball_color.r, ball_color.g, ball_color.b, 0.3))
+		canvas.draw_circle(origin, baby_radius + 3, Color(color.r, color.g, color.b, 0.3 * tint.a))
 		# Main ball (slightly lighter)
-		draw_circle(Vector2.ZERO, baby_radius, ball_color.lightened(0.2))
+		canvas.draw_circle(origin, baby_radius, ball_color.lightened(0.2) * tint)
 		# Sparkle highlight
-		draw_circle(Vector2(-baby_radius * 0.3, -baby_radius * 0.3), baby_radius * 0.25, Color(1.0, 1.0, 1.0, 0.6))
+		canvas.draw_circle(origin + Vector2(-baby_radius * 0.3, -baby_radius * 0.3), baby_radius * 0.25, Color(1.0, 1.0, 1.0, 0.6) * tint)
 		return
 
 	# Level affects size: L1=1.0x, L2=1.1x, L3=1.2x
 	var level_size_mult := 1.0 + (ball_level - 1) * 0.1
 	var actual_radius := radius * level_size_mult
 
-	# Draw trail for special ball types
-	if ball_type != BallType.NORMAL and _trail_points.size() > 1:
-		for i in range(_trail_points.size() - 1):
-			var alpha: float = float(i) / _trail_points.size() * 0.5
-			var trail_color := ball_color
-			trail_color.a = alpha
-			var width: float = actual_radius * 0.5 * (float(i) / _trail_points.size())
-			draw_line(_trail_points[i] - global_position, _trail_points[i + 1] - global_position, trail_color, width)
+	# Draw trail for special ball types (oldest point first)
+	if ball_type != BallType.NORMAL and _trail_count > 1:
+		var offset := origin - global_position
+		for i in range(_trail_count - 1):
+			var alpha: float = float(i) / _trail_count * 0.5
+			var trail_color := color
+			trail_color.a = alpha * tint.a
+			var width: float = actual_radius * 0.5 * (float(i) / _trail_count)
+			canvas.draw_line(_get_trail_point(i) + offset, _get_trail_point(i + 1) + offset, trail_color, width)
 
 	# Draw main ball
-	draw_circle(Vector2.ZERO, actual_radius, ball_color)
+	canvas.draw_circle(origin, actual_radius, color)
 
 	# Level indicator rings
 	if ball_level >= 2:
 		# L2: single white ring
-		draw_arc(Vector2.ZERO, actual_radius + 2, 0, TAU, 24, Color(1.0, 1.0, 1.0, 0.7), 1.5)
+		canvas.draw_arc(origin, actual_radius + 2, 0, TAU, 24, Color(1.0, 1.0, 1.0, 0.7) * tint, 1.5)
 	if ball_level >= 3:
 		# L3: gold outer ring (fusion-ready)
-		draw_arc(Vector2.ZERO, actual_radius + 5, 0, TAU, 24, Color(1.0, 0.85, 0.0, 0.9), 2.0)
+		canvas.draw_arc(origin, actual_radius + 5, 0, TAU, 24, Color(1.0, 0.85, 0.0, 0.9) * tint, 2.0)
 
 	# Type-specific effects
 	match ball_type:
 		BallType.FIRE:
 			# Inner glow
-			draw_circle(Vector2.ZERO, actual_radius * 0.6, Color(1.0, 0.8, 0.2))
+			canvas.draw_circle(origin, actual_radius * 0.6, Color(1.0, 0.8, 0.2) * tint)
 		BallType.ICE:
 			# Crystal effect
 			for i in range(6):
 				var angle: float = TAU * i / 6.0
 				var point := Vector2.from_angle(angle) * actual_radius * 0.7
-				draw_line(Vector2.ZERO, point, Color.WHITE, 1.5)
+				canvas.draw_line(origin, origin + point, Color.WHITE * tint, 1.5)
 		BallType.LIGHTNING:
 			# Spark effect
 			for i in range(4):
 				var angle: float = TAU * i / 4.0 + randf() * 0.3
 				var len: float = actual_radius * (0.8 + randf() * 0.4)
 				var point := Vector2.from_angle(angle) * len
-				draw_line(Vector2.ZERO, point, Color.WHITE, 1.0)
+				canvas.draw_line(origin, origin + point, Color.WHITE * tint, 1.0)
 		BallType.POISON:
 			# Bubble effect
 			for i in range(3):
 				var angle: float = TAU * i / 3.0 + randf() * 0.2
 				var bubble_pos := Vector2.from_angle(angle) * actual_radius * 0.5
-				draw_circle(bubble_pos, 3.0, Color(0.2, 0.7, 0.1, 0.6))
+				canvas.draw_circle(origin + bubble_pos, 3.0, Color(0.2, 0.7, 0.1, 0.6) * tint)
 		BallType.BLEED:
 			# Drip effect
-			draw_circle(Vector2(0, actual_radius * 0.4), 4.0, Color(0.7, 0.1, 0.1))
+			canvas.draw_circle(origin + Vector2(0, actual_radius * 0.4), 4.0, Color(0.7, 0.1, 0.1) * tint)
 		BallType.IRON:
 			# Metallic shine
-			draw_arc(Vector2(-actual_radius * 0.3, -actual_radius * 0.3), actual_radius * 0.4, -0.5, 1.0, 8, Color(1.0, 1.0, 1.0, 0.5), 2.0)
+			canvas.draw_arc(origin + Vector2(-actual_radius * 0.3, -actual_radius * 0.3), actual_radius * 0.4, -0.5, 1.0, 8, Color(1.0, 1.0, 1.0, 0.5) * tint, 2.0)
 		BallType.VAMPIRE:
 			# Fang marks effect
-			draw_circle(Vector2(-3, actual_radius * 0.3), 2.5, Color(0.8, 0.0, 0.2))
-			draw_circle(Vector2(3, actual_radius * 0.3), 2.5, Color(0.8, 0.0, 0.2))
+			canvas.draw_circle(origin + Vector2(-3, actual_radius * 0.3), 2.5, Color(0.8, 0.0, 0.2) * tint)
+			canvas.draw_circle(origin + Vector2(3, actual_radius * 0.3), 2.5, Color(0.8, 0.0, 0.2) * tint)
+
+
+func _push_trail_point(point: Vector2) -> void:
+	if _trail_ring.size() != MAX_TRAIL_POINTS:
+		_trail_ring.resize(MAX_TRAIL_POINTS)
+	_trail_ring[_trail_head] = point
+	_trail_head = (_trail_head + 1) % MAX_TRAIL_POINTS
+	_trail_count = mini(_trail_count + 1, MAX_TRAIL_POINTS)
+
+
+func _get_trail_point(i: int) -> Vector2:
+	# i = 0 is the oldest point still in the ring
+	return _trail_ring[(_trail_head - _trail_count + i + MAX_TRAIL_POINTS) % MAX_TRAIL_POINTS]
 
 
 func _physics_process(delta: float) -> void:
@@ -235,19 +301,24 @@ func _physics_process(delta: float) -> void:
 	if GameManager.current_state != GameManager.GameState.PLAYING:
 		return
 
+	# Left the screen (e.g. fired up past the walls) - back to the pool
+	if global_position.y < DESPAWN_TOP_Y or global_position.y > DESPAWN_BOTTOM_Y:
+		despawn()
+		return
+
 	# Returning balls move faster and home toward player
 	var current_speed := speed * RETURN_SPEED_MULT if is_returning else speed
 	velocity = direction * current_speed
 
 	# Update trail with throttled redraw for performance
 	if ball_type != BallType.NORMAL:
-		_trail_points.append(global_position)
-		while _trail_points.size() > MAX_TRAIL_POINTS:
-			_trail_points.remove_at(0)
+		_push_trail_point(global_position)
 		# Only redraw every TRAIL_REDRAW_INTERVAL frames to reduce draw calls
+		# (batched mode redraws every ball from BallRenderer instead)
 		_trail_redraw_counter += 1
-		if _trail_redraw_counter >= TRAIL_REDRAW_INTERVAL:
+		if _trail_redraw_counter >= TRAIL_REDRAW_INTERVAL and not BallRenderer.batched:
 			_trail_redraw_counter = 0
+			BallRenderer.node_redraws += 1
 			queue_redraw()
 
 	# Ball return mechanic with return path damage
@@ -298,21 +369,22 @@ func _physics_process(delta: float) -> void:
 		elif collider.collision_layer & 4:  # enemies layer
 			var actual_damage := damage
 			var is_crit := false
+			var mods := GameManager.get_combat_modifiers()
 
 			# Bounce damage scaling (Bounce Master passive: +5% per bounce)
-			var bounce_mult := GameManager.get_bounce_damage_multiplier()
+			var bounce_mult := mods.bounce_damage_mult
 			if bounce_mult > 0 and _bounce_count > 0:
 				actual_damage = int(actual_damage * (1.0 + _bounce_count * bounce_mult))
 
 			# Check for critical hit (dexterity base + Jackpot bonus + upgrade crit chance)
-			var total_crit_chance := crit_chance + GameManager.get_total_crit_chance()
+			var total_crit_chance := crit_chance + mods.crit_chance
 			if total_crit_chance > 0 and randf() < total_crit_chance:
-				actual_damage = int(actual_damage * GameManager.get_crit_damage_multiplier())
+				actual_damage = int(actual_damage * mods.crit_damage_mult)
 				is_crit = true
 
 			# Inferno passive: +20% fire damage
 			if ball_type == BallType.FIRE:
-				actual_damage = int(actual_damage * GameManager.get_fire_damage_multiplier())
+				actual_damage = int(actual_damage * mods.fire_damage_mult)
 
 			# Dark ball: 3x damage (high risk, high reward - self-destructs on hit)
 			if ball_type == BallType.DARK:
@@ -322,13 +394,13 @@ func _physics_process(delta: float) -> void:
 			if collider.has_method("has_status_effect"):
 				# Shatter: +50% damage vs frozen (base +25%)
 				if collider.has_status_effect(StatusEffect.Type.FREEZE):
-					actual_damage = int(actual_damage * GameManager.get_damage_vs_frozen())
+					actual_damage = int(actual_damage * mods.damage_vs_frozen)
 				# Inferno: +25% damage vs burning
 				if collider.has_status_effect(StatusEffect.Type.BURN):
-					actual_damage = int(actual_damage * GameManager.get_damage_vs_burning())
+					actual_damage = int(actual_damage * mods.damage_vs_burning)
 				# Bleed: +15% damage vs bleeding
 				if collider.has_status_effect(StatusEffect.Type.BLEED):
-					actual_damage = int(actual_damage * GameManager.get_damage_vs_bleeding())
+					actual_damage = int(actual_damage * mods.damage_vs_bleeding)
 
 			# Apply evolved/fused/normal ball effects
 			if is_evolved:
@@ -339,19 +411,21 @@ func _physics_process(delta: float) -> void:
 				# Ball type bonus damage/effects
 				_apply_ball_type_effect(collider, actual_damage)
 
-			# Use position-based damage for weak point detection (e.g., boss crowns)
-			# Pass is_crit flag for execute mechanic
-			if collider.has_method("take_damage_at_position"):
-				collider.take_damage_at_position(actual_damage, collision.get_position(), is_crit)
-			elif collider.has_method("take_damage"):
-				collider.take_damage(actual_damage, is_crit)
+			# Batched with this frame's other hits; the hit position drives weak
+			# points (e.g., boss crowns) and is_crit the execute mechanic
+			if collider is EnemyBase:
+				CombatResolver.queue_hit_at(collider, actual_damage, collision.get_position(), is_crit)
+			else:
+				# Not batched, so the resolver won't play this hit's sound
+				if collider.has_method("take_damage"):
+					collider.take_damage(actual_damage, is_crit)
+				SoundManager.play(SoundManager.SoundType.HIT_ENEMY)
 
 			# Visual crit effect
 			if is_crit:
 				_show_crit_effect()
 
 			hit_enemy.emit(collider)
-			SoundManager.play(SoundManager.SoundType.HIT_ENEMY)
 
 			# Handle piercing
 			if pierce_count > 0:
@@ -379,24 +453,7 @@ func _physics_process(delta: float) -> void:
 				return
 
 			# Ball is moving toward player - CATCH IT
-			velocity = Vector2.ZERO
-			direction = Vector2.ZERO
-
-			# Disable everything
-			set_physics_process(false)
-			set_process(false)
-			collision_layer = 0
-			collision_mask = 0
-
-			# Move offscreen and hide
-			global_position = Vector2(-9999, -9999)
-			hide()
-
-			# Emit caught signal (allows spawner to reload)
-			caught.emit()
-
-			# Use call_deferred for cleanup to ensure it happens
-			call_deferred("queue_free")
+			_catch_now(false)
 			return
 
 	# MAGNETISM AUTO-CATCH: Catchable balls within magnetism radius are pulled and caught
@@ -406,17 +463,7 @@ func _physics_process(delta: float) -> void:
 		var dist_to_player := global_position.distance_to(player_pos)
 		if dist_to_player < CATCH_MAGNETISM_RADIUS:
 			# Auto-catch the ball (within magnetism radius)
-			velocity = Vector2.ZERO
-			direction = Vector2.ZERO
-			set_physics_process(false)
-			set_process(false)
-			collision_layer = 0
-			collision_mask = 0
-			_show_catch_effect()
-			global_position = Vector2(-9999, -9999)
-			hide()
-			caught.emit()
-			call_deferred("queue_free")
+			_catch_now(true)
 			return
 
 	# FALLBACK: Proximity-based catch if collision detection missed
@@ -429,16 +476,7 @@ func _physics_process(delta: float) -> void:
 			var moving_toward: bool = direction.dot(to_player) > -0.3  # Generous threshold
 			if moving_toward:
 				# Catch the ball
-				velocity = Vector2.ZERO
-				direction = Vector2.ZERO
-				set_physics_process(false)
-				set_process(false)
-				collision_layer = 0
-				collision_mask = 0
-				global_position = Vector2(-9999, -9999)
-				hide()
-				caught.emit()
-				call_deferred("queue_free")
+				_catch_now(false)
 				return
 
 
@@ -454,20 +492,17 @@ func set_direction(dir: Vector2) -> void:
 
 
 func despawn() -> void:
+	if not is_in_play():
+		return
+	lifecycle = Lifecycle.DESPAWNED
 	despawned.emit()
-	# Return to pool if pooled, otherwise free
-	if has_meta("pooled") and PoolManager:
-		reset()
-		set_physics_process(false)
-		hide()
-		PoolManager.release_ball(self)
-	else:
-		queue_free()
+	_release()
 
 
 func _start_return() -> void:
 	"""Start returning to player - ball homes toward player position"""
 	is_returning = true
+	lifecycle = Lifecycle.RETURNING
 	# Set direction toward player (will be updated each frame)
 	_update_return_direction()
 	# Visual feedback - slight tint to show returning state
@@ -482,45 +517,83 @@ func _update_return_direction() -> void:
 
 func _get_player_position() -> Vector2:
 	"""Get the current player position for homing"""
-	var players := get_tree().get_nodes_in_group("player")
-	if players.size() > 0:
-		return players[0].global_position
+	var player := EntityRegistry.get_player()
+	if player:
+		return player.global_position
 	# Fallback: aim at center-top of screen if no player found
 	return Vector2(360, 300)
 
 
 func return_to_player() -> void:
 	"""Ball has completed return to player area - return to pool"""
+	if not is_in_play():
+		return
+	lifecycle = Lifecycle.DESPAWNED
 	returned.emit()
-	# Return to pool if pooled, otherwise free
-	if has_meta("pooled") and PoolManager:
-		reset()
-		# Hide AFTER reset (reset re-enables visibility for pool reuse)
-		set_physics_process(false)
-		hide()
-		PoolManager.release_ball(self)
-	else:
-		queue_free()
+	_release()
 
 
 func catch() -> bool:
 	"""Attempt to catch the ball - returns true if successful (ball was catchable)"""
-	if not is_catchable:
+	if not is_catchable or not is_in_play():
 		return false
 
-	caught.emit()
-	_show_catch_effect()
-	queue_free()
+	_catch_now(true)
 	return true
 
 
 func _catch_on_collision() -> void:
 	"""Catch ball when it collides with player."""
+	if not is_in_play():
+		return
+	_catch_now(true)
+
+
+func _catch_now(show_effect: bool) -> void:
+	"""Caught by the player: stop, hide, notify, then release once physics is done"""
+	lifecycle = Lifecycle.CAUGHT
+	if show_effect:
+		_show_catch_effect()
+
+	# Disable everything
+	velocity = Vector2.ZERO
+	direction = Vector2.ZERO
+	set_physics_process(false)
+	set_process(false)
+	collision_layer = 0
+	collision_mask = 0
+
+	# Move offscreen and hide
+	global_position = Vector2(-9999, -9999)
+	hide()
+
+	# Emit caught signal (allows spawner to reload)
 	caught.emit()
-	_show_catch_effect()
 
-	# Always queue_free when caught - simpler and more reliable
-	queue_free()
+	# Deferred: we may be inside a physics callback
+	_release.call_deferred()
+
+
+func is_in_play() -> bool:
+	"""In flight or returning (not caught, despawned or sitting in the pool)"""
+	return lifecycle == Lifecycle.IN_FLIGHT or lifecycle == Lifecycle.RETURNING
+
+
+func _release() -> void:
+	"""Final step of every exit path: back to PoolManager if pooled, otherwise freed"""
+	if lifecycle == Lifecycle.POOLED:
+		return  # Already released
+	_unregister_ball()
+	if has_meta("pooled") and PoolManager:
+		reset()
+		# Hide AFTER reset (reset re-enables visibility for pool reuse)
+		set_physics_process(false)
+		hide()
+		lifecycle = Lifecycle.POOLED
+		PoolManager.release_ball(self)
+	else:
+		lifecycle = Lifecycle.POOLED
+		queue_free()
 
 
 func _show_catch_effect() -> void:
@@ -582,7 +655,8 @@ func reset() -> void:
 	registry_type = -1
 
 	# Clear trail
-	_trail_points.clear()
+	_trail_head = 0
+	_trail_count = 0
 	_trail_redraw_counter = 0
 	if _particle_trail:
 		_particle_trail.queue_free()
@@ -598,6 +672,9 @@ func reset() -> void:
 	fused_effects.clear()
 	is_returning = false
 	is_catchable = false
+	if _default_collision_layer != 0:
+		collision_layer = _default_collision_layer
+		collision_mask = _default_collision_mask
 
 	# Reset visual state
 	modulate = Color.WHITE
@@ -607,13 +684,24 @@ func reset() -> void:
 	set_physics_process(true)  # Re-enable physics (may have been disabled on catch)
 
 	# Reset collision shape to default radius
-	var collision := get_node_or_null("CollisionShape2D")
-	if collision and collision.shape is CircleShape2D:
-		collision.shape.radius = radius
+	set_collision_radius(radius)
 
 	queue_redraw()
 
 
+func set_collision_radius(new_radius: float) -> void:
+	"""Swap in a cached shape of this radius (shapes are shared, never resized in place)"""
+	var collision := get_node_or_null("CollisionShape2D") as CollisionShape2D
+	if not collision:
+		return
+	var shape: Shape2D = PoolManager.get_circle_shape(new_radius) if PoolManager else null
+	if not shape:
+		shape = CircleShape2D.new()
+		shape.radius = new_radius
+	if collision.shape != shape:
+		collision.shape = shape
+
+
 func _apply_ball_type_effect(enemy: Node2D, _base_damage: int) -> void:
 	match ball_type:
 		BallType.FIRE:
@@ -781,22 +869,14 @@ func _chain_lightning(hit_enemy: Node2D) -> void:
 	var chains_done: int = 0
 
 	# Find nearby enemies
-	var enemies_container := get_tree().get_first_node_in_group("enemies_container")
-	if not enemies_container:
-		return
-
-	for child in enemies_container.get_children():
+	for child in EnemyGrid.query_radius(hit_enemy.global_position, chain_range, hit_enemy):
 		if chains_done >= max_chains:
 			break
-		if child is EnemyBase and child != hit_enemy:
-			var dist: float = child.global_position.distance_to(hit_enemy.global_position)
-			if dist < chain_range:
-				# Chain hit
-				if child.has_method("take_damage"):
-					child.take_damage(chain_damage)
-				# Visual lightning arc
-				_draw_lightning_arc(hit_enemy.global_position, child.global_position)
-				chains_done += 1
+		# Chain hit
+		CombatResolver.queue_hit(child, chain_damage)
+		# Visual lightning arc
+		_draw_lightning_arc(hit_enemy.global_position, child.global_position)
+		chains_done += 1
 
 
 func _draw_lightning_arc(from: Vector2, to: Vector2) -> void:
@@ -846,7 +926,7 @@ func _spawn_brood_baby(spawn_pos: Vector2) -> void:
 	baby.direction = Vector2.from_angle(random_angle)
 
 	# Add to game
-	var balls_container := get_tree().get_first_node_in_group("balls_container")
+	var balls_container := EntityRegistry.get_container(EntityRegistry.BALLS_CONTAINER)
 	if balls_container:
 		balls_container.add_child(baby)
 	else:
@@ -882,7 +962,7 @@ func _spawn_cell_clone(bounce_normal: Vector2) -> void:
 	clone.direction = clone.direction.rotated(randf_range(-0.3, 0.3))
 
 	# Add to game
-	var balls_container := get_tree().get_first_node_in_group("balls_container")
+	var balls_container := EntityRegistry.get_container(EntityRegistry.BALLS_CONTAINER)
 	if balls_container:
 		balls_container.add_child(clone)
 	else:
@@ -955,16 +1035,8 @@ func _do_explosion(pos: Vector2, base_damage: int) -> void:
 	var explosion_damage := int(base_damage * 1.5)
 
 	# Find all enemies in radius
-	var enemies_container := get_tree().get_first_node_in_group("enemies_container")
-	if not enemies_container:
-		return
-
-	for child in enemies_container.get_children():
-		if child is EnemyBase:
-			var dist: float = child.global_position.distance_to(pos)
-			if dist < explosion_radius:
-				if child.has_method("take_damage"):
-					child.take_damage(explosion_damage)
+	for child in EnemyGrid.query_radius(pos, explosion_radius):
+		CombatResolver.queue_hit(child, explosion_damage)
 
 	# Visual explosion effect
 	_spawn_explosion_visual(pos, explosion_radius)
@@ -1001,20 +1073,14 @@ func _do_blizzard(hit_enemy: Node2D) -> void:
 		hit_enemy.apply_status_effect(freeze)
 
 	# Find and freeze nearby enemies
-	var enemies_container := get_tree().get_first_node_in_group("enemies_container")
-	if not enemies_container:
-		return
-
-	for child in enemies_container.get_children():
-		if child is EnemyBase and child != hit_enemy and chains_done < chain_count:
-			var dist: float = child.global_position.distance_to(hit_enemy.global_position)
-			if dist < freeze_radius:
-				if child.has_method("apply_status_effect"):
-					var freeze = StatusEffect.new(StatusEffect.Type.FREEZE)
-					child.apply_status_effect(freeze)
-				# Visual ice chain
-				_draw_ice_chain(hit_enemy.global_position, child.global_position)
-				chains_done += 1
+	for child in EnemyGrid.query_radius(hit_enemy.global_position, freeze_radius, hit_enemy):
+		if chains_done >= chain_count:
+			break
+		var freeze = StatusEffect.new(StatusEffect.Type.FREEZE)
+		child.apply_status_effect(freeze)
+		# Visual ice chain
+		_draw_ice_chain(hit_enemy.global_position, child.global_position)
+		chains_done += 1
 
 
 func _draw_ice_chain(from: Vector2, to: Vector2) -> void:
@@ -1044,15 +1110,9 @@ func _do_virus(enemy: Node2D) -> void:
 		enemy.apply_status_effect(bleed)
 
 	# Spread to nearby enemies
-	var enemies_container := get_tree().get_first_node_in_group("enemies_container")
-	if enemies_container:
-		for child in enemies_container.get_children():
-			if child is EnemyBase and child != enemy:
-				var dist: float = child.global_position.distance_to(enemy.global_position)
-				if dist < spread_radius:
-					if child.has_method("apply_status_effect"):
-						var poison = StatusEffect.new(StatusEffect.Type.POISON)
-						child.apply_status_effect(poison)
+	for child in EnemyGrid.query_radius(enemy.global_position, spread_radius, enemy):
+		var poison = StatusEffect.new(StatusEffect.Type.POISON)
+		child.apply_status_effect(poison)
 
 	# Lifesteal - heal player
 	var heal_amount := int(damage * lifesteal_amount)
@@ -1083,18 +1143,11 @@ func _do_magma_pool(pos: Vector2) -> void:
 	timer.wait_time = 0.5
 	timer.autostart = true
 	timer.timeout.connect(func():
-		var enemies_container := get_tree().get_first_node_in_group("enemies_container")
-		if enemies_container:
-			for child in enemies_container.get_children():
-				if child is EnemyBase:
-					var dist: float = child.global_position.distance_to(pos)
-					if dist < pool_radius:
-						if child.has_method("take_damage"):
-							child.take_damage(pool_dps)
-						# Apply burn
-						if child.has_method("apply_status_effect"):
-							var burn = StatusEffect.new(StatusEffect.Type.BURN)
-							child.apply_status_effect(burn)
+		for child in EnemyGrid.query_radius(pos, pool_radius):
+			CombatResolver.queue_hit(child, pool_dps)
+			# Apply burn
+			var burn = StatusEffect.new(StatusEffect.Type.BURN)
+			child.apply_status_effect(burn)
 	)
 	pool.add_child(timer)
 
@@ -1163,23 +1216,14 @@ func _do_storm(enemy: Node2D) -> void:
 		enemy.apply_status_effect(poison)
 
 	# Find and chain to nearby enemies
-	var enemies_container := get_tree().get_first_node_in_group("enemies_container")
-	if not enemies_container:
-		return
-
-	for child in enemies_container.get_children():
+	for child in EnemyGrid.query_radius(enemy.global_position, chain_range, enemy):
 		if chains_done >= chain_count:
 			break
-		if child is EnemyBase and child != enemy:
-			var dist: float = child.global_position.distance_to(enemy.global_position)
-			if dist < chain_range:
-				# Chain damage + poison
-				if child.has_method("take_damage"):
-					child.take_damage(int(damage * 0.5))
-				if child.has_method("apply_status_effect"):
-					var poison = StatusEffect.new(StatusEffect.Type.POISON)
-					child.apply_status_effect(poison)
-				chains_done += 1
+		# Chain damage + poison
+		CombatResolver.queue_hit(child, int(damage * 0.5))
+		var poison = StatusEffect.new(StatusEffect.Type.POISON)
+		child.apply_status_effect(poison)
+		chains_done += 1
 
 
 func _do_plasma(enemy: Node2D) -> void:
@@ -1196,23 +1240,14 @@ func _do_plasma(enemy: Node2D) -> void:
 			enemy.apply_status_effect(bleed)
 
 	# Find and chain to nearby enemies
-	var enemies_container := get_tree().get_first_node_in_group("enemies_container")
-	if not enemies_container:
-		return
-
-	for child in enemies_container.get_children():
+	for child in EnemyGrid.query_radius(enemy.global_position, chain_range, enemy):
 		if chains_done >= chain_count:
 			break
-		if child is EnemyBase and child != enemy:
-			var dist: float = child.global_position.distance_to(enemy.global_position)
-			if dist < chain_range:
-				# Chain damage + bleed
-				if child.has_method("take_damage"):
-					child.take_damage(int(damage * 0.4))
-				if child.has_method("apply_status_effect"):
-					var bleed = StatusEffect.new(StatusEffect.Type.BLEED)
-					child.apply_status_effect(bleed)
-				chains_done += 1
+		# Chain damage + bleed
+		CombatResolver.queue_hit(child, int(damage * 0.4))
+		var bleed = StatusEffect.new(StatusEffect.Type.BLEED)
+		child.apply_status_effect(bleed)
+		chains_done += 1
 
 	# Visual plasma arc effect
 	enemy.modulate = Color(1.0, 0.2, 0.5)
@@ -130,7 +130,7 @@ func fire() -> void:
 	# Add balls to queue (they fire one at a time)
 	var queued_any: bool = false
 	# Include multi-shot bonus from passive evolutions
-	var meta_multi_shot_bonus: int = MetaManager.get_multi_shot_bonus() if MetaManager else 0
+	var meta_multi_shot_bonus: int = GameManager.get_combat_modifiers().meta_multi_shot_bonus
 	var effective_ball_count: int = ball_count + meta_multi_shot_bonus
 
 	for slot_ball_type in slot_balls:
@@ -340,21 +340,26 @@ func _enforce_ball_limit(balls_to_add: int) -> void:
 	if max_balls <= 0 or not balls_container:
 		return
 
-	var current_count := balls_container.get_child_count()
+	var current_count := EntityRegistry.get_ball_count()
 	var available_slots := max_balls - current_count
 	var need_to_remove := balls_to_add - available_slots
 
 	if need_to_remove <= 0:
 		return
 
-	# Despawn oldest balls first (they're at the front of the child list)
-	for i in range(need_to_remove):
-		if balls_container.get_child_count() > 0:
-			var oldest := balls_container.get_child(0)
-			if oldest.has_method("despawn"):
+	# Despawn oldest balls first (they're at the front of the child list).
+	# Caught balls awaiting their deferred release don't count as removable.
+	var removed := 0
+	for oldest in balls_container.get_children():
+		if removed >= need_to_remove:
+			break
+		if oldest.has_method("is_in_play"):
+			if oldest.is_in_play():
 				oldest.despawn()
-			else:
-				oldest.queue_free()
+				removed += 1
+		elif not oldest.is_queued_for_deletion():
+			oldest.queue_free()
+			removed += 1
 
 
 func _spawn_ball(direction: Vector2) -> void:
@@ -387,11 +392,12 @@ func _spawn_evolved_ball(direction: Vector2, evolved_type: int) -> void:
 	var speed_mult: float = GameManager.character_speed_mult
 
 	# Get MetaManager permanent bonuses
-	var meta_damage_bonus: float = MetaManager.get_damage_bonus() if MetaManager else 0.0
-	var meta_speed_bonus: float = MetaManager.get_ball_speed_bonus() if MetaManager else 0.0
-	var meta_pierce_bonus: int = MetaManager.get_piercing_bonus() if MetaManager else 0
-	var meta_ricochet_bonus: int = MetaManager.get_ricochet_bonus() if MetaManager else 0
-	var meta_crit_bonus: float = MetaManager.get_critical_bonus() if MetaManager else 0.0
+	var mods := GameManager.get_combat_modifiers()
+	var meta_damage_bonus: float = mods.meta_damage_bonus
+	var meta_speed_bonus: float = mods.meta_speed_bonus
+	var meta_pierce_bonus: int = mods.meta_pierce_bonus
+	var meta_ricochet_bonus: int = mods.meta_ricochet_bonus
+	var meta_crit_bonus: float = mods.meta_crit_bonus
 
 	ball.damage = int(base_damage * tier_mult * level_mult) + _damage_bonus + int(meta_damage_bonus)
 	ball.speed = (base_speed + _speed_bonus + meta_speed_bonus) * speed_mult
@@ -437,16 +443,15 @@ func _spawn_ball_typed(direction: Vector2, registry_ball_type: int) -> void:
 
 	# Apply ball radius (for experiment mode tuning)
 	ball.radius = ball_radius
-	var collision := ball.get_node_or_null("CollisionShape2D")
-	if collision and collision.shape is CircleShape2D:
-		collision.shape.radius = ball_radius
+	ball.set_collision_radius(ball_radius)
 
 	# Get MetaManager permanent bonuses (shop upgrades + passive evolutions)
-	var meta_damage_bonus: float = MetaManager.get_damage_bonus() if MetaManager else 0.0
-	var meta_speed_bonus: float = MetaManager.get_ball_speed_bonus() if MetaManager else 0.0
-	var meta_pierce_bonus: int = MetaManager.get_piercing_bonus() if MetaManager else 0
-	var meta_ricochet_bonus: int = MetaManager.get_ricochet_bonus() if MetaManager else 0
-	var meta_crit_bonus: float = MetaManager.get_critical_bonus() if MetaManager else 0.0
+	var mods := GameManager.get_combat_modifiers()
+	var meta_damage_bonus: float = mods.meta_damage_bonus
+	var meta_speed_bonus: float = mods.meta_speed_bonus
+	var meta_pierce_bonus: int = mods.meta_pierce_bonus
+	var meta_ricochet_bonus: int = mods.meta_ricochet_bonus
+	var meta_crit_bonus: float = mods.meta_crit_bonus
 
 	# Get stats from BallRegistry for the specific ball type
 	var use_registry := BallRegistry != null and BallRegistry.owned_balls.size() > 0
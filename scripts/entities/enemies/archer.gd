@@ -34,6 +34,12 @@ func _ready() -> void:
 	super._ready()
 
 
+func reset() -> void:
+	super.reset()
+	_shoot_timer = 1.0
+	_is_hovering = false
+
+
 func _move(delta: float) -> void:
 	# Descend until reaching hover position
 	if not _is_hovering and global_position.y < HOVER_Y:
@@ -88,8 +94,10 @@ func _shoot_at_player() -> void:
 func _flash_shoot() -> void:
 	# Brief white flash when shooting
 	modulate = Color(1.5, 1.5, 1.5)
-	var tween := create_tween()
-	tween.tween_property(self, "modulate", Color.WHITE, 0.15)
+	if _flash_tween and _flash_tween.is_valid():
+		_flash_tween.kill()
+	_flash_tween = create_tween()
+	_flash_tween.tween_property(self, "modulate", Color.WHITE, 0.15)
 
 
 func _draw() -> void:
@@ -21,6 +21,11 @@ func _ready() -> void:
 	super._ready()
 
 
+func reset() -> void:
+	super.reset()
+	_zigzag_time = 0.0
+
+
 func _move(delta: float) -> void:
 	_zigzag_time += delta
 
@@ -28,6 +28,12 @@ func _ready() -> void:
 	super._ready()
 
 
+func reset() -> void:
+	super.reset()
+	_is_exploding = false
+	_fuse_flicker = 0.0
+
+
 func _process(delta: float) -> void:
 	# Animate fuse
 	_fuse_flicker += delta * 15.0
@@ -58,20 +64,12 @@ func _explode() -> void:
 
 
 func _damage_nearby_enemies() -> void:
-	var enemies_container := get_tree().get_first_node_in_group("enemies_container")
-	if not enemies_container:
-		return
-
-	for enemy in enemies_container.get_children():
-		if enemy == self:
-			continue
-		if enemy is EnemyBase:
-			var dist: float = global_position.distance_to(enemy.global_position)
-			if dist <= EXPLOSION_RADIUS:
-				# Damage scales with distance
-				var damage_mult := 1.0 - (dist / EXPLOSION_RADIUS)
-				var damage := int(EXPLOSION_DAMAGE_TO_ENEMIES * damage_mult)
-				enemy.take_damage(damage)
+	for enemy in EnemyGrid.query_radius(global_position, EXPLOSION_RADIUS, self):
+		var dist: float = global_position.distance_to(enemy.global_position)
+		# Damage scales with distance
+		var damage_mult := 1.0 - (dist / EXPLOSION_RADIUS)
+		var damage := int(EXPLOSION_DAMAGE_TO_ENEMIES * damage_mult)
+		enemy.take_damage(damage)
 
 
 func _damage_player_if_close() -> void:
@@ -79,8 +79,7 @@ func _physics_process(delta: float) -> void:
 		return
 
 	# Skip EnemyBase movement/attack logic - bosses have their own
-	_process_status_effects(delta)
-
+	# (status effects advance in StatusEffectSystem)
 	match current_phase:
 		BossPhase.INTRO:
 			_process_intro(delta)
@@ -123,21 +122,26 @@ func _on_phase_enter(_phase: BossPhase) -> void:
 
 # === DAMAGE & PHASE TRANSITIONS ===
 
-func take_damage(amount: int, is_crit: bool = false) -> void:
+func take_batched_damage(amount: int, is_crit: bool = false) -> int:
 	if is_invulnerable:
 		# Visual feedback for invulnerable hit
 		_flash_invulnerable()
-		return
+		return 0
 
-	super.take_damage(amount, is_crit)
+	var dealt := super.take_batched_damage(amount, is_crit)
 	_check_phase_transition()
+	return dealt
 
 
 func take_damage_at_position(amount: int, hit_position: Vector2, is_crit: bool = false) -> void:
 	## Called when damage is dealt at a specific position (e.g., from a ball hit).
+	take_damage(int(amount * get_hit_multiplier(hit_position)), is_crit)
+
+
+func get_hit_multiplier(_hit_position: Vector2) -> float:
+	## Damage multiplier for a hit at a global position.
 	## Override in subclasses to implement weak point systems.
-	## Default behavior: ignore position and call regular take_damage.
-	take_damage(amount, is_crit)
+	return 1.0
 
 
 func _flash_invulnerable() -> void:
@@ -335,7 +339,7 @@ func spawn_adds(enemy_scene: PackedScene, count: int, spread: float = 100.0) ->
 		return spawned
 
 	for i in count:
-		var enemy := enemy_scene.instantiate() as EnemyBase
+		var enemy := PoolManager.get_enemy(enemy_scene) as EnemyBase
 		var offset := Vector2(randf_range(-spread, spread), randf_range(-spread, spread))
 		enemy.global_position = global_position + offset
 		enemies_container.add_child(enemy)
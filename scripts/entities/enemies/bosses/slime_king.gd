@@ -115,18 +115,13 @@ func _draw_crown() -> void:
 
 const WEAK_POINT_MULTIPLIER: float = 2.0
 
-func take_damage_at_position(amount: int, hit_position: Vector2, is_crit: bool = false) -> void:
+func get_hit_multiplier(hit_position: Vector2) -> float:
 	## Crown takes 2x damage as a weak point
-	var local_hit := to_local(hit_position)
-
-	if _is_crown_hit(local_hit):
-		# Weak point hit - 2x damage with visual feedback
-		var boosted_damage := int(amount * WEAK_POINT_MULTIPLIER)
-		take_damage(boosted_damage, is_crit)
+	if _is_crown_hit(to_local(hit_position)):
+		# Weak point hit - visual feedback
 		_flash_crown_hit()
-	else:
-		# Normal hit
-		take_damage(amount, is_crit)
+		return WEAK_POINT_MULTIPLIER
+	return 1.0
 
 
 func take_damage_at_position_xy(amount: int, hit_x: float, hit_y: float) -> void:
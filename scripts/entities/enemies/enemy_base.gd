@@ -21,6 +21,8 @@ const ATTACK_SPEED: float = 600.0  # Speed when lunging at player
 const ATTACK_SELF_DAMAGE: int = 3  # HP lost per attack attempt
 const ATTACK_COOLDOWN: float = 0.5  # Seconds before enemy can attack again after completing an attack
 const POST_ATTACK_SNAP_OFFSET: float = 100.0  # How far above player to snap after attack
+const HIT_SHAKE_INTENSITY: float = 3.0  # Small shake per direct hit (once per frame when batched)
+const HIT_SHAKE_DECAY: float = 8.0
 
 # Hemorrhage: Triggers at 12+ bleed stacks, deals 20% of current HP
 const HEMORRHAGE_THRESHOLD: int = 12  # Bleed stacks required to trigger
@@ -35,9 +37,17 @@ var _pre_attack_position: Vector2 = Vector2.ZERO  # Position before attack, to s
 var _shake_offset: Vector2 = Vector2.ZERO
 var _exclamation_label: Label
 var _pulse_tween: Tween
-
-# Status effect tracking
-var _active_effects: Dictionary = {}  # StatusEffect.Type -> StatusEffect
+var formation_follower: bool = false  # Placed by FormationSystem instead of _move()
+
+# Status effect tracking (effect state lives in StatusEffectSystem)
+var _status_types := PackedInt32Array()  # Active StatusEffect.Type values, in application order
+var _status_slots := PackedInt32Array()  # StatusEffectSystem slot for each entry in _status_types
+var _active_effects: Dictionary:  # Read-only view: StatusEffect.Type -> StatusEffect copy
+	get:
+		var view := {}
+		for i in range(_status_types.size()):
+			view[_status_types[i]] = StatusEffectSystem.make_effect(_status_slots[i])
+		return view
 var _base_speed: float = 0.0  # Original speed before slow effects
 var _effect_tint: Color = Color.WHITE  # Combined tint from active effects
 var _effect_particles: Dictionary = {}  # StatusEffect.Type -> GPUParticles2D
@@ -52,6 +62,7 @@ const DISEASE_PARTICLES_SCENE: PackedScene = preload("res://scenes/effects/disea
 const FROSTBURN_PARTICLES_SCENE: PackedScene = preload("res://scenes/effects/frostburn_particles.tscn")
 const WIND_PARTICLES_SCENE: PackedScene = preload("res://scenes/effects/wind_particles.tscn")
 const CHARM_PARTICLES_SCENE: PackedScene = preload("res://scenes/effects/charm_particles.tscn")
+const HIT_PARTICLES_SCENE: PackedScene = preload("res://scenes/effects/hit_particles.tscn")
 
 @export var max_hp: int = 10
 @export var speed: float = 60.0  # Slower base speed for BallxPit-style pacing
@@ -66,8 +77,42 @@ var hp: int:
 
 var _flash_tween: Tween
 
+# Pooling
+var spawn_generation: int = 0  # Bumped on every reset(), so stale references can tell reuse apart
+var _spawn_stats: Dictionary = {}  # Exported stats as instantiated, before type/wave scaling
+var _despawning: bool = false
+var _registry_type: StringName = &""  # EntityRegistry enemy type while counted
+
+
+func _notification(what: int) -> void:
+	if what == NOTIFICATION_SCENE_INSTANTIATED:
+		_spawn_stats = {
+			"max_hp": max_hp,
+			"speed": speed,
+			"damage_to_player": damage_to_player,
+			"xp_value": xp_value,
+		}
+
+
+func _enter_tree() -> void:
+	if _registry_type == &"":
+		var source := scene_file_path if scene_file_path != "" else get_script().resource_path
+		_registry_type = StringName(source.get_file().get_basename())
+		EntityRegistry.enemy_entered(_registry_type)
+
+
+func _exit_tree() -> void:
+	_unregister_enemy()
+
+
+func _unregister_enemy() -> void:
+	if _registry_type != &"":
+		EntityRegistry.enemy_exited(_registry_type)
+		_registry_type = &""
+
 
 func _ready() -> void:
+	current_state = State.DESCENDING  # Pooled enemies re-enter here after reset()
 	_scale_with_wave()
 	hp = max_hp
 	_base_speed = speed  # Store original speed for slow calculations
@@ -94,9 +139,6 @@ func _physics_process(delta: float) -> void:
 	if GameManager.current_state != GameManager.GameState.PLAYING:
 		return
 
-	# Process status effects first
-	_process_status_effects(delta)
-
 	# Process attack cooldown
 	if _attack_cooldown_timer > 0:
 		_attack_cooldown_timer -= delta
@@ -108,7 +150,8 @@ func _physics_process(delta: float) -> void:
 
 	match current_state:
 		State.DESCENDING:
-			_move(delta)
+			if not formation_follower:
+				_move(delta)
 			_check_danger_zone()
 			# Check if we should enter warning state (when at or below player's Y level)
 			if _should_attack():
@@ -175,32 +218,40 @@ func _draw() -> void:
 
 
 func take_damage(amount: int, is_crit: bool = false) -> void:
+	var dealt := take_batched_damage(amount, is_crit)
+	if dealt > 0:
+		GameManager.record_damage_dealt(dealt)
+		CameraShake.shake(HIT_SHAKE_INTENSITY, HIT_SHAKE_DECAY)
+
+
+func take_batched_damage(amount: int, is_crit: bool = false) -> int:
+	"""Apply a (possibly merged) hit without the per-hit extras: no camera shake
+	and no damage recording - CombatResolver does those once per frame.
+	Returns the damage dealt (0 for executes, which record their own)."""
 	# Apply damage amplification from status effects (Radiation, Frostburn)
 	var amplified_amount := _apply_damage_amplification(amount)
 
 	# Execute mechanic: Crits on low-HP enemies = instant kill
 	if is_crit:
-		var execute_threshold := GameManager.get_execute_threshold()
+		var execute_threshold := GameManager.get_combat_modifiers().execute_threshold
 		if execute_threshold > 0:
 			var hp_percent := float(hp) / float(max_hp)
 			if hp_percent < execute_threshold:
 				_execute_kill()
-				return
+				return 0
 
 	hp -= amplified_amount
 	took_damage.emit(self, amplified_amount)
-	GameManager.record_damage_dealt(amplified_amount)
 	_flash_hit()
 	_spawn_hit_effects(amplified_amount)
+	return amplified_amount
 
 
 func _apply_damage_amplification(base_damage: int) -> int:
 	"""Apply damage amplification from active status effects"""
-	var amp_mult: float = 1.0
-	for effect_type in _active_effects:
-		var effect: StatusEffect = _active_effects[effect_type]
-		amp_mult += effect.get_damage_amplification()
-	return int(base_damage * amp_mult)
+	if _status_slots.is_empty():
+		return base_damage
+	return int(base_damage * StatusEffectSystem.get_damage_amplification(_status_slots))
 
 
 func _flash_hit() -> void:
@@ -214,16 +265,10 @@ func _flash_hit() -> void:
 
 
 func _spawn_hit_effects(damage: int) -> void:
-	# Small screen shake
-	CameraShake.shake(3.0, 8.0)
-
 	var scene_root := get_tree().current_scene
 
-	# Spawn hit particles
-	var particles_scene := preload("res://scenes/effects/hit_particles.tscn")
-	var particles := particles_scene.instantiate()
-	particles.position = global_position
-	scene_root.add_child(particles)
+	# Spawn hit particles (pooled; skipped when too many emitters are live)
+	PoolManager.spawn_one_shot_particles(HIT_PARTICLES_SCENE, scene_root, global_position)
 
 	# Spawn floating damage number
 	var DamageNumber := preload("res://scripts/effects/damage_number.gd")
@@ -233,19 +278,73 @@ func _spawn_hit_effects(damage: int) -> void:
 func _die() -> void:
 	current_state = State.DEAD
 	# Handle poison spread before dying
-	if _active_effects.has(StatusEffect.Type.POISON):
+	if has_status_effect(StatusEffect.Type.POISON):
 		_spread_poison()
 	# Award 1 XP per kill (multipliers applied in GameManager)
 	GameManager.add_xp(1)
 	# Lifesteal passive: chance to drop health gem on kill
-	var health_gem_chance := GameManager.get_health_gem_chance()
+	var health_gem_chance := GameManager.get_combat_modifiers().health_gem_chance
 	if health_gem_chance > 0 and randf() < health_gem_chance:
 		_spawn_health_gem()
-	# Clean up particle references (nodes will be freed with parent)
-	_effect_particles.clear()
+	# Free effect particles now - pooled enemies keep their children
+	_remove_all_effect_particles()
 	SoundManager.play(SoundManager.SoundType.ENEMY_DEATH)
 	died.emit(self)
-	queue_free()
+	despawn()
+
+
+func despawn() -> void:
+	"""Remove from play: back to PoolManager if pooled, otherwise freed"""
+	if _despawning:
+		return
+	_despawning = true
+	current_state = State.DEAD
+	FormationSystem.remove_member(self)
+	_unregister_enemy()
+	if has_meta("pooled"):
+		# Deferred like queue_free - we may be inside a physics or signal callback
+		PoolManager.release_enemy.call_deferred(self)
+	else:
+		queue_free()
+
+
+func reset() -> void:
+	"""Clear per-life state so PoolManager can reuse this enemy.
+	Stays DEAD until re-added to the tree, where _ready re-applies type and wave scaling."""
+	# Drop everything connected by spawners, formations and the game controller
+	for sig in get_script().get_script_signal_list():
+		for connection in get_signal_connection_list(sig["name"]):
+			if connection["callable"].get_object() != self:
+				disconnect(sig["name"], connection["callable"])
+
+	if _flash_tween and _flash_tween.is_valid():
+		_flash_tween.kill()
+	_flash_tween = null
+	_hide_exclamation()
+	_clear_status_state()
+	_remove_all_effect_particles()
+	_effect_tint = Color.WHITE
+	modulate = Color.WHITE
+
+	current_state = State.DEAD
+	in_danger_zone = false
+	_warning_timer = 0.0
+	_attack_cooldown_timer = 0.0
+	_attack_target = Vector2.ZERO
+	_pre_attack_position = Vector2.ZERO
+	_shake_offset = Vector2.ZERO
+	velocity = Vector2.ZERO
+	formation_follower = false
+	spawn_generation += 1
+	_despawning = false
+
+	# Restore unscaled stats (hp is set from max_hp in _ready)
+	if not _spawn_stats.is_empty():
+		max_hp = _spawn_stats["max_hp"]
+		speed = _spawn_stats["speed"]
+		damage_to_player = _spawn_stats["damage_to_player"]
+		xp_value = _spawn_stats["xp_value"]
+	request_ready()
 
 
 func _execute_kill() -> void:
@@ -292,6 +391,11 @@ func _show_execute_effect() -> void:
 
 func _spawn_health_gem() -> void:
 	# Spawn a healing gem at death location
+	var gem_field := EntityRegistry.get_gem_field()
+	if gem_field:
+		gem_field.spawn_gem(global_position, true)
+		return
+	# Scenes without a GemField use standalone gem nodes
 	var gem: Node
 	if PoolManager:
 		gem = PoolManager.get_gem()
@@ -301,16 +405,18 @@ func _spawn_health_gem() -> void:
 	gem.global_position = global_position
 	gem.xp_value = 0  # No XP, just healing
 	gem.is_health_gem = true  # Mark as health gem for special effect
-	var gems_container := get_tree().get_first_node_in_group("gems_container")
+	var gems_container := EntityRegistry.get_container(EntityRegistry.GEMS_CONTAINER)
 	if gems_container:
 		gems_container.add_child(gem)
 		# Re-acquire player reference after being added to tree
-		gem._player = get_tree().get_first_node_in_group("player")
+		gem._player = EntityRegistry.get_player()
 
 
 # === WARNING STATE ===
 
 func _enter_warning_state() -> void:
+	# Break formation - the warning shake and lunge move us on our own
+	FormationSystem.remove_member(self)
 	current_state = State.WARNING
 	_warning_timer = WARNING_DURATION
 	_pre_attack_position = global_position  # Remember where we were
@@ -383,8 +489,11 @@ func _enter_attack_state() -> void:
 
 	# Flash white briefly when attacking
 	modulate = Color(1.5, 1.5, 1.5)
-	var tween := create_tween()
-	tween.tween_property(self, "modulate", Color.WHITE, 0.1)
+	# Through _flash_tween so reset() stops it if the enemy is pooled mid-attack
+	if _flash_tween and _flash_tween.is_valid():
+		_flash_tween.kill()
+	_flash_tween = create_tween()
+	_flash_tween.tween_property(self, "modulate", Color.WHITE, 0.1)
 
 
 func _do_attack(delta: float) -> void:
@@ -412,7 +521,7 @@ func _do_attack(delta: float) -> void:
 
 	# Despawn if off-screen (fell off the map)
 	if global_position.y > 1400 or global_position.y < -50:
-		queue_free()
+		despawn()
 		return
 
 	# If we've overshot the target, complete this attack attempt
@@ -455,10 +564,7 @@ func _get_player_position() -> Vector2:
 
 
 func _get_player_node() -> Node2D:
-	var players := get_tree().get_nodes_in_group("player")
-	if players.size() > 0:
-		return players[0] as Node2D
-	return null
+	return EntityRegistry.get_player()
 
 
 # === CHARM BEHAVIOR (Mind Control) ===
@@ -493,28 +599,11 @@ func _do_charmed_behavior(delta: float) -> void:
 
 func _find_nearest_enemy_target() -> EnemyBase:
 	"""Find the nearest non-charmed, alive enemy to attack"""
-	var enemies_container := get_tree().get_first_node_in_group("enemies_container")
-	if not enemies_container:
+	# Skip charmed enemies (allies don't attack each other); dead ones are skipped by the grid
+	var nearest := EnemyGrid.query_nearest(global_position, 1, self, func(e: EnemyBase) -> bool: return not e.is_charmed())
+	if nearest.is_empty():
 		return null
-
-	var nearest: EnemyBase = null
-	var nearest_dist: float = INF
-
-	for child in enemies_container.get_children():
-		if child is EnemyBase and child != self:
-			# Skip charmed enemies (allies don't attack each other)
-			if child.is_charmed():
-				continue
-			# Skip dead enemies
-			if child.current_state == State.DEAD:
-				continue
-
-			var dist: float = global_position.distance_to(child.global_position)
-			if dist < nearest_dist:
-				nearest_dist = dist
-				nearest = child
-
-	return nearest
+	return nearest[0]
 
 
 func _attack_enemy_target(target: EnemyBase) -> void:
@@ -524,8 +613,10 @@ func _attack_enemy_target(target: EnemyBase) -> void:
 
 	# Visual feedback - flash both attacker and target
 	modulate = Color(1.5, 0.5, 1.0)  # Pink flash
-	var tween := create_tween()
-	tween.tween_property(self, "modulate", _get_charm_tint(), 0.2)
+	if _flash_tween and _flash_tween.is_valid():
+		_flash_tween.kill()
+	_flash_tween = create_tween()
+	_flash_tween.tween_property(self, "modulate", _get_charm_tint(), 0.2)
 
 	# Knockback/separation to prevent continuous attacking
 	var knockback_dir := (global_position - target.global_position).normalized()
@@ -560,20 +651,22 @@ func apply_status_effect(effect: StatusEffect) -> void:
 	var effect_type := effect.type
 
 	# Check for existing effect of same type
-	if _active_effects.has(effect_type):
-		var existing: StatusEffect = _active_effects[effect_type]
+	var index := _status_types.find(effect_type)
+	if index >= 0:
+		var slot := _status_slots[index]
 		if effect.max_stacks > 1:
-			existing.add_stack()
-			existing.refresh()
+			StatusEffectSystem.add_stack(slot)
+			StatusEffectSystem.refresh(slot)
 			# Check for hemorrhage trigger on bleed stack
 			if effect_type == StatusEffect.Type.BLEED:
-				_check_hemorrhage(existing)
+				_check_hemorrhage(StatusEffectSystem.get_stacks(slot))
 		else:
-			existing.refresh()
+			StatusEffectSystem.refresh(slot)
 	else:
-		# New effect
-		effect.apply()
-		_active_effects[effect_type] = effect
+		# New effect (the system copies its configuration)
+		StatusEffectSystem.add_effect(self, effect)
+		if effect_type == StatusEffect.Type.CHARM:
+			FormationSystem.remove_member(self)
 		status_effect_applied.emit(self, effect_type)
 
 	# Apply on-hit damage (for effects like BLEED that deal instant damage on application)
@@ -586,9 +679,9 @@ func apply_status_effect(effect: StatusEffect) -> void:
 	_update_effect_visuals()
 
 
-func _check_hemorrhage(bleed_effect: StatusEffect) -> void:
+func _check_hemorrhage(bleed_stacks: int) -> void:
 	"""Check if bleed stacks trigger hemorrhage (20% current HP damage at 12+ stacks)"""
-	if bleed_effect.stacks >= HEMORRHAGE_THRESHOLD:
+	if bleed_stacks >= HEMORRHAGE_THRESHOLD:
 		_trigger_hemorrhage()
 
 
@@ -637,50 +730,48 @@ func _show_hemorrhage_effect(damage: int) -> void:
 	_flash_tween.tween_property(self, "modulate", Color.WHITE, 0.2)
 
 
-func _process_status_effects(delta: float) -> void:
-	"""Process all active status effects each frame"""
-	if _active_effects.is_empty():
-		return
+# Called by StatusEffectSystem, which advances every enemy's effects in one loop
+
+func _on_status_added(effect_type: int, slot: int) -> void:
+	_status_types.append(effect_type)
+	_status_slots.append(slot)
 
-	var expired_effects: Array[int] = []
-	var total_dot_damage: int = 0
 
-	for effect_type in _active_effects:
-		var effect: StatusEffect = _active_effects[effect_type]
-		var damage := effect.update(delta)
-		total_dot_damage += damage
+func _on_status_slot_moved(effect_type: int, slot: int) -> void:
+	_status_slots[_status_types.find(effect_type)] = slot
 
-		if effect.is_expired():
-			expired_effects.append(effect_type)
 
-	# Apply DoT damage
-	if total_dot_damage > 0:
-		_take_dot_damage(total_dot_damage)
+func _on_status_removed(effect_type: int) -> void:
+	var index := _status_types.find(effect_type)
+	_status_types.remove_at(index)
+	_status_slots.remove_at(index)
+
+
+func _on_status_effects_changed() -> void:
+	"""Some effects expired this frame"""
+	_update_speed_from_effects()
+	_update_effect_visuals()
 
-	# Remove expired effects
-	for effect_type in expired_effects:
-		_active_effects.erase(effect_type)
 
-	if expired_effects.size() > 0:
-		_update_speed_from_effects()
-		_update_effect_visuals()
+func _clear_status_state() -> void:
+	StatusEffectSystem.remove_enemy(self, _status_slots)
+	_status_types.clear()
+	_status_slots.clear()
 
 
 func _take_dot_damage(amount: int) -> void:
-	"""Take damage from DoT effects - subtle visual feedback"""
+	"""Take this frame's summed DoT damage - subtle visual feedback.
+	StatusEffectSystem shakes the camera once per frame for all DoT ticks."""
 	hp -= amount
 	GameManager.record_damage_dealt(amount)
 
 	# Subtle flash (less intense than direct hit)
 	_flash_dot()
 
-	# Very subtle screen shake (less than direct hit)
-	CameraShake.shake(1.0, 10.0)
-
-	# Spawn smaller damage number for DoT
+	# Spawn damage number for DoT (ticks on this enemy are summed over a short window)
 	var scene_root := get_tree().current_scene
 	var DamageNumber := preload("res://scripts/effects/damage_number.gd")
-	DamageNumber.spawn(scene_root, global_position + Vector2(randf_range(-20, 20), -10), amount, Color(1, 0.5, 0.2))
+	DamageNumber.spawn_tick(scene_root, self, global_position + Vector2(randf_range(-20, 20), -10), amount, Color(1, 0.5, 0.2))
 
 
 func _take_on_hit_damage(amount: int) -> void:
@@ -725,7 +816,7 @@ func _get_dominant_effect_color() -> Color:
 	}
 
 	# Return color of first damaging effect found
-	for effect_type in _active_effects:
+	for effect_type in _status_types:
 		if effect_type in colors:
 			return colors[effect_type]
 
@@ -734,19 +825,12 @@ func _get_dominant_effect_color() -> Color:
 
 func _update_speed_from_effects() -> void:
 	"""Recalculate speed based on active slow effects"""
-	var slow_mult: float = 1.0
-
-	for effect_type in _active_effects:
-		var effect: StatusEffect = _active_effects[effect_type]
-		if effect.slow_multiplier < slow_mult:
-			slow_mult = effect.slow_multiplier
-
-	speed = _base_speed * slow_mult
+	speed = _base_speed * StatusEffectSystem.get_slow_multiplier(_status_slots)
 
 
 func _update_effect_visuals() -> void:
 	"""Update visual tint and particles based on active effects"""
-	if _active_effects.is_empty():
+	if _status_types.is_empty():
 		_effect_tint = Color.WHITE
 		_remove_all_effect_particles()
 	else:
@@ -755,9 +839,8 @@ func _update_effect_visuals() -> void:
 		var g: float = 1.0
 		var b: float = 1.0
 
-		for effect_type in _active_effects:
-			var effect: StatusEffect = _active_effects[effect_type]
-			var color := effect.get_color()
+		for effect_type in _status_types:
+			var color := StatusEffect.get_type_color(effect_type)
 			r = max(r, color.r)
 			g = min(g, color.g) if color.g < 1.0 else g
 			b = min(b, color.b) if color.b < 1.0 else b
@@ -803,8 +886,12 @@ func _ensure_effect_particles(effect_type: int) -> void:
 			particle_scene = CHARM_PARTICLES_SCENE
 
 	if particle_scene:
-		var particles: GPUParticles2D = particle_scene.instantiate()
+		var particles := PoolManager.get_particles(particle_scene)
+		if not particles:
+			return  # Live emitter cap reached - tint still shows the effect
+		particles.position = Vector2.ZERO
 		add_child(particles)
+		particles.emitting = true
 		_effect_particles[effect_type] = particles
 
 
@@ -812,22 +899,18 @@ func _cleanup_expired_particles() -> void:
 	"""Remove particles for effects that are no longer active"""
 	var to_remove: Array[int] = []
 	for effect_type in _effect_particles:
-		if not _active_effects.has(effect_type):
+		if not has_status_effect(effect_type):
 			to_remove.append(effect_type)
 
 	for effect_type in to_remove:
-		var particles: GPUParticles2D = _effect_particles[effect_type]
-		if is_instance_valid(particles):
-			particles.queue_free()
+		PoolManager.release_particles(_effect_particles[effect_type])
 		_effect_particles.erase(effect_type)
 
 
 func _remove_all_effect_particles() -> void:
 	"""Remove all effect particles (called on effect clear or death)"""
 	for effect_type in _effect_particles:
-		var particles: GPUParticles2D = _effect_particles[effect_type]
-		if is_instance_valid(particles):
-			particles.queue_free()
+		PoolManager.release_particles(_effect_particles[effect_type])
 	_effect_particles.clear()
 
 
@@ -835,47 +918,42 @@ func _spread_poison() -> void:
 	"""Spread poison to nearby enemies when this enemy dies"""
 	const SPREAD_RADIUS: float = 100.0
 
-	var enemies_container := get_tree().get_first_node_in_group("enemies_container")
-	if not enemies_container:
-		return
-
-	for enemy in enemies_container.get_children():
-		if enemy == self:
-			continue
-		if enemy is EnemyBase:
-			var dist: float = global_position.distance_to(enemy.global_position)
-			if dist <= SPREAD_RADIUS:
-				var poison := StatusEffect.new(StatusEffect.Type.POISON)
-				enemy.apply_status_effect(poison)
+	for enemy in EnemyGrid.query_radius(global_position, SPREAD_RADIUS, self):
+		var poison := StatusEffect.new(StatusEffect.Type.POISON)
+		enemy.apply_status_effect(poison)
 
 
 func has_status_effect(effect_type: StatusEffect.Type) -> bool:
 	"""Check if enemy has a specific status effect"""
-	return _active_effects.has(effect_type)
+	return _status_types.has(effect_type)
 
 
 func is_charmed() -> bool:
 	"""Check if enemy is under charm effect (mind controlled)"""
-	return _active_effects.has(StatusEffect.Type.CHARM)
+	return _status_types.has(StatusEffect.Type.CHARM)
 
 
 func get_status_effect(effect_type: StatusEffect.Type) -> StatusEffect:
-	"""Get a specific status effect if active, null otherwise"""
-	return _active_effects.get(effect_type)
+	"""Get a copy of a specific status effect if active, null otherwise"""
+	var index := _status_types.find(effect_type)
+	if index < 0:
+		return null
+	return StatusEffectSystem.make_effect(_status_slots[index])
 
 
 func clear_status_effects() -> void:
 	"""Remove all status effects"""
-	_active_effects.clear()
+	_clear_status_state()
 	_update_speed_from_effects()
 	_update_effect_visuals()
 
 
 func get_bleed_stacks() -> int:
 	"""Get current bleed stack count (for testing/UI)"""
-	if _active_effects.has(StatusEffect.Type.BLEED):
-		return _active_effects[StatusEffect.Type.BLEED].stacks
-	return 0
+	var index := _status_types.find(StatusEffect.Type.BLEED)
+	if index < 0:
+		return 0
+	return StatusEffectSystem.get_stacks(_status_slots[index])
 
 
 func get_hemorrhage_threshold() -> int:
@@ -42,15 +42,6 @@ const SWARM_GROUP_SIZE_MAX: int = 5
 
 var _spawn_timer: Timer
 var _screen_width: float
-var _active_formations: Array = []  # Track active formation groups
-
-# Lazy-load FormationGroup to avoid class resolution issues
-var _FormationGroupClass: GDScript = null
-
-func _get_formation_group_class() -> GDScript:
-	if _FormationGroupClass == null:
-		_FormationGroupClass = load("res://scripts/entities/enemies/formation_group.gd")
-	return _FormationGroupClass
 
 
 func _ready() -> void:
@@ -59,22 +50,6 @@ func _ready() -> void:
 	_setup_timer()
 
 
-func _physics_process(delta: float) -> void:
-	_update_formations(delta)
-
-
-func _update_formations(delta: float) -> void:
-	"""Update all active formations and clean up dissolved ones"""
-	var to_remove: Array = []
-	for formation in _active_formations:
-		if formation.is_active and formation.has_active_members():
-			formation.update(delta)
-		else:
-			to_remove.append(formation)
-	for formation in to_remove:
-		_active_formations.erase(formation)
-
-
 func _setup_timer() -> void:
 	_spawn_timer = Timer.new()
 	_spawn_timer.one_shot = true
@@ -116,7 +91,7 @@ func spawn_enemy() -> EnemyBase:
 	if scene == swarm_scene:
 		return _spawn_swarm_group()
 
-	var enemy: EnemyBase = scene.instantiate()
+	var enemy: EnemyBase = PoolManager.get_enemy(scene)
 	var spawn_x := randf_range(spawn_margin, _screen_width - spawn_margin)
 	enemy.global_position = Vector2(spawn_x, spawn_y_offset)
 	enemy.died.connect(_on_enemy_died)
@@ -133,7 +108,7 @@ func _spawn_swarm_group() -> EnemyBase:
 	var first_enemy: EnemyBase = null
 
 	for i in range(group_size):
-		var enemy: EnemyBase = swarm_scene.instantiate()
+		var enemy: EnemyBase = PoolManager.get_enemy(swarm_scene)
 		# Spread them in a small cluster
 		var offset_x := randf_range(-40, 40)
 		var offset_y := randf_range(-30, 30)
@@ -303,11 +278,8 @@ func spawn_formation(formation: Formation, count: int = 0) -> Array:
 
 
 func _create_formation_group(enemies: Array) -> void:
-	"""Create a formation group to keep enemies moving together"""
-	var FormationGroupScript := _get_formation_group_class()
-	var formation = FormationGroupScript.new()
-	formation.setup(enemies)
-	_active_formations.append(formation)
+	"""Hand the enemies to FormationSystem so they move together behind enemies[0]"""
+	FormationSystem.add_formation(enemies)
 
 
 func _spawn_line_formation(count: int) -> Array:
@@ -323,7 +295,7 @@ func _spawn_line_formation(count: int) -> Array:
 	var start_x: float = spawn_margin + spacing
 
 	for i in range(count):
-		var enemy: EnemyBase = scene.instantiate()
+		var enemy: EnemyBase = PoolManager.get_enemy(scene)
 		var x_pos: float = start_x + (spacing * i)
 		enemy.global_position = Vector2(x_pos, spawn_y_offset)
 		enemy.died.connect(_on_enemy_died)
@@ -364,7 +336,7 @@ func _spawn_v_formation(count: int) -> Array:
 
 	# Spawn enemies at positions
 	for i in range(mini(count, positions.size())):
-		var enemy: EnemyBase = scene.instantiate()
+		var enemy: EnemyBase = PoolManager.get_enemy(scene)
 		enemy.global_position = positions[i]
 		enemy.died.connect(_on_enemy_died)
 
@@ -386,7 +358,7 @@ func _spawn_cluster_formation(count: int) -> Array:
 	var cluster_radius: float = 40.0
 
 	for i in range(count):
-		var enemy: EnemyBase = scene.instantiate()
+		var enemy: EnemyBase = PoolManager.get_enemy(scene)
 		# Random position within cluster radius
 		var offset_x: float = randf_range(-cluster_radius, cluster_radius)
 		var offset_y: float = randf_range(-cluster_radius, cluster_radius)
@@ -419,7 +391,7 @@ func _spawn_diagonal_formation(count: int) -> Array:
 		start_x = _screen_width - spawn_margin - 50
 
 	for i in range(count):
-		var enemy: EnemyBase = scene.instantiate()
+		var enemy: EnemyBase = PoolManager.get_enemy(scene)
 		var x_offset: float = spacing_x * i * (1 if left_to_right else -1)
 		var y_offset: float = spacing_y * i
 		enemy.global_position = Vector2(start_x + x_offset, spawn_y_offset - y_offset)
@@ -462,7 +434,7 @@ func _spawn_arrow_formation(count: int) -> Array:
 
 	# Spawn enemies at positions
 	for i in range(mini(count, positions.size())):
-		var enemy: EnemyBase = scene.instantiate()
+		var enemy: EnemyBase = PoolManager.get_enemy(scene)
 		enemy.global_position = positions[i]
 		enemy.died.connect(_on_enemy_died)
 
@@ -490,7 +462,7 @@ func _spawn_staggered_formation(count: int) -> Array:
 	# First row (front)
 	var row1_start_x: float = spawn_margin + spacing_x
 	for i in range(enemies_per_row):
-		var enemy: EnemyBase = scene.instantiate()
+		var enemy: EnemyBase = PoolManager.get_enemy(scene)
 		var x_pos: float = row1_start_x + (spacing_x * i)
 		enemy.global_position = Vector2(x_pos, spawn_y_offset)
 		enemy.died.connect(_on_enemy_died)
@@ -504,7 +476,7 @@ func _spawn_staggered_formation(count: int) -> Array:
 	if remaining > 0:
 		var row2_start_x: float = spawn_margin + spacing_x + (spacing_x / 2.0)
 		for i in range(remaining):
-			var enemy: EnemyBase = scene.instantiate()
+			var enemy: EnemyBase = PoolManager.get_enemy(scene)
 			var x_pos: float = row2_start_x + (spacing_x * i)
 			# Clamp to screen bounds
 			x_pos = clampf(x_pos, spawn_margin, _screen_width - spawn_margin)
@@ -546,7 +518,7 @@ func _spawn_wall_formation(count: int) -> Array:
 			if spawned >= count:
 				break
 
-			var enemy: EnemyBase = scene.instantiate()
+			var enemy: EnemyBase = PoolManager.get_enemy(scene)
 			var x_pos: float = row_start_x + (spacing_x * col)
 			enemy.global_position = Vector2(x_pos, row_y)
 			enemy.died.connect(_on_enemy_died)
@@ -26,6 +26,12 @@ func _ready() -> void:
 	super._ready()
 
 
+func reset() -> void:
+	super.reset()
+	_showing_slam_visual = false
+	_slam_visual_timer = 0.0
+
+
 func _process(delta: float) -> void:
 	# Update slam visual timer
 	if _showing_slam_visual:
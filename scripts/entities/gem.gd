@@ -1,5 +1,7 @@
 extends Area2D
 ## Gem entity - spawned from enemies, collected when player touches them
+## The main game simulates gems in one GemField (gem_field.gd); this node
+## version is still used by scenes without one and owns the shared tuning.
 
 signal collected(gem: Node2D)
 
@@ -0,0 +1,188 @@
+extends Node2D
+## GemField - simulates and draws every gem in one node
+## Gems are packed-array entries instead of Area2D nodes with their own
+## _process/_draw: movement mode, magnetism, pickup and despawn run in one
+## loop, and all gems plus attraction lines are drawn in one pass.
+## Behavior and tuning match gem.gd (movement mode is still Gem.movement_mode).
+
+signal collected(gem: Node2D)  ## Emitted once per collected gem (gem is this field)
+
+const Gem := preload("res://scripts/entities/gem.gd")
+
+const GEM_COLOR := Color(0.2, 0.9, 0.5)
+const HEALTH_GEM_COLOR := Color(1.0, 0.4, 0.5)
+const ATTRACT_COLOR := Color(0.5, 1.0, 0.5)
+# Old gems were picked up by Area2D contact: player body (35) + gem shape (18)
+const PICKUP_RADIUS: float = 53.0
+const DESPAWN_TOP: float = -100.0
+const DESPAWN_BOTTOM: float = 1400.0
+
+# Shared gem tuning (same defaults as gem.gd exports)
+@export var radius: float = 14.0
+@export var base_speed: float = 150.0
+@export var sparkle_speed: float = 3.0
+@export var despawn_time: float = 10.0
+
+# Per-gem state (swap-removed, so order is arbitrary)
+var _positions := PackedVector2Array()
+var _ages := PackedFloat32Array()
+var _health := PackedByteArray()
+var _attracted := PackedByteArray()
+
+var _player = null  # Untyped: player can be freed on scene change
+var _collected_total: int = 0
+var _despawned_total: int = 0
+
+
+func _ready() -> void:
+	add_to_group("gem_field")
+	EntityRegistry.register_gem_field(self)
+	top_level = true  # Gem positions are global
+	GameManager.game_started.connect(clear)
+
+
+func spawn_gem(pos: Vector2, is_health_gem: bool = false) -> void:
+	"""Add a gem at a global position (XP is awarded on kill; health gems heal)"""
+	_positions.append(pos)
+	_ages.append(0.0)
+	_health.append(1 if is_health_gem else 0)
+	_attracted.append(0)
+	queue_redraw()
+
+
+func get_gem_count() -> int:
+	return _ages.size()
+
+
+func get_gem_positions() -> PackedVector2Array:
+	"""Global positions of the active gems (arbitrary order)"""
+	return _positions.duplicate()
+
+
+func clear() -> void:
+	_positions.clear()
+	_ages.clear()
+	_health.clear()
+	_attracted.clear()
+	queue_redraw()
+
+
+func get_stats() -> Dictionary:
+	var attracted := 0
+	for flag in _attracted:
+		attracted += flag
+	return {
+		"gems": _ages.size(),
+		"attracted": attracted,
+		"collected_total": _collected_total,
+		"despawned_total": _despawned_total,
+	}
+
+
+func _process(delta: float) -> void:
+	# Stop simulating when game is paused (level up, game over, etc.)
+	if _ages.is_empty() or GameManager.current_state != GameManager.GameState.PLAYING:
+		return
+
+	if not is_instance_valid(_player):
+		_player = EntityRegistry.get_player()
+	var has_player: bool = _player != null
+	var player_pos: Vector2 = _player.global_position if has_player else Vector2.ZERO
+	var magnetism_range := GameManager.get_effective_magnetism_range()
+	var drift := _get_drift(delta)
+
+	# Backwards, so a swap-remove only moves an already-updated gem into slot i
+	var i := _ages.size() - 1
+	while i >= 0:
+		_ages[i] += delta
+		var pos := _positions[i]
+		var distance := pos.distance_to(player_pos) if has_player else INF
+
+		if distance < PICKUP_RADIUS:
+			_collect(i)
+			i -= 1
+			continue
+
+		# Magnetism toward player (auto-magnet during boss fights or with Collector passive)
+		if magnetism_range > 0 and distance < magnetism_range:
+			_attracted[i] = 1
+			# Speed increases as gem gets closer
+			var pull_strength := 1.0 - (distance / magnetism_range)
+			var current_speed := lerpf(base_speed, Gem.MAGNETISM_SPEED, pull_strength)
+			pos += (player_pos - pos).normalized() * current_speed * delta
+		else:
+			_attracted[i] = 0
+			pos.y += drift
+		_positions[i] = pos
+
+		if _ages[i] > despawn_time or pos.y > DESPAWN_BOTTOM or pos.y < DESPAWN_TOP:
+			_remove_at(i)
+			_despawned_total += 1
+		i -= 1
+
+	queue_redraw()
+
+
+func _get_drift(delta: float) -> float:
+	"""Vertical movement this frame for unattracted gems (see Gem.GemMovementMode)"""
+	var world_scroll := GameManager.get_world_scroll_speed()
+	match Gem.movement_mode:
+		Gem.GemMovementMode.FALL_DOWN:
+			return base_speed * delta
+		Gem.GemMovementMode.DRIFT_UP:
+			# World scroll reduces net upward drift
+			return -(base_speed - world_scroll * 0.5) * delta
+		_:
+			# STATIONARY: stay in world coords = drift down with scroll
+			return world_scroll * delta
+
+
+func _collect(index: int) -> void:
+	var is_health_gem := _health[index] == 1
+	_remove_at(index)
+	_collected_total += 1
+	collected.emit(self)
+	if is_health_gem:
+		GameManager.heal(Gem.HEALTH_GEM_HEAL)
+	SoundManager.play(SoundManager.SoundType.GEM_COLLECT)
+
+
+func _remove_at(index: int) -> void:
+	var last := _ages.size() - 1
+	if index != last:
+		_positions[index] = _positions[last]
+		_ages[index] = _ages[last]
+		_health[index] = _health[last]
+		_attracted[index] = _attracted[last]
+	_positions.resize(last)
+	_ages.resize(last)
+	_health.resize(last)
+	_attracted.resize(last)
+
+
+func _draw() -> void:
+	var player_pos := Vector2.ZERO
+	if is_instance_valid(_player):
+		player_pos = _player.global_position
+
+	# Attraction lines and glows first so every gem draws on top of them
+	for i in range(_ages.size()):
+		if _attracted[i] == 1:
+			draw_line(_positions[i], player_pos, Color(ATTRACT_COLOR, 0.3), 2.0)
+			draw_circle(_positions[i], radius * 1.5, Color(ATTRACT_COLOR, 0.2))
+
+	var points := PackedVector2Array([Vector2.ZERO, Vector2.ZERO, Vector2.ZERO, Vector2.ZERO])
+	for i in range(_ages.size()):
+		var pos := _positions[i]
+		var base_color := HEALTH_GEM_COLOR if _health[i] == 1 else GEM_COLOR
+		var sparkle := (sin(_ages[i] * sparkle_speed) + 1.0) * 0.5
+
+		# Diamond shape
+		points[0] = pos + Vector2(0, -radius)
+		points[1] = pos + Vector2(radius * 0.7, 0)
+		points[2] = pos + Vector2(0, radius)
+		points[3] = pos + Vector2(-radius * 0.7, 0)
+		draw_colored_polygon(points, base_color.lightened(sparkle * 0.3))
+
+		# Highlight
+		draw_circle(pos + Vector2(-2, -2), 2, base_color.lightened(0.5 + sparkle * 0.3))
@@ -18,6 +18,7 @@ var effect_duration: float = 0.2  # How long the line stays visible
 var fade_duration: float = 0.15  # How long to fade out
 
 var damage: int = 12
+const HIT_THRESHOLD: float = 30.0  # Half of enemy size approximately
 var _line: Line2D
 var _glow: Line2D
 var _game_area_rect: Rect2
@@ -51,21 +52,11 @@ func _get_game_area_rect() -> Rect2:
 
 func _create_line_visuals() -> void:
 	"""Create the main line and glow effect"""
-	var start_pos: Vector2
-	var end_pos: Vector2
-
-	if orientation == Orientation.HORIZONTAL:
-		# Horizontal line at player's Y position (global_position.y)
-		start_pos = Vector2(_game_area_rect.position.x, global_position.y)
-		end_pos = Vector2(_game_area_rect.end.x, global_position.y)
-	else:
-		# Vertical line at player's X position (global_position.x)
-		start_pos = Vector2(global_position.x, _game_area_rect.position.y)
-		end_pos = Vector2(global_position.x, _game_area_rect.end.y)
+	var segment := _get_line_segment()
 
 	# Convert to local coordinates
-	start_pos -= global_position
-	end_pos -= global_position
+	var start_pos := segment[0] - global_position
+	var end_pos := segment[1] - global_position
 
 	# Create glow (drawn first, behind main line)
 	_glow = Line2D.new()
@@ -90,40 +81,34 @@ func _create_line_visuals() -> void:
 
 func _deal_damage_to_enemies() -> void:
 	"""Find and damage all enemies intersecting the line"""
-	var enemies_container := get_tree().get_first_node_in_group("enemies")
-	if not enemies_container:
-		return
-
 	var total_damage: int = 0
 	var enemies_hit: int = 0
 
-	for enemy in enemies_container.get_children():
-		if not enemy.has_method("take_damage"):
-			continue
-
-		# Check if enemy intersects the line
-		if _enemy_intersects_line(enemy):
-			enemy.take_damage(damage)
-			_apply_hit_effect(enemy)
-			total_damage += damage
-			enemies_hit += 1
+	var segment := _get_line_segment()
+	for enemy in EnemyGrid.query_segment(segment[0], segment[1], HIT_THRESHOLD):
+		enemy.take_damage(damage)
+		_apply_hit_effect(enemy)
+		total_damage += damage
+		enemies_hit += 1
 
 	if enemies_hit > 0:
 		damage_dealt.emit(total_damage, enemies_hit)
 		SoundManager.play(SoundManager.SoundType.HIT_ENEMY)
 
 
-func _enemy_intersects_line(enemy: Node2D) -> bool:
-	"""Check if an enemy intersects this lazer line"""
-	var enemy_pos := enemy.global_position
-	var threshold: float = 30.0  # Half of enemy size approximately
-
+func _get_line_segment() -> PackedVector2Array:
+	"""Global start/end points of the line across the game area"""
 	if orientation == Orientation.HORIZONTAL:
-		# Check if enemy Y is close to line Y
-		return absf(enemy_pos.y - global_position.y) < threshold
-	else:
-		# Check if enemy X is close to line X
-		return absf(enemy_pos.x - global_position.x) < threshold
+		# Horizontal line at player's Y position (global_position.y)
+		return PackedVector2Array([
+			Vector2(_game_area_rect.position.x, global_position.y),
+			Vector2(_game_area_rect.end.x, global_position.y),
+		])
+	# Vertical line at player's X position (global_position.x)
+	return PackedVector2Array([
+		Vector2(global_position.x, _game_area_rect.position.y),
+		Vector2(global_position.x, _game_area_rect.end.y),
+	])
 
 
 func _apply_hit_effect(enemy: Node2D) -> void:
@@ -30,6 +30,7 @@ var _blink_tween: Tween = null
 
 func _ready() -> void:
 	add_to_group("player")
+	EntityRegistry.register_player(self)
 	# Store base radius for scaling
 	_base_radius = player_radius
 	# Set up collision - layer 16 (player), mask 4+8 (enemies + gems)
@@ -177,6 +177,8 @@ func _ready() -> void:
 		ball_spawner.ball_caught.connect(_on_ball_caught)
 		_log("Connected ball_spawner signals")
 
+	EntityRegistry.register_containers(balls_container, enemies_container, gems_container)
+
 	if player:
 		player.position = Vector2(360, 900)
 		player.moved.connect(_on_player_moved)
@@ -315,7 +317,6 @@ func _process(delta: float) -> void:
 	_elapsed_time += delta
 	_handle_keyboard_input()
 	_update_debug_display()
-	_cleanup_offscreen_balls()
 	_sample_metrics(delta)
 
 
@@ -448,7 +449,9 @@ func _restart_experiment() -> void:
 	# Clear all enemies
 	if enemies_container:
 		for enemy in enemies_container.get_children():
-			if enemy != enemy_spawner:
+			if enemy is EnemyBase:
+				enemy.despawn()  # Pooled enemies go back to PoolManager
+			elif enemy != enemy_spawner:
 				enemy.queue_free()
 
 	# Clear all balls
@@ -555,16 +558,6 @@ func _update_debug_display() -> void:
 	debug_label.text = text
 
 
-func _cleanup_offscreen_balls() -> void:
-	"""Clean up balls that went off screen."""
-	if not balls_container:
-		return
-
-	for ball in balls_container.get_children():
-		if ball.global_position.y < -50 or ball.global_position.y > 1330:
-			ball.despawn()
-
-
 func _sample_metrics(delta: float) -> void:
 	"""Sample metrics periodically for comparison analysis."""
 	_sample_timer += delta
@@ -795,7 +788,9 @@ func _on_back_pressed() -> void:
 	# Clear enemies
 	if enemies_container:
 		for enemy in enemies_container.get_children():
-			if enemy != enemy_spawner:
+			if enemy is EnemyBase:
+				enemy.despawn()  # Pooled enemies go back to PoolManager
+			elif enemy != enemy_spawner:
 				enemy.queue_free()
 
 	# Reset GameManager state before returning to menu
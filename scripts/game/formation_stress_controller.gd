@@ -0,0 +1,69 @@
+extends Node2D
+## Formation stress scene - spawns WALL and STAGGERED_ROWS formations with
+## thousands of members and reports frame time plus FormationSystem cost.
+## Run headless: godot --headless --path . res://scenes/formation_stress.tscn
+
+@export var members_per_formation: int = 600
+@export var formations_per_type: int = 2
+@export var row_gap: float = 160.0  # Vertical gap between stacked formations
+@export var sample_frames: int = 300
+@export var quit_when_done: bool = true
+
+@onready var enemy_spawner: EnemySpawner = $GameArea/Enemies/EnemySpawner
+
+var results: Dictionary = {}
+var _frames: int = 0
+var _frame_usec_total: int = 0
+var _frame_usec_max: int = 0
+var _formation_usec_total: int = 0
+var _last_ticks: int = 0
+
+
+func _ready() -> void:
+	GameManager.start_game()
+	_spawn_formations()
+	_last_ticks = Time.get_ticks_usec()
+
+
+func _spawn_formations() -> void:
+	var formations := [EnemySpawner.Formation.WALL, EnemySpawner.Formation.STAGGERED_ROWS]
+	var base_y := enemy_spawner.spawn_y_offset
+	var index := 0
+	for formation in formations:
+		for i in range(formations_per_type):
+			enemy_spawner.spawn_y_offset = base_y - row_gap * index
+			enemy_spawner.spawn_formation(formation, members_per_formation)
+			index += 1
+	enemy_spawner.spawn_y_offset = base_y
+
+
+func _physics_process(_delta: float) -> void:
+	if _frames >= sample_frames:
+		return
+
+	var now := Time.get_ticks_usec()
+	var frame_usec := now - _last_ticks
+	_last_ticks = now
+	_frames += 1
+	_frame_usec_total += frame_usec
+	_frame_usec_max = maxi(_frame_usec_max, frame_usec)
+	_formation_usec_total += FormationSystem.get_stats()["update_usec"]
+
+	if _frames == sample_frames:
+		_finish()
+
+
+func _finish() -> void:
+	var stats := FormationSystem.get_stats()
+	results = {
+		"frames": _frames,
+		"members": stats["members"],
+		"formations": stats["formations"],
+		"avg_frame_usec": _frame_usec_total / _frames,
+		"max_frame_usec": _frame_usec_max,
+		"avg_formation_usec": _formation_usec_total / _frames,
+		"max_offset_error": FormationSystem.get_max_offset_error(),
+	}
+	print("Formation stress: ", results)
+	if quit_when_done:
+		get_tree().quit()
@@ -29,41 +29,19 @@ extends Node2D
 @onready var boss_hp_bar: Control = $UI/BossHPBar
 @onready var save_slot_select: CanvasLayer = $UI/SaveSlotSelect
 
-var gem_scene: PackedScene = preload("res://scenes/entities/gem.tscn")
-# NOTE: Boss scenes use load() not preload() to avoid class resolution issues during import
-# See boss_base.gd for detailed explanation of Godot's class loading order problem
-var slime_king_scene: PackedScene
-var frost_wyrm_scene: PackedScene
-var sand_golem_scene: PackedScene
-var void_lord_scene: PackedScene
-var plague_beast_scene: PackedScene
-var storm_titan_scene: PackedScene
-var crystal_golem_scene: PackedScene
-var abyssal_horror_scene: PackedScene
-
-# Boss tracking
+var gem_field: Node2D = null  # GemField: simulates and draws all gems (created in _ready)
+
+# Boss tracking (boss/mini-boss scenes come from BossPrefetcher)
 var _current_boss: Node = null
 var _current_mini_boss: Node = null
 
-# Mini-boss scenes (lazy loaded)
-# Stage 0: Elite Slime, Giant Bat
-# Stage 1: Frost Golem, Ice Wraith
-# Stage 2: Fire Crab, Sand Archer
-# Stage 3: Void Spawn, Shadow Knight
-# Stage 4: Toxic Lurker, Swamp Horror
-# Stage 5: Lightning Elemental, Storm Harpy
-# Stage 6: Crystal Guardian, Gem Spider
-# Stage 7: Abyss Watcher, Nightmare
-var mini_boss_scenes: Array[Array] = []
 var player_scene: PackedScene = preload("res://scenes/entities/player.tscn")
 var fusion_reactor_scene: PackedScene = preload("res://scenes/entities/fusion_reactor.tscn")
 
-# Viewport bounds for ball cleanup
-var viewport_height: float = 1280.0
-
 # Wave tracking
 var enemies_killed_this_wave: int = 0
 var enemies_per_wave: int = 5
+var _autosave_snapshot_usec: int = 0  # Main-thread cost of the last autosave
 
 # Keyboard input tracking
 var _keyboard_aim_direction: Vector2 = Vector2.ZERO
@@ -71,11 +49,11 @@ var _last_keyboard_aim: Vector2 = Vector2.ZERO  # Only set when keyboard is used
 
 # Catch zone for touch input (tap above this Y to try catching)
 const CATCH_TAP_ZONE_MAX_Y: float = 900.0  # Don't trigger on HUD area
+const BallRendererScript := preload("res://scripts/effects/ball_renderer.gd")
+const GemFieldScript := preload("res://scripts/entities/gem_field.gd")
 
 
 func _ready() -> void:
-	viewport_height = get_viewport_rect().size.y
-
 	# Wire up move joystick (left) - controls player movement
 	if move_joystick:
 		move_joystick.direction_changed.connect(_on_move_joystick_direction_changed)
@@ -103,6 +81,22 @@ func _ready() -> void:
 	if ball_spawner:
 		ball_spawner.balls_container = balls_container
 
+	EntityRegistry.register_containers(balls_container, enemies_container, gems_container)
+
+	# Batched ball renderer (opt-in via BallRenderer.set_batched) draws above the balls
+	if balls_container:
+		var ball_renderer: Node2D = BallRendererScript.new()
+		ball_renderer.name = "BallRenderer"
+		ball_renderer.balls_container = balls_container
+		balls_container.add_sibling(ball_renderer)
+
+	# All gems are simulated and drawn by one GemField
+	if gems_container:
+		gem_field = GemFieldScript.new()
+		gem_field.name = "GemField"
+		gem_field.collected.connect(_on_gem_collected)
+		gems_container.add_child(gem_field)
+
 	# Set up player
 	if player:
 		# Player starts at bottom center (above controls divider at y=1110)
@@ -193,7 +187,7 @@ func _start_new_player_experience() -> void:
 
 	# Set first stage (The Pit, stage 0)
 	if StageManager:
-		StageManager.current_stage = 0
+		StageManager.set_progress(0, 1)
 		StageManager._apply_biome()
 
 	# Start game with tutorial
@@ -260,7 +254,7 @@ func _on_dual_character_selected(primary: Resource, secondary: Resource) -> void
 func _on_stage_selected(stage_index: int, difficulty_level: int = 1) -> void:
 	# Set starting stage in StageManager
 	if StageManager:
-		StageManager.current_stage = stage_index
+		StageManager.set_progress(stage_index, 1)
 		StageManager._apply_biome()
 
 	# Difficulty is already set in level_select.gd before emitting signal
@@ -314,7 +308,7 @@ func _restore_session() -> void:
 	# Restore StageManager state
 	var stage: int = session_data.get("current_stage", 0)
 	if StageManager:
-		StageManager.current_stage = stage
+		StageManager.set_stage_at_wave(stage, GameManager.current_wave)
 		StageManager._apply_biome()
 
 	# Apply character stats to ball spawner
@@ -329,10 +323,12 @@ func _restore_session() -> void:
 
 
 func _save_session() -> void:
-	"""Save the current game session for mid-run persistence."""
+	"""Snapshot the current game session for mid-run persistence. Only the
+	snapshot runs here; MetaManager encodes and writes it on a worker thread."""
 	if GameManager.current_state != GameManager.GameState.PLAYING:
 		return
 
+	var start := Time.get_ticks_usec()
 	var session_data := GameManager.get_session_state()
 
 	# Add BallRegistry state
@@ -346,6 +342,7 @@ func _save_session() -> void:
 		session_data["current_stage"] = StageManager.current_stage
 
 	MetaManager.save_session(session_data)
+	_autosave_snapshot_usec = Time.get_ticks_usec() - start
 
 
 func _on_wave_changed_for_autosave(_new_wave: int) -> void:
@@ -353,6 +350,13 @@ func _on_wave_changed_for_autosave(_new_wave: int) -> void:
 	_save_session()
 
 
+func get_autosave_stats() -> Dictionary:
+	"""Main-thread snapshot time plus MetaManager's worker-side encode stats."""
+	var stats := MetaManager.get_session_save_stats()
+	stats["snapshot_usec"] = _autosave_snapshot_usec
+	return stats
+
+
 func _on_game_started() -> void:
 	if enemy_spawner:
 		enemy_spawner.start_spawning()
@@ -374,7 +378,7 @@ func _on_game_over() -> void:
 	if enemies_container:
 		for enemy in enemies_container.get_children():
 			if enemy is EnemyBase:
-				enemy.queue_free()
+				enemy.despawn()
 	# Clear hazards
 	_clear_hazards()
 	# Clear the mid-run session save (run ended)
@@ -419,7 +423,7 @@ func _on_enemy_spawned(enemy: EnemyBase) -> void:
 
 
 func _on_enemy_died(enemy: EnemyBase) -> void:
-	_spawn_gem(enemy.global_position, enemy.xp_value)
+	_spawn_gem(enemy.global_position)
 	# Fusion reactors now spawn on level-up (see _on_level_up_for_fusion)
 	_check_wave_progress()
 	GameManager.record_enemy_kill()
@@ -431,24 +435,9 @@ func _on_enemy_took_damage(_enemy: EnemyBase, _amount: int) -> void:
 		tutorial_overlay.on_enemy_hit()
 
 
-func _spawn_gem(pos: Vector2, xp_value: int) -> void:
-	if not gems_container:
-		return
-
-	# Get gem from pool if available
-	var gem: Node
-	if PoolManager:
-		gem = PoolManager.get_gem()
-	else:
-		gem = gem_scene.instantiate()
-	gem.position = pos
-	gem.xp_value = xp_value
-	# Reconnect signal (may have been disconnected on pool release)
-	if not gem.collected.is_connected(_on_gem_collected):
-		gem.collected.connect(_on_gem_collected)
-	gems_container.add_child(gem)
-	# Re-acquire player reference after being added to tree
-	gem._player = get_tree().get_first_node_in_group("player")
+func _spawn_gem(pos: Vector2) -> void:
+	if gem_field:
+		gem_field.spawn_gem(pos)
 
 
 func _on_gem_collected(_gem: Node2D) -> void:
@@ -565,7 +554,6 @@ func _on_autofire_state_changed(enabled: bool) -> void:
 
 
 func _process(_delta: float) -> void:
-	_cleanup_offscreen_balls()
 	_handle_keyboard_input()
 
 
@@ -585,15 +573,6 @@ func _apply_dual_character_hitbox(enabled: bool) -> void:
 		player.set_dual_character_mode(enabled)
 
 
-func _cleanup_offscreen_balls() -> void:
-	if not balls_container:
-		return
-
-	for ball in balls_container.get_children():
-		if ball.global_position.y < -50 or ball.global_position.y > viewport_height + 50:
-			ball.despawn()
-
-
 func _on_biome_changed(biome: Biome) -> void:
 	# Update background color
 	if background:
@@ -764,17 +743,28 @@ func _on_fusion_reactor_collected(_reactor: Node2D) -> void:
 		fusion_overlay.show_fusion_ui()
 
 
+func spawn_test_balls(count: int, pos: Vector2, ball_speed: float = 0.0, baby: bool = false) -> int:
+	"""Spawn pooled balls at pos moving up at ball_speed (0 = parked). For stress tests."""
+	if not balls_container:
+		return 0
+	for i in range(count):
+		var ball: Node = PoolManager.get_ball()
+		ball.is_baby_ball = baby
+		ball.position = pos
+		ball.set_direction(Vector2.UP)
+		ball.speed = ball_speed
+		balls_container.add_child(ball)
+	return count
+
+
 func spawn_test_boss() -> String:
 	"""Spawn a Slime King boss for testing. Returns the boss path (for PlayGodot)."""
-	if not slime_king_scene:
-		slime_king_scene = load("res://scenes/entities/enemies/bosses/slime_king.tscn")
-
-	var boss = slime_king_scene.instantiate()
+	var boss = BossPrefetcher.get_boss_scene(0).instantiate()
 
 	# Get container (may be null if @onready hasn't run yet)
 	var container := enemies_container
 	if not container:
-		container = get_tree().get_first_node_in_group("enemies_container")
+		container = EntityRegistry.get_container(EntityRegistry.ENEMIES_CONTAINER)
 	if not container:
 		push_error("spawn_test_boss: Could not find enemies container")
 		return ""
@@ -796,7 +786,7 @@ func spawn_test_enemy(scene_path: String) -> String:
 	# Get container
 	var container := enemies_container
 	if not container:
-		container = get_tree().get_first_node_in_group("enemies_container")
+		container = EntityRegistry.get_container(EntityRegistry.ENEMIES_CONTAINER)
 	if not container:
 		push_error("spawn_test_enemy: Could not find enemies container")
 		return ""
@@ -819,50 +809,14 @@ func get_enemy_spawner_path() -> String:
 
 func _spawn_boss(stage: int) -> void:
 	"""Spawn the appropriate boss for the current stage"""
-	# Lazy load boss scenes only when needed (avoids class resolution issues during import)
-	if not slime_king_scene:
-		slime_king_scene = load("res://scenes/entities/enemies/bosses/slime_king.tscn")
-	if not frost_wyrm_scene:
-		frost_wyrm_scene = load("res://scenes/entities/enemies/bosses/frost_wyrm.tscn")
-	if not sand_golem_scene:
-		sand_golem_scene = load("res://scenes/entities/enemies/bosses/sand_golem.tscn")
-	if not void_lord_scene:
-		void_lord_scene = load("res://scenes/entities/enemies/bosses/void_lord.tscn")
-	if not plague_beast_scene:
-		plague_beast_scene = load("res://scenes/entities/enemies/bosses/plague_beast.tscn")
-	if not storm_titan_scene:
-		storm_titan_scene = load("res://scenes/entities/enemies/bosses/storm_titan.tscn")
-	if not crystal_golem_scene:
-		crystal_golem_scene = load("res://scenes/entities/enemies/bosses/crystal_golem.tscn")
-	if not abyssal_horror_scene:
-		abyssal_horror_scene = load("res://scenes/entities/enemies/bosses/abyssal_horror.tscn")
-
-	var boss_scene: PackedScene = null
-
-	# Select boss based on stage
-	match stage:
-		0:  # The Pit - Slime King
-			boss_scene = slime_king_scene
-		1:  # Frozen Depths - Frost Wyrm
-			boss_scene = frost_wyrm_scene
-		2:  # Burning Sands - Sand Golem
-			boss_scene = sand_golem_scene
-		3:  # Void Chasm - Void Lord
-			boss_scene = void_lord_scene
-		4:  # Toxic Marsh - Plague Beast
-			boss_scene = plague_beast_scene
-		5:  # Storm Spire - Storm Titan
-			boss_scene = storm_titan_scene
-		6:  # Crystal Caverns - Crystal Golem
-			boss_scene = crystal_golem_scene
-		7:  # The Abyss - Abyssal Horror
-			boss_scene = abyssal_horror_scene
-		_:
-			# Fallback to Slime King
-			boss_scene = slime_king_scene
+	BossPrefetcher.begin_spawn_measure("boss")
+	# Prefetched a few waves early; only blocks if the load hasn't finished
+	var boss_scene := BossPrefetcher.get_boss_scene(stage)
 
 	if not boss_scene:
-		# No boss for this stage, auto-complete
+		# No boss for this stage, auto-complete (still close the measure so
+		# stats don't pair this spawn kind with the previous spawn's timings)
+		BossPrefetcher.end_spawn_measure()
 		if stage_complete_overlay:
 			stage_complete_overlay.show_stage_complete(stage)
 		return
@@ -883,6 +837,7 @@ func _spawn_boss(stage: int) -> void:
 
 	# Announce boss
 	SoundManager.play(SoundManager.SoundType.WAVE_COMPLETE)
+	BossPrefetcher.end_spawn_measure()
 
 
 func _on_boss_defeated() -> void:
@@ -932,66 +887,12 @@ func _on_mini_boss_wave_reached(stage: int, mini_boss_idx: int) -> void:
 	_spawn_mini_boss(stage, mini_boss_idx)
 
 
-func _load_mini_boss_scenes() -> void:
-	"""Lazy load all mini-boss scenes"""
-	if mini_boss_scenes.size() > 0:
-		return  # Already loaded
-
-	mini_boss_scenes = [
-		# Stage 0: The Pit
-		[
-			load("res://scenes/entities/enemies/mini_bosses/elite_slime.tscn"),
-			load("res://scenes/entities/enemies/mini_bosses/giant_bat.tscn"),
-		],
-		# Stage 1: Frozen Depths
-		[
-			load("res://scenes/entities/enemies/mini_bosses/frost_golem.tscn"),
-			load("res://scenes/entities/enemies/mini_bosses/ice_wraith.tscn"),
-		],
-		# Stage 2: Burning Sands
-		[
-			load("res://scenes/entities/enemies/mini_bosses/fire_crab.tscn"),
-			load("res://scenes/entities/enemies/mini_bosses/sand_archer.tscn"),
-		],
-		# Stage 3: Void Chasm
-		[
-			load("res://scenes/entities/enemies/mini_bosses/void_spawn.tscn"),
-			load("res://scenes/entities/enemies/mini_bosses/shadow_knight.tscn"),
-		],
-		# Stage 4: Toxic Marsh
-		[
-			load("res://scenes/entities/enemies/mini_bosses/toxic_lurker.tscn"),
-			load("res://scenes/entities/enemies/mini_bosses/swamp_horror.tscn"),
-		],
-		# Stage 5: Storm Spire
-		[
-			load("res://scenes/entities/enemies/mini_bosses/lightning_elemental.tscn"),
-			load("res://scenes/entities/enemies/mini_bosses/storm_harpy.tscn"),
-		],
-		# Stage 6: Crystal Caverns
-		[
-			load("res://scenes/entities/enemies/mini_bosses/crystal_guardian.tscn"),
-			load("res://scenes/entities/enemies/mini_bosses/gem_spider.tscn"),
-		],
-		# Stage 7: The Abyss
-		[
-			load("res://scenes/entities/enemies/mini_bosses/abyss_watcher.tscn"),
-			load("res://scenes/entities/enemies/mini_bosses/nightmare.tscn"),
-		],
-	]
-
-
 func _spawn_mini_boss(stage: int, mini_boss_idx: int) -> void:
 	"""Spawn the appropriate mini-boss for the stage and index"""
-	_load_mini_boss_scenes()
-
-	if stage < 0 or stage >= mini_boss_scenes.size():
-		return
-	if mini_boss_idx < 0 or mini_boss_idx >= mini_boss_scenes[stage].size():
-		return
-
-	var scene: PackedScene = mini_boss_scenes[stage][mini_boss_idx]
+	BossPrefetcher.begin_spawn_measure("mini_boss")
+	var scene := BossPrefetcher.get_mini_boss_scene(stage, mini_boss_idx)
 	if not scene:
+		BossPrefetcher.end_spawn_measure()
 		return
 
 	_current_mini_boss = scene.instantiate()
@@ -1006,6 +907,7 @@ func _spawn_mini_boss(stage: int, mini_boss_idx: int) -> void:
 	# Announce mini-boss
 	SoundManager.play(SoundManager.SoundType.ENEMY_DEATH)
 	CameraShake.shake(6.0, 3.0)
+	BossPrefetcher.end_spawn_measure()
 
 
 func _on_mini_boss_defeated() -> void:
@@ -1016,7 +918,7 @@ func _on_mini_boss_defeated() -> void:
 func _on_mini_boss_enemy_died(enemy: Node) -> void:
 	"""Mini-boss died signal handler - spawn gem and record kill"""
 	if enemy:
-		_spawn_gem(enemy.global_position, enemy.xp_value)
+		_spawn_gem(enemy.global_position)
 	GameManager.record_enemy_kill()
 	_current_mini_boss = null
 
@@ -1,5 +1,10 @@
 extends Line2D
 ## Trajectory preview line for aiming with bounce prediction
+## Bounces are solved analytically against the static side walls (read once
+## from walls_path); physics raycasts are only used if the walls can't be
+## resolved or obstacle_mask is set. Paths are cached by quantized origin and
+## angle, and dash geometry is cached per segment length, so aim drags cost
+## the same no matter how many bounces are drawn.
 
 @export var max_length: float = 400.0
 @export var line_color: Color = Color(1.0, 1.0, 1.0, 0.4)
@@ -9,8 +14,13 @@ extends Line2D
 @export var gap_length: float = 10.0
 @export var max_bounces: int = 3  # How many bounces to predict
 @export var bounce_opacity_decay: float = 0.6  # Opacity multiplier per bounce
+@export var walls_path: NodePath = ^"../Walls"  # StaticBody2D walls to solve against
+@export var obstacle_mask: int = 0  # Extra physics layers that stop the preview (e.g. hazards)
 
 const WALL_COLLISION_LAYER: int = 1
+const ORIGIN_STEP: float = 1.0  # Cache quantization: pixels
+const ANGLE_STEP: float = 0.002  # Cache quantization: radians (~0.8px at 400px)
+const MAX_CACHED_PATHS: int = 512
 
 var current_direction: Vector2 = Vector2.UP
 var is_active: bool = false
@@ -18,12 +28,29 @@ var _last_origin: Vector2 = Vector2.ZERO
 var _fade_tween: Tween
 var _bounce_lines: Array[Line2D] = []  # Child lines for bounce segments
 
+# Analytic wall bounds (inner faces of the side walls and their vertical extent)
+var _has_wall_bounds: bool = false
+var _wall_left: float = 0.0
+var _wall_right: float = 0.0
+var _wall_top: float = 0.0
+var _wall_bottom: float = 0.0
+var _wall_rids: Array[RID] = []
+
+# Caches
+var _path_cache: Dictionary = {}  # Vector3i(x, y, angle) -> PackedVector2Array hit points
+var _dash_cache: Dictionary = {}  # int length -> PackedVector2Array dashes along +X
+var _drawn_key := Vector3i(0, 0, 0)
+var _has_drawn: bool = false
+
+var _update_stats := {"updates": 0, "unchanged": 0, "cache_hits": 0, "solves": 0, "raycasts": 0}
+
 
 func _ready() -> void:
 	width = line_width_value
 	default_color = line_color
 	visible = false
 	_create_bounce_lines()
+	_resolve_wall_bounds()
 
 
 func show_line(direction: Vector2, start_pos: Vector2) -> void:
@@ -31,20 +58,22 @@ func show_line(direction: Vector2, start_pos: Vector2) -> void:
 		return
 
 	current_direction = direction.normalized()
+	var was_fading := not is_active or (_fade_tween and _fade_tween.is_valid())
 	is_active = true
 	visible = true
 	_last_origin = start_pos
 
-	# Cancel any fade animation
-	if _fade_tween and _fade_tween.is_valid():
-		_fade_tween.kill()
+	if was_fading:
+		# Cancel any fade animation
+		if _fade_tween and _fade_tween.is_valid():
+			_fade_tween.kill()
 
-	default_color = line_color
+		default_color = line_color
 
-	# Reset bounce line colors to active state
-	for i in range(_bounce_lines.size()):
-		var opacity := line_color.a * pow(bounce_opacity_decay, i + 1)
-		_bounce_lines[i].default_color = Color(line_color.r, line_color.g, line_color.b, opacity)
+		# Reset bounce line colors to active state
+		for i in range(_bounce_lines.size()):
+			var opacity := line_color.a * pow(bounce_opacity_decay, i + 1)
+			_bounce_lines[i].default_color = Color(line_color.r, line_color.g, line_color.b, opacity)
 
 	_update_line(start_pos)
 
@@ -66,54 +95,172 @@ func hide_line() -> void:
 		_fade_tween.tween_property(_bounce_lines[i], "default_color", bounce_ghost, 0.2)
 
 
+func update_position(start_pos: Vector2) -> void:
+	if visible:
+		_update_line(start_pos)
+
+
+func set_direction(direction: Vector2) -> void:
+	current_direction = direction.normalized()
+
+
+func clear_cache() -> void:
+	"""Drop cached paths and dashes (call after changing length/dash settings or walls)"""
+	_path_cache.clear()
+	_dash_cache.clear()
+	_has_drawn = false
+	_resolve_wall_bounds()
+
+
 func _update_line(start_pos: Vector2) -> void:
-	clear_points()
 	_last_origin = start_pos
+	_update_stats["updates"] += 1
+
+	# Sub-pixel / sub-step aim changes map to the path already on screen
+	var key := Vector3i(
+		roundi(start_pos.x / ORIGIN_STEP),
+		roundi(start_pos.y / ORIGIN_STEP),
+		roundi(current_direction.angle() / ANGLE_STEP)
+	)
+	if _has_drawn and key == _drawn_key:
+		_update_stats["unchanged"] += 1
+		return
 
-	# Raycast to find first wall hit
-	var result := _raycast_to_wall(start_pos, current_direction, max_length)
-	var end_pos: Vector2
-	if result.is_empty():
-		end_pos = start_pos + current_direction * max_length
+	var path: PackedVector2Array
+	if _path_cache.has(key):
+		_update_stats["cache_hits"] += 1
+		path = _path_cache[key]
 	else:
-		end_pos = result.position
+		var origin := Vector2(key.x, key.y) * ORIGIN_STEP
+		path = _solve_path(origin, Vector2.from_angle(key.z * ANGLE_STEP))
+		if _path_cache.size() >= MAX_CACHED_PATHS:
+			_path_cache.clear()
+		_path_cache[key] = path
+
+	_apply_path(path)
+	_drawn_key = key
+	_has_drawn = true
+
+
+# ============================================================================
+# Trajectory solving
+# ============================================================================
+
+func _solve_path(start_pos: Vector2, direction: Vector2) -> PackedVector2Array:
+	"""Points where the preview starts, bounces and ends: segment 0 is the main
+	line, segment i + 1 is bounce line i."""
+	_update_stats["solves"] += 1
+	var path := PackedVector2Array([start_pos])
+	var current_pos := start_pos
+	var current_dir := direction
+	var remaining_length := max_length
 
-	# Draw main line to first wall (or max length)
-	_draw_dashed_segment_main(start_pos, end_pos)
+	for i in range(max_bounces + 1):
+		if remaining_length <= 0:
+			break
+		var result := _cast(current_pos, current_dir, remaining_length)
+		if result.is_empty():
+			# No more walls, draw to max length
+			path.append(current_pos + current_dir * remaining_length)
+			break
 
-	# Draw bounce predictions
-	_update_bounce_lines(start_pos, current_direction)
+		var hit: Vector2 = result.position
+		path.append(hit)
+		remaining_length -= current_pos.distance_to(hit)
+		current_pos = hit
+		current_dir = current_dir.bounce(result.normal)
+	return path
+
+
+func _cast(from: Vector2, direction: Vector2, max_distance: float) -> Dictionary:
+	"""Nearest wall/obstacle hit as {position, normal}, or {} for none"""
+	if not _has_wall_bounds:
+		# Offset slightly from the last wall to avoid self-collision
+		return _raycast_to_wall(from + direction * 2.0, direction, max_distance, WALL_COLLISION_LAYER)
+
+	var result := _cast_to_wall_bounds(from, direction, max_distance)
+	if obstacle_mask != 0:
+		var reach: float = from.distance_to(result.position) if not result.is_empty() else max_distance
+		var obstacle := _raycast_to_wall(from + direction * 2.0, direction, reach, obstacle_mask)
+		if not obstacle.is_empty():
+			return obstacle
+	return result
+
+
+func _cast_to_wall_bounds(from: Vector2, direction: Vector2, max_distance: float) -> Dictionary:
+	# Only the side walls exist: solve for the one we're heading toward
+	var t: float
+	var normal: Vector2
+	if direction.x < 0.0:
+		t = (_wall_left - from.x) / direction.x
+		normal = Vector2.RIGHT
+	elif direction.x > 0.0:
+		t = (_wall_right - from.x) / direction.x
+		normal = Vector2.LEFT
+	else:
+		return {}
 
+	if t < 0.0 or t > max_distance:
+		return {}
+	var hit := from + direction * t
+	if hit.y < _wall_top or hit.y > _wall_bottom:
+		return {}  # Passes above/below the walls
+	return {"position": hit, "normal": normal}
 
-func _draw_dashed_segment_main(start: Vector2, end: Vector2) -> void:
-	# Draw the main line's dashed segment
-	var direction := (end - start).normalized()
-	var total_length := start.distance_to(end)
-	var current_pos := start
-	var remaining := total_length
-	var is_dash := true
 
-	while remaining > 0:
-		var segment_length := dash_length if is_dash else gap_length
-		segment_length = minf(segment_length, remaining)
+func _raycast_to_wall(from: Vector2, direction: Vector2, max_distance: float, mask: int = WALL_COLLISION_LAYER) -> Dictionary:
+	# Physics fallback: raycast for walls we couldn't resolve, or obstacles
+	var space_state := get_world_2d().direct_space_state
+	if not space_state:
+		return {}
+	_update_stats["raycasts"] += 1
 
-		if is_dash:
-			add_point(current_pos)
-			add_point(current_pos + direction * segment_length)
+	var query := PhysicsRayQueryParameters2D.create(from, from + direction * max_distance)
+	query.collision_mask = mask
+	query.collide_with_areas = mask != WALL_COLLISION_LAYER
+	query.collide_with_bodies = true
+	query.exclude = _wall_rids
 
-		current_pos += direction * segment_length
-		remaining -= segment_length
-		is_dash = not is_dash
+	return space_state.intersect_ray(query)
 
 
-func update_position(start_pos: Vector2) -> void:
-	if visible:
-		_update_line(start_pos)
+func _resolve_wall_bounds() -> void:
+	"""Read the two static side walls once; anything else falls back to raycasts"""
+	_has_wall_bounds = false
+	_wall_rids.clear()
+	var walls := get_node_or_null(walls_path)
+	if not walls:
+		return
+
+	var rects: Array[Rect2] = []
+	var rids: Array[RID] = []
+	for wall in walls.get_children():
+		if not wall is StaticBody2D or not (wall.collision_layer & WALL_COLLISION_LAYER):
+			continue
+		var shape_node := wall.get_node_or_null("CollisionShape2D") as CollisionShape2D
+		if not shape_node or not shape_node.shape is RectangleShape2D or not is_zero_approx(shape_node.global_rotation):
+			return
+		var size: Vector2 = shape_node.shape.size * shape_node.global_scale.abs()
+		rects.append(Rect2(shape_node.global_position - size * 0.5, size))
+		rids.append(wall.get_rid())
+	if rects.size() != 2:
+		return
 
+	if rects[0].position.x > rects[1].position.x:
+		rects.reverse()
+	_wall_left = rects[0].end.x
+	_wall_right = rects[1].position.x
+	_wall_top = maxf(rects[0].position.y, rects[1].position.y)
+	_wall_bottom = minf(rects[0].end.y, rects[1].end.y)
+	_has_wall_bounds = _wall_left < _wall_right
+	if _has_wall_bounds:
+		# Only walls solved analytically are skipped by the raycast fallback
+		_wall_rids = rids
 
-func set_direction(direction: Vector2) -> void:
-	current_direction = direction.normalized()
 
+# ============================================================================
+# Drawing
+# ============================================================================
 
 func _create_bounce_lines() -> void:
 	# Create child Line2D nodes for bounce segments
@@ -127,91 +274,55 @@ func _create_bounce_lines() -> void:
 		_bounce_lines.append(bounce_line)
 
 
-func _raycast_to_wall(from: Vector2, direction: Vector2, max_distance: float) -> Dictionary:
-	# Raycast to detect wall collision
-	var space_state := get_world_2d().direct_space_state
-	if not space_state:
-		return {}
-
-	var query := PhysicsRayQueryParameters2D.create(from, from + direction * max_distance)
-	query.collision_mask = WALL_COLLISION_LAYER
-	query.collide_with_areas = false
-	query.collide_with_bodies = true
+func _apply_path(path: PackedVector2Array) -> void:
+	points = _dashed_segment(path[0], path[1])
+	for i in range(_bounce_lines.size()):
+		var line := _bounce_lines[i]
+		if i + 2 < path.size():
+			line.points = _dashed_segment(path[i + 1], path[i + 2])
+			line.visible = true
+		elif line.visible:
+			line.visible = false
+			line.clear_points()
 
-	return space_state.intersect_ray(query)
 
+func _dashed_segment(start: Vector2, end: Vector2) -> PackedVector2Array:
+	# Cached dash pattern for this length, rotated/moved onto the segment
+	var offset := end - start
+	return Transform2D(offset.angle(), start) * _get_dash_points(roundi(offset.length()))
 
-func _draw_dashed_segment(line: Line2D, start: Vector2, end: Vector2) -> void:
-	# Draw a dashed segment between two points
-	line.clear_points()
-	var direction := (end - start).normalized()
-	var total_length := start.distance_to(end)
-	var current_pos := start
-	var remaining := total_length
-	var is_dash := true
 
-	while remaining > 0:
-		var segment_length := dash_length if is_dash else gap_length
-		segment_length = minf(segment_length, remaining)
+func _get_dash_points(length: int) -> PackedVector2Array:
+	"""Dash endpoint pairs along +X for a segment of this length (built once)"""
+	if _dash_cache.has(length):
+		return _dash_cache[length]
 
+	var dashes := PackedVector2Array()
+	var current := 0.0
+	var is_dash := true
+	while current < length:
+		var segment_length := minf(dash_length if is_dash else gap_length, length - current)
 		if is_dash:
-			line.add_point(current_pos)
-			line.add_point(current_pos + direction * segment_length)
-
-		current_pos += direction * segment_length
-		remaining -= segment_length
+			dashes.append(Vector2(current, 0))
+			dashes.append(Vector2(current + segment_length, 0))
+		current += segment_length
 		is_dash = not is_dash
+	_dash_cache[length] = dashes
+	return dashes
 
 
-func _update_bounce_lines(start_pos: Vector2, direction: Vector2) -> void:
-	# Hide all bounce lines first
-	for line in _bounce_lines:
-		line.visible = false
-		line.clear_points()
-
-	var current_pos := start_pos
-	var current_dir := direction
-	var remaining_length := max_length
-
-	# Start from after the first segment (main line handles first segment)
-	# Raycast to find first wall hit
-	var result := _raycast_to_wall(current_pos, current_dir, remaining_length)
-	if result.is_empty():
-		return  # No wall hit within range
-
-	# Move to the first hit point (main line goes here)
-	var first_hit := result.position as Vector2
-	remaining_length -= current_pos.distance_to(first_hit)
-	current_pos = first_hit
+# ============================================================================
+# Debug / Stats
+# ============================================================================
 
-	# Calculate first bounce direction
-	var normal := result.normal as Vector2
-	current_dir = current_dir.bounce(normal)
+func get_update_stats() -> Dictionary:
+	var stats := _update_stats.duplicate()
+	stats["analytic"] = _has_wall_bounds
+	stats["cached_paths"] = _path_cache.size()
+	stats["cached_dashes"] = _dash_cache.size()
+	return stats
 
-	# Draw subsequent bounces
-	for i in range(max_bounces):
-		if remaining_length <= 0:
-			break
 
-		# Find next wall hit
-		# Offset slightly from wall to avoid self-collision
-		var offset_pos := current_pos + current_dir * 2.0
-		result = _raycast_to_wall(offset_pos, current_dir, remaining_length)
-
-		var end_pos: Vector2
-		if result.is_empty():
-			# No more walls, draw to max length
-			end_pos = current_pos + current_dir * remaining_length
-			_bounce_lines[i].visible = visible
-			_draw_dashed_segment(_bounce_lines[i], current_pos, end_pos)
-			break
-		else:
-			end_pos = result.position
-			_bounce_lines[i].visible = visible
-			_draw_dashed_segment(_bounce_lines[i], current_pos, end_pos)
-
-			# Prepare for next bounce
-			remaining_length -= current_pos.distance_to(end_pos)
-			current_pos = end_pos
-			normal = result.normal
-			current_dir = current_dir.bounce(normal)
+func reset_update_stats() -> void:
+	for key in _update_stats:
+		_update_stats[key] = 0
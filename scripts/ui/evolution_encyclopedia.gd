@@ -46,18 +46,12 @@ func _populate_evolutions() -> void:
 	evolution_list.add_child(tier1_header)
 
 	# Add all Tier 1 evolution recipes
-	for recipe_key in FusionRegistry.EVOLUTION_RECIPES:
-		var evolved_type: FusionRegistry.EvolvedBallType = FusionRegistry.EVOLUTION_RECIPES[recipe_key]
-		var evolved_data: Dictionary = FusionRegistry.get_evolved_ball_data(evolved_type)
-		var is_discovered: bool = FusionRegistry.is_recipe_discovered(recipe_key)
+	for recipe in FusionRegistry.get_evolution_recipes():
+		var evolved_data: Dictionary = FusionRegistry.get_evolved_ball_data(recipe["result"])
+		var is_discovered: bool = FusionRegistry.is_recipe_discovered(recipe["recipe_key"])
 
-		# Parse recipe key to get ball types (e.g., "BURN_IRON" -> [BURN, IRON])
-		var parts: PackedStringArray = recipe_key.split("_")
-		if parts.size() != 2:
-			continue
-
-		var ball_a_name: String = parts[0].capitalize()
-		var ball_b_name: String = parts[1].capitalize()
+		var ball_a_name: String = BallRegistry.BallType.keys()[recipe["ball_a"]].capitalize()
+		var ball_b_name: String = BallRegistry.BallType.keys()[recipe["ball_b"]].capitalize()
 
 		# Create entry container
 		var entry := _create_entry(ball_a_name, ball_b_name, evolved_data, is_discovered)
@@ -89,18 +83,12 @@ func _populate_multi_evolutions() -> void:
 	"""Populate multi-evolution recipes."""
 	if not evolution_list:
 		return
-	for recipe_key in FusionRegistry.MULTI_EVOLUTION_RECIPES:
-		var result: FusionRegistry.EvolvedBallType = FusionRegistry.MULTI_EVOLUTION_RECIPES[recipe_key]
-		var result_data: Dictionary = FusionRegistry.get_evolved_ball_data(result)
-		var is_discovered: bool = FusionRegistry.is_recipe_discovered(recipe_key)
-
-		# Parse recipe key (e.g., "BOMB_POISON" -> evolved_BOMB + basic_POISON)
-		var parts: PackedStringArray = recipe_key.split("_")
-		if parts.size() != 2:
-			continue
+	for recipe in FusionRegistry.get_multi_evolution_recipes():
+		var result_data: Dictionary = FusionRegistry.get_evolved_ball_data(recipe["result"])
+		var is_discovered: bool = FusionRegistry.is_recipe_discovered(recipe["recipe_key"])
 
-		var evolved_name: String = parts[0].capitalize()
-		var basic_name: String = parts[1].capitalize()
+		var evolved_name: String = FusionRegistry.EvolvedBallType.keys()[recipe["evolved_type"]].capitalize()
+		var basic_name: String = BallRegistry.BallType.keys()[recipe["ball_type"]].capitalize()
 
 		var entry := _create_multi_entry(evolved_name, basic_name, result_data, is_discovered)
 		evolution_list.add_child(entry)
@@ -110,17 +98,15 @@ func _populate_ultimate_fusions() -> void:
 	"""Populate ultimate fusion recipes."""
 	if not evolution_list:
 		return
-	for recipe_key in FusionRegistry.ULTIMATE_RECIPES:
-		var result: FusionRegistry.EvolvedBallType = FusionRegistry.ULTIMATE_RECIPES[recipe_key]
-		var result_data: Dictionary = FusionRegistry.get_evolved_ball_data(result)
-		var is_discovered: bool = FusionRegistry.is_recipe_discovered(recipe_key)
+	for recipe in FusionRegistry.get_ultimate_recipes():
+		var result_data: Dictionary = FusionRegistry.get_evolved_ball_data(recipe["result"])
+		var is_discovered: bool = FusionRegistry.is_recipe_discovered(recipe["recipe_key"])
 
-		# Parse recipe key (e.g., "BOMB_STORM_VIRUS")
-		var parts: PackedStringArray = recipe_key.split("_")
-		if parts.size() != 3:
-			continue
+		var ingredient_names := PackedStringArray()
+		for evolved_type in recipe["evolved_types"]:
+			ingredient_names.append(FusionRegistry.EvolvedBallType.keys()[evolved_type])
 
-		var entry := _create_ultimate_entry(parts, result_data, is_discovered)
+		var entry := _create_ultimate_entry(ingredient_names, result_data, is_discovered)
 		evolution_list.add_child(entry)
 
 
@@ -1,5 +1,20 @@
 extends Control
 ## HUD - displays HP bar, wave counter, and XP progress
+## Driven by GameManager/StageManager change signals: handlers only mark
+## sections dirty and _process redraws each dirty section once, then sleeps.
+## Set polling = true to restore the old rebuild-every-frame behavior for A/B.
+
+# Dirty sections (bit flags)
+const DIRTY_HP := 1
+const DIRTY_WAVE := 2  # Wave label + boss progress
+const DIRTY_XP := 4
+const DIRTY_ALL := DIRTY_HP | DIRTY_WAVE | DIRTY_XP
+
+const BOSS_COLOR_NOW := Color(1.0, 0.3, 0.2)
+const BOSS_COLOR_NEAR := Color(1.0, 0.6, 0.2)
+const BOSS_COLOR_FAR := Color(0.7, 0.7, 0.7)
+
+static var polling: bool = false
 
 @onready var hp_bar: ProgressBar = $TopBar/HPBar
 @onready var hp_label: Label = $TopBar/HPBar/HPLabel
@@ -14,6 +29,13 @@ extends Control
 
 var pause_overlay: CanvasLayer
 
+var _dirty: int = 0
+var _boss_label_color: Color = Color.TRANSPARENT  # Last override applied
+
+# Update stats (see get_update_stats)
+var _refresh_count: int = 0
+var _refresh_usec: int = 0
+
 # Fusion ready indicator (dynamically created)
 var fusion_ready_label: Label = null
 var _fusion_ready_tween: Tween = null
@@ -25,10 +47,8 @@ const SPEAKER_OFF := "X"   # Muted
 
 
 func _ready() -> void:
-	_update_hp()
-	_update_wave()
-	_update_xp()
-	_update_boss_progress()
+	_mark_dirty(DIRTY_ALL)
+	_flush()
 
 	# Hide fission counter initially (shows when first fission used)
 	if fission_counter:
@@ -51,6 +71,11 @@ func _ready() -> void:
 
 	# Connect to GameManager signals
 	GameManager.state_changed.connect(_on_state_changed)
+	GameManager.hp_changed.connect(_on_hp_changed)
+	GameManager.xp_changed.connect(_on_xp_changed)
+	GameManager.level_changed.connect(_on_level_changed)
+	StageManager.progress_changed.connect(_on_stage_progress_changed)
+	StageManager.biome_changed.connect(_on_biome_changed)
 
 	# Connect to FusionRegistry for fission counter
 	if FusionRegistry:
@@ -84,10 +109,69 @@ func _on_pause_pressed() -> void:
 
 
 func _process(_delta: float) -> void:
-	_update_hp()
-	_update_wave()
-	_update_xp()
-	_update_boss_progress()
+	if polling:
+		_dirty = DIRTY_ALL
+	_flush()
+	if not polling:
+		set_process(false)
+
+
+func _mark_dirty(sections: int) -> void:
+	_dirty |= sections
+	set_process(true)
+
+
+func _flush() -> void:
+	"""Redraw dirty sections once (a burst of signals in one frame costs one update)"""
+	if _dirty == 0:
+		return
+	var start := Time.get_ticks_usec()
+	if _dirty & DIRTY_HP:
+		_update_hp()
+	if _dirty & DIRTY_WAVE:
+		_update_wave()
+		_update_boss_progress()
+	if _dirty & DIRTY_XP:
+		_update_xp()
+	_dirty = 0
+	_refresh_count += 1
+	_refresh_usec += Time.get_ticks_usec() - start
+
+
+func _on_hp_changed(_current_hp: int, _max_hp: int) -> void:
+	_mark_dirty(DIRTY_HP)
+
+
+func _on_xp_changed(_current_xp: int, _xp_to_next_level: int) -> void:
+	_mark_dirty(DIRTY_XP)
+
+
+func _on_level_changed(_new_level: int) -> void:
+	_mark_dirty(DIRTY_XP)
+
+
+func _on_stage_progress_changed(_stage: int, _wave_in_stage: int) -> void:
+	_mark_dirty(DIRTY_WAVE)
+
+
+func _on_biome_changed(_biome: Biome) -> void:
+	_mark_dirty(DIRTY_WAVE)
+
+
+func get_update_stats() -> Dictionary:
+	## Refresh counters for comparing polling vs signal-driven frame time
+	return {
+		"polling": polling,
+		"refreshes": _refresh_count,
+		"refresh_usec": _refresh_usec,
+		"avg_refresh_usec": float(_refresh_usec) / maxi(_refresh_count, 1),
+		"process_frame_ms": Performance.get_monitor(Performance.TIME_PROCESS) * 1000.0,
+	}
+
+
+func reset_update_stats() -> void:
+	_refresh_count = 0
+	_refresh_usec = 0
 
 
 func _update_hp() -> void:
@@ -125,22 +209,23 @@ func _update_boss_progress() -> void:
 
 	# Update label based on progress
 	if boss_label:
+		var label_color := BOSS_COLOR_FAR
 		if current_wave >= waves_before_boss:
 			boss_label.text = "BOSS!"
-			boss_label.add_theme_color_override("font_color", Color(1.0, 0.3, 0.2))
+			label_color = BOSS_COLOR_NOW
 		elif current_wave >= waves_before_boss * 0.8:
 			boss_label.text = "BOSS"
-			boss_label.add_theme_color_override("font_color", Color(1.0, 0.6, 0.2))
+			label_color = BOSS_COLOR_NEAR
 		else:
 			boss_label.text = "BOSS"
-			boss_label.add_theme_color_override("font_color", Color(0.7, 0.7, 0.7))
+		# Theme overrides re-resolve the label's style, so only touch it on change
+		if label_color != _boss_label_color:
+			boss_label.add_theme_color_override("font_color", label_color)
+			_boss_label_color = label_color
 
 
 func _on_state_changed(_old_state: GameManager.GameState, _new_state: GameManager.GameState) -> void:
-	_update_hp()
-	_update_wave()
-	_update_xp()
-	_update_boss_progress()
+	_mark_dirty(DIRTY_ALL)
 
 
 func _on_fission_upgrades_changed(total: int) -> void:
@@ -54,11 +54,10 @@ func hide_select() -> void:
 
 
 func _refresh_all_slots() -> void:
-	"""Refresh preview data for all slots."""
-	for i in range(MetaManager.SLOT_COUNT):
-		var slot := i + 1
-		var preview := MetaManager.get_slot_preview(slot)
-		_panels[i].set_slot_data(preview)
+	"""Refresh preview data for all slots (from the slot manifest)."""
+	var previews := MetaManager.get_slot_previews()
+	for i in range(_panels.size()):
+		_panels[i].set_slot_data(previews[i])
 
 
 func _on_slot_pressed(slot: int) -> void:
@@ -0,0 +1,48 @@
+"""Tests for analytic aim-line bounce prediction and its caches."""
+import asyncio
+import pytest
+
+AIM_LINE = "/root/Game/GameArea/AimLine"
+
+
+async def reset_aim_line(game):
+    await game.call(AIM_LINE, "clear_cache")
+    await game.call(AIM_LINE, "reset_update_stats")
+
+
+@pytest.mark.asyncio
+async def test_walls_resolved_for_analytic_solver(game):
+    """The static side walls should be read once so no raycasts are needed."""
+    await reset_aim_line(game)
+    await game.call(AIM_LINE, "show_line", [{"x": 1, "y": -1}, {"x": 600, "y": 1000}])
+
+    stats = await game.call(AIM_LINE, "get_update_stats")
+    assert stats["analytic"] == True, "AimLine should solve bounces against the wall bounds"
+    assert stats["solves"] == 1
+    assert stats["raycasts"] == 0, f"Wall bounces should not raycast, got {stats['raycasts']}"
+
+
+@pytest.mark.asyncio
+async def test_sub_pixel_aim_changes_skip_rebuild(game):
+    """Aim changes smaller than the cache step should not rebuild the line."""
+    await reset_aim_line(game)
+    await game.call(AIM_LINE, "show_line", [{"x": 0.3, "y": -1}, {"x": 360, "y": 1000}])
+    await game.call(AIM_LINE, "show_line", [{"x": 0.3001, "y": -1}, {"x": 360.2, "y": 1000.1}])
+
+    stats = await game.call(AIM_LINE, "get_update_stats")
+    assert stats["updates"] == 2
+    assert stats["unchanged"] == 1, f"Second update should reuse the drawn path, got {stats}"
+    assert stats["solves"] == 1
+
+
+@pytest.mark.asyncio
+async def test_revisited_aim_uses_path_cache(game):
+    """Returning to an earlier aim should come from the path cache."""
+    await reset_aim_line(game)
+    for direction in [{"x": 0.5, "y": -1}, {"x": -0.5, "y": -1}, {"x": 0.5, "y": -1}]:
+        await game.call(AIM_LINE, "show_line", [direction, {"x": 360, "y": 1000}])
+    await asyncio.sleep(0.05)
+
+    stats = await game.call(AIM_LINE, "get_update_stats")
+    assert stats["solves"] == 2, f"Only two distinct aims should be solved, got {stats}"
+    assert stats["cache_hits"] == 1
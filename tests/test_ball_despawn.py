@@ -0,0 +1,67 @@
+"""Tests for balls despawning themselves off-screen (no per-frame controller scan)."""
+import asyncio
+import pytest
+
+GAME = "/root/Game"
+ENTITY_REGISTRY = "/root/EntityRegistry"
+POOL_MANAGER = "/root/PoolManager"
+FIRE_BUTTON = "/root/Game/UI/HUD/InputContainer/HBoxContainer/FireButtonContainer/FireButton"
+
+
+def balls_returned_to_pool(before: dict, after: dict) -> int:
+    """Balls released back into the pool between two get_pool_stats readings.
+
+    Spawning takes balls out of the pool (hits), and releases past the size cap
+    are freed (overflow), so both are added back to the change in availability.
+    """
+    return (
+        after["ball_pool_available"] - before["ball_pool_available"]
+        + after["ball_pool_hits"] - before["ball_pool_hits"]
+        + after["ball_pool_overflow"] - before["ball_pool_overflow"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_controller_scan_removed(game):
+    """The game controller should no longer scan balls every frame."""
+    has_scan = await game.call(GAME, "has_method", ["_cleanup_offscreen_balls"])
+    assert has_scan == False, "_cleanup_offscreen_balls should be gone"
+
+
+@pytest.mark.asyncio
+async def test_offscreen_ball_returns_to_pool(game):
+    """A ball past the top bound should despawn itself back into the pool."""
+    await game.call(FIRE_BUTTON, "set_autofire", [False])
+    await asyncio.sleep(0.5)
+    before = await game.call(ENTITY_REGISTRY, "get_ball_count")
+    pool_before = await game.call(POOL_MANAGER, "get_pool_stats")
+
+    await game.call(GAME, "spawn_test_balls", [5, {"x": 360, "y": -100}])
+    await asyncio.sleep(0.2)
+
+    after = await game.call(ENTITY_REGISTRY, "get_ball_count")
+    assert after == before, f"All off-screen balls should despawn, count {before} -> {after}"
+    pool_after = await game.call(POOL_MANAGER, "get_pool_stats")
+    returned = balls_returned_to_pool(pool_before, pool_after)
+    assert returned == 5, f"All 5 despawned balls should go back to the pool, got {returned}"
+
+
+@pytest.mark.asyncio
+async def test_only_offscreen_balls_despawn_at_any_count(game):
+    """Each ball checks its own bounds: a crowd of on-screen balls is left alone
+    while the off-screen ones among them still despawn."""
+    await game.call(FIRE_BUTTON, "set_autofire", [False])
+    await asyncio.sleep(0.5)
+    before = await game.call(ENTITY_REGISTRY, "get_ball_count")
+    pool_before = await game.call(POOL_MANAGER, "get_pool_stats")
+
+    # Parked balls stay on screen, so nothing should despawn them
+    await game.call(GAME, "spawn_test_balls", [600, {"x": 360, "y": 400}])
+    await game.call(GAME, "spawn_test_balls", [5, {"x": 360, "y": 1400}])
+    await asyncio.sleep(0.2)
+
+    after = await game.call(ENTITY_REGISTRY, "get_ball_count")
+    assert after == before + 600, f"Only the 5 off-screen balls should despawn, count {before} -> {after}"
+    pool_after = await game.call(POOL_MANAGER, "get_pool_stats")
+    returned = balls_returned_to_pool(pool_before, pool_after)
+    assert returned == 5, f"Expected 5 balls back in the pool, got {returned}"
@@ -0,0 +1,35 @@
+"""Tests for the pooled ball lifecycle (caught/despawned balls return to PoolManager)."""
+import asyncio
+import pytest
+
+from helpers import PATHS, wait_for_fire_ready, wait_for_can_fire
+
+POOL_MANAGER = "/root/PoolManager"
+FIRE_BUTTON = PATHS["fire_button"]
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_track_ball_misses(game):
+    """Pool stats should count ball hits and misses for the current run."""
+    stats = await game.call(POOL_MANAGER, "get_pool_stats")
+    for key in ["ball_pool_hits", "ball_pool_misses", "ball_pool_overflow"]:
+        assert key in stats, f"Pool stats should include {key}"
+
+
+@pytest.mark.asyncio
+async def test_salvos_reuse_pooled_balls(game):
+    """Steady-state firing should never allocate: caught balls go back to the pool."""
+    await game.call(FIRE_BUTTON, "set_autofire", [False])
+    await game.call(POOL_MANAGER, "reset_run_stats")
+
+    for _ in range(3):
+        await wait_for_fire_ready(game)
+        await game.click(FIRE_BUTTON)
+        await wait_for_can_fire(game)
+        await asyncio.sleep(0.2)
+
+    stats = await game.call(POOL_MANAGER, "get_pool_stats")
+    assert stats["ball_pool_hits"] > 0, "Salvos should be served from the pool"
+    assert stats["ball_pool_misses"] == 0, f"Steady-state play allocated {stats['ball_pool_misses']} balls"
+
+    await game.call(FIRE_BUTTON, "set_autofire", [True])
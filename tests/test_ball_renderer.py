@@ -0,0 +1,37 @@
+"""Tests for the opt-in batched ball renderer."""
+import asyncio
+import pytest
+
+RENDERER = "/root/Game/GameArea/BallRenderer"
+GAME = "/root/Game"
+
+
+@pytest.mark.asyncio
+async def test_ball_renderer_exists(game):
+    """Game should create a BallRenderer next to the balls container."""
+    node = await game.get_node(RENDERER)
+    assert node is not None, "BallRenderer should exist under GameArea"
+
+
+@pytest.mark.asyncio
+async def test_ball_renderer_defaults_to_per_node(game):
+    """Batched rendering is opt-in."""
+    stats = await game.call(RENDERER, "get_render_stats")
+    assert stats["batched"] is False, "Batched rendering should be off by default"
+
+
+@pytest.mark.asyncio
+async def test_ball_renderer_toggle(game):
+    """A/B toggle should switch redraw work from balls to the renderer."""
+    await game.call(GAME, "_on_fire_pressed")
+    await game.call(RENDERER, "set_batched", [True])
+    await asyncio.sleep(2.2)  # Let a full stats window elapse in batched mode
+
+    stats = await game.call(RENDERER, "get_render_stats")
+    assert stats["batched"] is True, "Renderer should report batched mode"
+    assert stats["batch_redraws_per_sec"] > 0, "Renderer should redraw every frame when batched"
+    assert stats["node_redraws_per_sec"] == 0, "Balls should not redraw themselves when batched"
+
+    await game.call(RENDERER, "set_batched", [False])
+    stats = await game.call(RENDERER, "get_render_stats")
+    assert stats["batched"] is False, "Toggle should switch back to per-node drawing"
@@ -0,0 +1,24 @@
+"""Tests for the PoolManager collision shape cache used by pooled balls."""
+import pytest
+
+POOL_MANAGER = "/root/PoolManager"
+
+
+@pytest.mark.asyncio
+async def test_circle_shape_cache_reuses_shapes(game):
+    """Same radius should map to one cached shape."""
+    before = await game.call(POOL_MANAGER, "get_pool_stats")
+    await game.call(POOL_MANAGER, "get_circle_shape", [14.0])
+    await game.call(POOL_MANAGER, "get_circle_shape", [14.1])  # Snaps to 14.0
+    after = await game.call(POOL_MANAGER, "get_pool_stats")
+    assert after["circle_shapes"] == before["circle_shapes"], "Default radius should already be cached"
+
+
+@pytest.mark.asyncio
+async def test_circle_shape_cache_adds_new_radius(game):
+    """A new radius should add exactly one cached shape."""
+    before = await game.call(POOL_MANAGER, "get_pool_stats")
+    await game.call(POOL_MANAGER, "get_circle_shape", [37.5])
+    await game.call(POOL_MANAGER, "get_circle_shape", [37.5])
+    after = await game.call(POOL_MANAGER, "get_pool_stats")
+    assert after["circle_shapes"] == before["circle_shapes"] + 1, "One shape per distinct radius"
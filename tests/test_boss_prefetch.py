@@ -0,0 +1,78 @@
+"""Tests for BossPrefetcher (threaded boss/mini-boss scene loading ahead of the spawn wave)."""
+import asyncio
+import pytest
+
+GAME_MANAGER = "/root/GameManager"
+BOSS_PREFETCHER = "/root/BossPrefetcher"
+STAGE_MANAGER = "/root/StageManager"
+
+SLIME_KING = "res://scenes/entities/enemies/bosses/slime_king.tscn"
+FROST_WYRM = "res://scenes/entities/enemies/bosses/frost_wyrm.tscn"
+
+
+async def _go_to_wave(game, wave):
+    """Advance the global wave so StageManager reports wave_in_stage == wave (stage 0)."""
+    await game.call(GAME_MANAGER, "set", ["current_wave", wave - 1])
+    await game.call(GAME_MANAGER, "advance_wave")
+
+
+async def _wait_for_prefetch(game, path, timeout=5.0):
+    elapsed = 0.0
+    while elapsed < timeout:
+        if await game.call(BOSS_PREFETCHER, "is_prefetched", [path]):
+            return True
+        await asyncio.sleep(0.1)
+        elapsed += 0.1
+    return False
+
+
+@pytest.mark.asyncio
+async def test_nothing_prefetched_at_run_start(game):
+    """Wave 1 is too early for any boss or mini-boss load."""
+    stats = await game.call(BOSS_PREFETCHER, "get_stats")
+    assert stats["stage"] == 0
+    assert stats["requested_total"] == 0, f"Nothing should load at wave 1, got {stats}"
+
+
+@pytest.mark.asyncio
+async def test_current_stage_boss_prefetched_before_boss_wave(game):
+    """Only the current stage's boss should start loading a couple of waves early."""
+    await _go_to_wave(game, 8)
+
+    assert await _wait_for_prefetch(game, SLIME_KING), "Slime King should be loaded by wave 8"
+    assert not await game.call(BOSS_PREFETCHER, "is_prefetched", [FROST_WYRM]), \
+        "Other stages' bosses should not be loaded"
+
+
+@pytest.mark.asyncio
+async def test_next_boss_not_requested_on_stage_change(game):
+    """Completing a stage lands on wave 1 of the next one, far from its boss wave."""
+    await _go_to_wave(game, 9)
+    before = await game.call(BOSS_PREFETCHER, "get_stats")
+
+    await game.call(STAGE_MANAGER, "complete_stage")
+    await asyncio.sleep(0.2)
+
+    stats = await game.call(BOSS_PREFETCHER, "get_stats")
+    assert stats["stage"] == 1
+    assert stats["requested_total"] == before["requested_total"], (
+        f"Nothing should be requested at wave 1 of the next stage, got {stats}"
+    )
+    assert not await game.call(BOSS_PREFETCHER, "is_prefetched", [FROST_WYRM])
+
+
+@pytest.mark.asyncio
+async def test_boss_spawn_uses_prefetched_scene(game):
+    """The boss wave should spawn from the prefetched scene and record the spawn frame."""
+    await _go_to_wave(game, 8)
+    assert await _wait_for_prefetch(game, SLIME_KING)
+    before = await game.call(BOSS_PREFETCHER, "get_stats")
+
+    await _go_to_wave(game, 10)
+    await asyncio.sleep(0.2)
+
+    stats = await game.call(BOSS_PREFETCHER, "get_stats")
+    assert stats["ready_hits"] == before["ready_hits"] + 1, f"Boss spawn should hit the prefetch, got {stats}"
+    assert stats["sync_loads"] == before["sync_loads"], "Boss spawn should not load on the main thread"
+    assert stats["last_spawn_kind"] == "boss"
+    assert stats["last_spawn_frame_ms"] > 0.0, "Boss spawn frame time should be recorded"
@@ -0,0 +1,82 @@
+"""Tests for the cached CombatModifiers snapshot in GameManager."""
+import pytest
+
+GAME_MANAGER = "/root/GameManager"
+
+# Passive enum values (match GameManager.Passive enum)
+PASSIVE_NONE = 0
+PASSIVE_JACKPOT = 3
+PASSIVE_BOUNCE_MASTER = 7
+
+
+async def get_mods(game) -> dict:
+    return await game.call(GAME_MANAGER, "get_combat_modifiers_dict")
+
+
+@pytest.mark.asyncio
+async def test_snapshot_matches_getters(game):
+    """Snapshot fields should equal the getter values they cache."""
+    await game.call(GAME_MANAGER, "set", ["active_passive", PASSIVE_NONE])
+    mods = await get_mods(game)
+    getters = {
+        "bounce_damage_mult": "get_bounce_damage_multiplier",
+        "crit_chance": "get_total_crit_chance",
+        "crit_damage_mult": "get_crit_damage_multiplier",
+        "damage_vs_frozen": "get_damage_vs_frozen",
+        "damage_vs_burning": "get_damage_vs_burning",
+    }
+    for field, getter in getters.items():
+        expected = await game.call(GAME_MANAGER, getter)
+        assert mods[field] == pytest.approx(expected), f"{field} should match {getter}()"
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_reused_until_inputs_change(game):
+    """Reading twice without changes should not rebuild the snapshot."""
+    first = await get_mods(game)
+    second = await get_mods(game)
+    assert first["version"] == second["version"], "Snapshot should be cached between reads"
+
+
+@pytest.mark.asyncio
+async def test_passive_change_invalidates_snapshot(game):
+    """Switching passive should rebuild the snapshot with the new values."""
+    await game.call(GAME_MANAGER, "set", ["active_passive", PASSIVE_NONE])
+    before = await get_mods(game)
+
+    await game.call(GAME_MANAGER, "set", ["active_passive", PASSIVE_JACKPOT])
+    after = await get_mods(game)
+    assert after["version"] > before["version"], "Passive change should rebuild the snapshot"
+    assert after["crit_damage_mult"] == pytest.approx(3.0), "Jackpot crits should deal 3x"
+
+    await game.call(GAME_MANAGER, "set", ["active_passive", PASSIVE_BOUNCE_MASTER])
+    mods = await get_mods(game)
+    assert mods["bounce_damage_mult"] == pytest.approx(0.05), "Bounce Master adds 5% per bounce"
+    assert mods["crit_damage_mult"] == pytest.approx(2.0), "Jackpot bonus should be gone"
+
+    await game.call(GAME_MANAGER, "set", ["active_passive", PASSIVE_NONE])
+
+
+@pytest.mark.asyncio
+async def test_level_change_invalidates_snapshot(game):
+    """Player level feeds dexterity crit, so leveling should rebuild."""
+    before = await get_mods(game)
+    level = await game.get_property(GAME_MANAGER, "player_level")
+    await game.call(GAME_MANAGER, "set", ["player_level", level + 1])
+    after = await get_mods(game)
+    assert after["version"] > before["version"], "Level change should rebuild the snapshot"
+    await game.call(GAME_MANAGER, "set", ["player_level", level])
+
+
+@pytest.mark.asyncio
+async def test_benchmark_snapshot_beats_getters(game):
+    """Cached reads should give identical damage at a higher hits/sec."""
+    await game.call(GAME_MANAGER, "set", ["active_passive", PASSIVE_BOUNCE_MASTER])
+    result = await game.call(GAME_MANAGER, "benchmark_combat_modifiers", [20000])
+    await game.call(GAME_MANAGER, "set", ["active_passive", PASSIVE_NONE])
+
+    assert result["mismatches"] == 0, f"Snapshot and getters disagreed on {result['mismatches']} hits"
+    assert result["snapshot_hits_per_sec"] > result["getter_hits_per_sec"], (
+        f"Snapshot should be faster: getters={result['getter_hits_per_sec']:.0f}/s "
+        f"snapshot={result['snapshot_hits_per_sec']:.0f}/s"
+    )
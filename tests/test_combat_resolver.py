@@ -0,0 +1,60 @@
+"""Tests for CombatResolver (ball hits batched and resolved once per frame)."""
+import asyncio
+import pytest
+
+GAME = "/root/Game"
+GAME_MANAGER = "/root/GameManager"
+COMBAT_RESOLVER = "/root/CombatResolver"
+ENTITY_REGISTRY = "/root/EntityRegistry"
+GOLEM_SCENE = "res://scenes/entities/enemies/golem.tscn"
+
+
+@pytest.mark.asyncio
+async def test_hits_merge_per_enemy(game):
+    """Several hits on one enemy in a frame should resolve as one merged hit."""
+    enemy_path = await game.call(GAME, "spawn_test_enemy", [GOLEM_SCENE])
+    await asyncio.sleep(0.1)
+    hp_before = await game.get_property(enemy_path, "hp")
+    stats_before = await game.call(COMBAT_RESOLVER, "get_stats")
+
+    for _ in range(3):
+        await game.call(COMBAT_RESOLVER, "queue_hit_by_path", [enemy_path, 5])
+    await asyncio.sleep(0.1)
+
+    hp_after = await game.get_property(enemy_path, "hp")
+    assert hp_after == hp_before - 15, f"Three 5-damage hits should deal 15, hp {hp_before} -> {hp_after}"
+
+    stats = await game.call(COMBAT_RESOLVER, "get_stats")
+    assert stats["hits_total"] - stats_before["hits_total"] >= 3
+    assert stats["pending_enemies"] == 0, "Queue should be empty after the physics step"
+
+
+@pytest.mark.asyncio
+async def test_damage_recorded_once_per_batch(game):
+    """Damage dealt should be recorded for the whole batch."""
+    enemy_path = await game.call(GAME, "spawn_test_enemy", [GOLEM_SCENE])
+    await asyncio.sleep(0.1)
+    before = await game.get_property(GAME_MANAGER, "stats")
+
+    await game.call(COMBAT_RESOLVER, "queue_hit_by_path", [enemy_path, 4])
+    await game.call(COMBAT_RESOLVER, "queue_hit_by_path", [enemy_path, 6])
+    await asyncio.sleep(0.1)
+
+    after = await game.get_property(GAME_MANAGER, "stats")
+    assert after["damage_dealt"] - before["damage_dealt"] >= 10
+
+
+@pytest.mark.asyncio
+async def test_kill_from_batched_hits(game):
+    """A merged hit that exceeds HP should kill the enemy once."""
+    enemy_path = await game.call(GAME, "spawn_test_enemy", [GOLEM_SCENE])
+    await asyncio.sleep(0.1)
+    hp = await game.get_property(enemy_path, "hp")
+    golems = await game.call(ENTITY_REGISTRY, "get_enemy_count", ["golem"])
+
+    await game.call(COMBAT_RESOLVER, "queue_hit_by_path", [enemy_path, hp])
+    await game.call(COMBAT_RESOLVER, "queue_hit_by_path", [enemy_path, hp])
+    await asyncio.sleep(0.1)
+
+    after = await game.call(ENTITY_REGISTRY, "get_enemy_count", ["golem"])
+    assert after == golems - 1, f"Lethal batched damage should kill the golem once, {golems} -> {after}"
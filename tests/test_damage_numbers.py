@@ -0,0 +1,32 @@
+"""Tests for the batched damage-number layer."""
+import asyncio
+import pytest
+
+GAME = "/root/Game"
+LAYER = "/root/Game/DamageNumberLayer"
+
+
+@pytest.mark.asyncio
+async def test_hit_spawns_into_single_layer(game):
+    """Damage numbers should be drawn by one DamageNumberLayer, not a Label per hit."""
+    enemy_path = await game.call(GAME, "spawn_test_enemy", ["res://scenes/entities/enemies/golem.tscn"])
+    assert enemy_path, "Should spawn a test enemy"
+
+    for _ in range(5):
+        await game.call(enemy_path, "take_damage", [1])
+    await asyncio.sleep(0.05)
+
+    stats = await game.call(LAYER, "get_stats")
+    assert stats["active"] >= 5, f"Expected 5 active numbers, got {stats['active']}"
+
+
+@pytest.mark.asyncio
+async def test_layer_respects_hard_cap(game):
+    """Active numbers should never exceed MAX_NUMBERS."""
+    enemy_path = await game.call(GAME, "spawn_test_enemy", ["res://scenes/entities/enemies/golem.tscn"])
+    await game.call(enemy_path, "take_damage", [1])
+
+    max_numbers = await game.get_property(LAYER, "MAX_NUMBERS")
+    stats = await game.call(LAYER, "get_stats")
+    assert stats["active"] <= max_numbers, f"Active {stats['active']} exceeds cap {max_numbers}"
+
@@ -0,0 +1,59 @@
+"""Tests for the EnemyGrid spatial index used by AoE ball effects."""
+import asyncio
+import pytest
+
+ENEMY_GRID = "/root/EnemyGrid"
+ENEMY_SPAWNER = "/root/Game/GameArea/Enemies/EnemySpawner"
+
+
+async def spawn_enemies(game, count: int) -> None:
+    """Spawn enemies through the regular spawner."""
+    for _ in range(count):
+        await game.call(ENEMY_SPAWNER, "spawn_enemy")
+    await asyncio.sleep(0.1)
+
+
+@pytest.mark.asyncio
+async def test_enemy_grid_autoload_exists(game):
+    """EnemyGrid autoload should be registered."""
+    node = await game.get_node(ENEMY_GRID)
+    assert node is not None, "EnemyGrid autoload should exist"
+
+
+@pytest.mark.asyncio
+async def test_enemy_grid_has_query_methods(game):
+    """EnemyGrid should expose radius, nearest and segment queries."""
+    for method in ["query_radius", "query_nearest", "query_segment"]:
+        has_method = await game.call(ENEMY_GRID, "has_method", [method])
+        assert has_method, f"EnemyGrid should have {method} method"
+
+
+@pytest.mark.asyncio
+async def test_enemy_grid_counts_spawned_enemies(game):
+    """Grid should index every spawned enemy."""
+    before = await game.call(ENEMY_GRID, "get_enemy_count")
+    await spawn_enemies(game, 3)
+    after = await game.call(ENEMY_GRID, "get_enemy_count")
+    assert after >= before + 3, f"Expected at least {before + 3} indexed enemies, got {after}"
+
+
+@pytest.mark.asyncio
+async def test_enemy_grid_nearest_returns_at_most_k(game):
+    """query_nearest should never return more than k enemies."""
+    await spawn_enemies(game, 5)
+    nearest = await game.call(ENEMY_GRID, "query_nearest", [{"x": 360, "y": 0}, 2])
+    assert len(nearest) <= 2, f"Expected at most 2 enemies, got {len(nearest)}"
+
+
+@pytest.mark.asyncio
+async def test_enemy_grid_benchmark_matches_scan_at_200_enemies(game):
+    """Grid queries should match a full scan and beat it with 200+ enemies."""
+    await spawn_enemies(game, 220)
+
+    result = await game.call(ENEMY_GRID, "benchmark", [500, 100.0])
+    assert result["enemies"] >= 200, f"Benchmark needs 200+ enemies, got {result['enemies']}"
+    assert result["mismatches"] == 0, f"Grid and scan disagreed on {result['mismatches']} queries"
+    assert result["speedup"] > 1.0, (
+        f"Grid should be faster than a full scan: grid={result['grid_usec']}us "
+        f"scan={result['scan_usec']}us"
+    )
@@ -0,0 +1,36 @@
+"""Tests for per-scene enemy pooling in PoolManager."""
+import asyncio
+import pytest
+
+POOL_MANAGER = "/root/PoolManager"
+ENEMY_SPAWNER = "/root/Game/GameArea/Enemies/EnemySpawner"
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_include_enemy_pools(game):
+    """get_pool_stats should report enemy pool availability and hit/miss counts."""
+    stats = await game.call(POOL_MANAGER, "get_pool_stats")
+    for key in ["enemy_pool_available", "enemy_pool_hits", "enemy_pool_misses"]:
+        assert key in stats, f"Pool stats should include {key}"
+
+
+@pytest.mark.asyncio
+async def test_enemy_pools_prewarmed_from_biome(game):
+    """The current biome's enemy scenes should be prewarmed."""
+    stats = await game.call(POOL_MANAGER, "get_pool_stats")
+    assert stats["enemy_pool_scenes"] >= 1, "At least one enemy scene should have a pool"
+    assert stats["enemy_pool_available"] > 0, "Prewarmed enemies should be available"
+
+
+@pytest.mark.asyncio
+async def test_spawns_are_served_by_pool(game):
+    """Every spawned enemy should come from the pool (hit) or a counted miss."""
+    before = await game.call(POOL_MANAGER, "get_pool_stats")
+    await game.call(ENEMY_SPAWNER, "spawn_enemy")
+    await asyncio.sleep(0.1)
+    after = await game.call(POOL_MANAGER, "get_pool_stats")
+
+    served_before = before["enemy_pool_hits"] + before["enemy_pool_misses"]
+    served_after = after["enemy_pool_hits"] + after["enemy_pool_misses"]
+    assert served_after > served_before, "Spawning should go through PoolManager.get_enemy"
+    assert after["enemy_pool_hits"] > before["enemy_pool_hits"], "First spawns should hit the prewarmed pool"
@@ -0,0 +1,69 @@
+"""Tests for EntityRegistry (player, containers and live entity counts)."""
+import asyncio
+import pytest
+
+GAME = "/root/Game"
+ENTITY_REGISTRY = "/root/EntityRegistry"
+BALLS = "/root/Game/GameArea/Balls"
+FIRE_BUTTON = "/root/Game/UI/HUD/InputContainer/HBoxContainer/FireButtonContainer/FireButton"
+
+# EntityRegistry.BallCategory values
+MAIN = 0
+BABY = 1
+EVOLVED = 2
+
+
+@pytest.mark.asyncio
+async def test_player_and_containers_registered(game):
+    """The game scene should register the player and its containers."""
+    stats = await game.call(ENTITY_REGISTRY, "get_stats")
+    assert stats["has_player"] == True, "Player should register itself in _ready"
+
+    container = await game.call(ENTITY_REGISTRY, "get_container", ["enemies_container"])
+    assert container is not None, "Enemies container should be registered"
+
+
+@pytest.mark.asyncio
+async def test_enemy_counts_follow_spawn_and_despawn(game):
+    """Spawning and despawning an enemy should update its type count."""
+    before = await game.call(ENTITY_REGISTRY, "get_enemy_count", ["golem"])
+    enemy_path = await game.call(GAME, "spawn_test_enemy", ["res://scenes/entities/enemies/golem.tscn"])
+    await asyncio.sleep(0.05)
+
+    during = await game.call(ENTITY_REGISTRY, "get_enemy_count", ["golem"])
+    assert during == before + 1, f"Golem count should go up on spawn, got {before} -> {during}"
+
+    await game.call(enemy_path, "despawn")
+    await asyncio.sleep(0.1)
+    after = await game.call(ENTITY_REGISTRY, "get_enemy_count", ["golem"])
+    assert after == before, f"Golem count should go back down on despawn, got {after}"
+
+
+@pytest.mark.asyncio
+async def test_ball_counts_are_consistent(game):
+    """Per-category ball counts should add up."""
+    await asyncio.sleep(0.5)
+    stats = await game.call(ENTITY_REGISTRY, "get_stats")
+    assert stats["balls"] == stats["main_balls"] + stats["baby_balls"] + stats["evolved_balls"]
+    assert min(stats["main_balls"], stats["baby_balls"], stats["evolved_balls"]) >= 0
+
+
+@pytest.mark.asyncio
+async def test_baby_ball_count_matches_scene_tree(game):
+    """The registry's baby ball count should match the baby balls actually in play."""
+    await game.call(FIRE_BUTTON, "set_autofire", [False])
+    await asyncio.sleep(0.5)
+
+    # Parked on screen, so they stay in play while the tree is counted
+    await game.call(GAME, "spawn_test_balls", [3, {"x": 360, "y": 400}, 0.0, True])
+    await asyncio.sleep(0.1)
+
+    in_tree = 0
+    for i in range(await game.call(BALLS, "get_child_count")):
+        child = await game.call(BALLS, "get_child", [i])
+        if await game.get_property(f"{BALLS}/{child['name']}", "is_baby_ball") == True:
+            in_tree += 1
+    assert in_tree >= 3, f"Spawned baby balls should be in the tree, found {in_tree}"
+
+    registry_babies = await game.call(ENTITY_REGISTRY, "get_ball_count", [BABY])
+    assert registry_babies == in_tree, f"Registry counts {registry_babies} baby balls, tree has {in_tree}"
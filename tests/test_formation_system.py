@@ -0,0 +1,45 @@
+"""Tests for FormationSystem (formations moved from packed offsets by one autoload)."""
+import asyncio
+import pytest
+
+FORMATION_SYSTEM = "/root/FormationSystem"
+ENEMY_SPAWNER = "/root/Game/GameArea/Enemies/EnemySpawner"
+
+# EnemySpawner.Formation values
+STAGGERED_ROWS = 6
+WALL = 7
+
+
+@pytest.mark.asyncio
+async def test_formation_registers_members(game):
+    """spawn_formation should hand every member to FormationSystem."""
+    before = await game.call(FORMATION_SYSTEM, "get_stats")
+    await game.call(ENEMY_SPAWNER, "spawn_formation", [WALL, 12])
+
+    after = await game.call(FORMATION_SYSTEM, "get_stats")
+    assert after["formations"] == before["formations"] + 1, "WALL should create one formation"
+    assert after["members"] == before["members"] + 12, f"All 12 members should be tracked, got {after}"
+
+
+@pytest.mark.asyncio
+async def test_followers_hold_offsets(game):
+    """While descending, followers should stay exactly at leader + offset."""
+    await game.call(ENEMY_SPAWNER, "spawn_formation", [STAGGERED_ROWS, 8])
+    await asyncio.sleep(0.3)
+
+    error = await game.call(FORMATION_SYSTEM, "get_max_offset_error")
+    assert error < 0.01, f"Followers should not drift from their slots, max error {error}"
+
+
+@pytest.mark.asyncio
+async def test_large_formations(game):
+    """Thousands of members should be tracked and moved in one packed pass."""
+    await game.call(FORMATION_SYSTEM, "clear")
+    await game.call(ENEMY_SPAWNER, "spawn_formation", [WALL, 1000])
+    await game.call(ENEMY_SPAWNER, "spawn_formation", [STAGGERED_ROWS, 1000])
+    await asyncio.sleep(0.2)
+
+    stats = await game.call(FORMATION_SYSTEM, "get_stats")
+    assert stats["members"] >= 1900, f"Large formations should be tracked, got {stats}"
+    error = await game.call(FORMATION_SYSTEM, "get_max_offset_error")
+    assert error < 0.01, f"Large formations should hold their offsets, max error {error}"
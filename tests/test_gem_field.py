@@ -0,0 +1,64 @@
+"""Tests for GemField (all gems simulated and drawn by one node)."""
+import asyncio
+import pytest
+
+GAME_MANAGER = "/root/GameManager"
+GEM_FIELD = "/root/Game/GameArea/Gems/GemField"
+PLAYER = "/root/Game/GameArea/Player"
+
+
+@pytest.mark.asyncio
+async def test_gem_field_exists(game):
+    """The game scene should create a GemField under the gems container."""
+    node = await game.get_node(GEM_FIELD)
+    assert node is not None, "GemField should exist"
+
+    base_speed = await game.get_property(GEM_FIELD, "base_speed")
+    assert base_speed == 150.0, f"GemField should keep gem base speed 150, got {base_speed}"
+
+
+@pytest.mark.asyncio
+async def test_far_gem_is_simulated_not_collected(game):
+    """A gem away from the player should stay in the field."""
+    await game.call(GEM_FIELD, "clear")
+    await game.call(GAME_MANAGER, "set", ["gem_magnetism_range", 0.0])
+    await game.call(GEM_FIELD, "spawn_gem", [{"x": 100, "y": 400}])
+    await asyncio.sleep(0.1)
+
+    count = await game.call(GEM_FIELD, "get_gem_count")
+    assert count == 1, f"Far gem should still be active, got {count}"
+
+
+@pytest.mark.asyncio
+async def test_gem_at_player_is_collected(game):
+    """A gem spawned on the player should be collected and counted."""
+    await game.call(GEM_FIELD, "clear")
+    before = await game.call(GEM_FIELD, "get_stats")
+    stats_before = await game.get_property(GAME_MANAGER, "stats")
+
+    player_pos = await game.get_property(PLAYER, "global_position")
+    await game.call(GEM_FIELD, "spawn_gem", [player_pos])
+    await asyncio.sleep(0.1)
+
+    after = await game.call(GEM_FIELD, "get_stats")
+    assert after["gems"] == 0, "Gem on the player should be collected"
+    assert after["collected_total"] == before["collected_total"] + 1
+
+    # collected signal still reaches game_controller._on_gem_collected
+    stats_after = await game.get_property(GAME_MANAGER, "stats")
+    assert stats_after["gems_collected"] == stats_before["gems_collected"] + 1
+
+
+@pytest.mark.asyncio
+async def test_health_gem_heals(game):
+    """Health gems should heal the player on pickup."""
+    await game.call(GEM_FIELD, "clear")
+    max_hp = await game.get_property(GAME_MANAGER, "max_hp")
+    await game.call(GAME_MANAGER, "set", ["player_hp", max_hp - 20])
+
+    player_pos = await game.get_property(PLAYER, "global_position")
+    await game.call(GEM_FIELD, "spawn_gem", [player_pos, True])
+    await asyncio.sleep(0.1)
+
+    hp = await game.get_property(GAME_MANAGER, "player_hp")
+    assert hp == max_hp - 10, f"Health gem should heal 10 HP, got {hp}/{max_hp}"
@@ -0,0 +1,46 @@
+"""Tests for the signal-driven HUD (no per-frame label rebuilds)."""
+import asyncio
+import pytest
+
+GAME_MANAGER = "/root/GameManager"
+HUD = "/root/Game/UI/HUD"
+HP_LABEL = "/root/Game/UI/HUD/TopBar/HPBar/HPLabel"
+LEVEL_LABEL = "/root/Game/UI/HUD/XPBarContainer/LevelLabel"
+XP_BAR = "/root/Game/UI/HUD/XPBarContainer/XPBar"
+
+
+@pytest.mark.asyncio
+async def test_hp_label_follows_hp_changes(game):
+    """Setting player_hp should update the HP label on the next frame."""
+    max_hp = await game.get_property(GAME_MANAGER, "max_hp")
+    await game.call(GAME_MANAGER, "set", ["player_hp", max_hp - 7])
+    await asyncio.sleep(0.1)
+
+    text = await game.get_property(HP_LABEL, "text")
+    assert text == f"{max_hp - 7}/{max_hp}", f"HP label should show new HP, got {text}"
+
+
+@pytest.mark.asyncio
+async def test_xp_and_level_follow_changes(game):
+    """XP bar and level label should update from xp_changed / level_changed."""
+    await game.call(GAME_MANAGER, "set", ["current_xp", 3])
+    await game.call(GAME_MANAGER, "set", ["player_level", 4])
+    await asyncio.sleep(0.1)
+
+    value = await game.get_property(XP_BAR, "value")
+    assert value == 3, f"XP bar should show 3 XP, got {value}"
+    text = await game.get_property(LEVEL_LABEL, "text")
+    assert text == "Lv.4", f"Level label should show Lv.4, got {text}"
+
+
+@pytest.mark.asyncio
+async def test_hud_idles_without_changes(game):
+    """With nothing changing, the HUD should stop processing and skip refreshes."""
+    await asyncio.sleep(0.2)
+    await game.call(HUD, "reset_update_stats")
+    await asyncio.sleep(0.3)
+
+    stats = await game.call(HUD, "get_update_stats")
+    assert stats["polling"] == False
+    # ~18 frames elapsed; only real HP/XP/wave changes may refresh
+    assert stats["refreshes"] < 10, f"Idle HUD should not refresh every frame, got {stats['refreshes']}"
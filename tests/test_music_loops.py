@@ -0,0 +1,60 @@
+"""Tests for MusicManager's pre-rendered biome loops."""
+import asyncio
+import pytest
+
+MUSIC_MANAGER = "/root/MusicManager"
+
+
+async def wait_for_loops(game, timeout: float = 10.0) -> dict:
+    """Poll until every biome loop has been rendered and cached."""
+    stats = {}
+    elapsed = 0.0
+    while elapsed < timeout:
+        stats = await game.call(MUSIC_MANAGER, "get_loop_cache_stats")
+        if stats["loops_pending"] == 0:
+            break
+        await asyncio.sleep(0.25)
+        elapsed += 0.25
+    return stats
+
+
+@pytest.mark.asyncio
+async def test_loop_cache_stats_exist(game):
+    """MusicManager should report loop cache stats."""
+    stats = await game.call(MUSIC_MANAGER, "get_loop_cache_stats")
+    assert stats["loops_total"] == 16, f"Expected 8 biomes x 2 variants, got {stats['loops_total']}"
+    assert stats["render_msec"] >= 0.0, "Stats should report render time"
+
+
+@pytest.mark.asyncio
+async def test_loops_finish_rendering(game):
+    """All loop renders should complete in the background."""
+    stats = await wait_for_loops(game)
+    assert stats["loops_pending"] == 0, f"Loop renders still pending: {stats['loops_pending']}"
+
+
+@pytest.mark.asyncio
+async def test_music_plays_cached_loop(game):
+    """Once rendered, playback should switch to the cached loop for the biome."""
+    await wait_for_loops(game)
+    await game.call(MUSIC_MANAGER, "start_music")
+    await asyncio.sleep(0.2)
+
+    stats = await game.call(MUSIC_MANAGER, "get_loop_cache_stats")
+    assert stats["active_loop"].endswith("|normal"), f"Expected a normal loop, got {stats['active_loop']!r}"
+    assert stats["bytes"] > 0, "Cached loops should report sample memory"
+
+
+@pytest.mark.asyncio
+async def test_boss_mode_switches_loop(game):
+    """Boss mode should swap to the boss variant and back."""
+    await wait_for_loops(game)
+    await game.call(MUSIC_MANAGER, "start_music")
+
+    await game.call(MUSIC_MANAGER, "set_boss_mode", [True])
+    stats = await game.call(MUSIC_MANAGER, "get_loop_cache_stats")
+    assert stats["active_loop"].endswith("|boss"), f"Expected boss loop, got {stats['active_loop']!r}"
+
+    await game.call(MUSIC_MANAGER, "set_boss_mode", [False])
+    stats = await game.call(MUSIC_MANAGER, "get_loop_cache_stats")
+    assert stats["active_loop"].endswith("|normal"), f"Expected normal loop, got {stats['active_loop']!r}"
@@ -0,0 +1,39 @@
+"""Tests for pooled hit and status particle emitters."""
+import asyncio
+import pytest
+
+POOL_MANAGER = "/root/PoolManager"
+GAME = "/root/Game"
+
+
+@pytest.mark.asyncio
+async def test_particle_pool_stats(game):
+    """Pool stats should report particle emitter usage."""
+    stats = await game.call(POOL_MANAGER, "get_pool_stats")
+    for key in ["particle_pool_available", "particles_live", "particles_dropped"]:
+        assert key in stats, f"Pool stats should include {key}"
+
+
+@pytest.mark.asyncio
+async def test_hit_particles_return_to_pool(game):
+    """One-shot hit emitters should go back to the pool when they finish."""
+    enemy_path = await game.call(GAME, "spawn_test_enemy", ["res://scenes/entities/enemies/slime.tscn"])
+    assert enemy_path, "Should spawn a test enemy"
+
+    await game.call(enemy_path, "take_damage", [1])
+    await asyncio.sleep(0.1)
+    during = await game.call(POOL_MANAGER, "get_pool_stats")
+    assert during["particles_live"] >= 1, "Hit should check out an emitter"
+
+    # Hit particles live for 0.3s
+    await asyncio.sleep(0.8)
+    after = await game.call(POOL_MANAGER, "get_pool_stats")
+    assert after["particle_pool_available"] >= 1, "Finished emitter should be back in the pool"
+
+
+@pytest.mark.asyncio
+async def test_live_particles_respect_cap(game):
+    """Live emitters should never exceed PARTICLE_LIVE_CAP."""
+    cap = await game.get_property(POOL_MANAGER, "PARTICLE_LIVE_CAP")
+    stats = await game.call(POOL_MANAGER, "get_pool_stats")
+    assert stats["particles_live"] <= cap, f"Live emitters {stats['particles_live']} exceed cap {cap}"
@@ -0,0 +1,94 @@
+"""Tests for the FusionRegistry recipe index and cached available-recipe lists."""
+import asyncio
+import pytest
+
+BALL_REGISTRY = "/root/BallRegistry"
+FUSION_REGISTRY = "/root/FusionRegistry"
+
+# BallType values
+BURN = 1
+FREEZE = 2
+POISON = 3
+IRON = 6
+# EvolvedBallType values
+BOMB = 1
+VIRUS = 3
+STORM = 7
+BLACK_HOLE = 12
+ANTIMATTER = 15
+VOID = 5
+OBLIVION = 24
+
+
+async def reset_registries(game):
+    """Reset both registries to clean state for testing."""
+    await game.call(BALL_REGISTRY, "reset")
+    await game.call(FUSION_REGISTRY, "reset")
+    await asyncio.sleep(0.1)
+
+
+async def add_l3_basic_ball(game, ball_type: int) -> None:
+    """Add a ball type and level it to L3."""
+    await game.call(BALL_REGISTRY, "add_ball", [ball_type])
+    await game.call(BALL_REGISTRY, "level_up_ball", [ball_type])
+    await game.call(BALL_REGISTRY, "level_up_ball", [ball_type])
+    await asyncio.sleep(0.05)
+
+
+@pytest.mark.asyncio
+async def test_evolution_lookup_is_order_independent(game):
+    """Pair lookups should give the same result for either ingredient order."""
+    forward = await game.call(FUSION_REGISTRY, "get_evolution_result", [BURN, IRON])
+    backward = await game.call(FUSION_REGISTRY, "get_evolution_result", [IRON, BURN])
+    assert forward == BOMB, f"BURN + IRON should make BOMB, got {forward}"
+    assert backward == BOMB, f"IRON + BURN should make BOMB, got {backward}"
+
+    has_none = await game.call(FUSION_REGISTRY, "has_evolution_recipe", [BURN, BURN])
+    assert has_none == False, "BURN + BURN is not a recipe"
+
+
+@pytest.mark.asyncio
+async def test_ultimate_lookup_handles_underscored_names(game):
+    """Ultimate recipes with multi-word ingredients (BLACK_HOLE) should be indexed in any order."""
+    result = await game.call(FUSION_REGISTRY, "get_ultimate_result", [VOID, BLACK_HOLE, ANTIMATTER])
+    assert result == OBLIVION, f"Black Hole + Antimatter + Void should make OBLIVION, got {result}"
+
+    result = await game.call(FUSION_REGISTRY, "get_ultimate_result", [STORM, BOMB, VIRUS])
+    assert result != 0, "Bomb + Storm + Virus should be an ultimate recipe"
+
+    recipes = await game.call(FUSION_REGISTRY, "get_ultimate_recipes")
+    assert len(recipes) == 5, f"All 5 ultimate recipes should be indexed, got {len(recipes)}"
+
+
+@pytest.mark.asyncio
+async def test_reverse_maps(game):
+    """Ingredient reverse maps should list every recipe that consumes a ball."""
+    burn_recipes = await game.call(FUSION_REGISTRY, "get_recipes_using_ball", [BURN])
+    for key in ["BURN_IRON", "BURN_POISON", "BURN_FREEZE", "GLACIER_BURN", "PLASMA_BURN"]:
+        assert key in burn_recipes, f"{key} should be listed for BURN, got {burn_recipes}"
+
+    bomb_recipes = await game.call(FUSION_REGISTRY, "get_recipes_using_evolved", [BOMB])
+    assert "BOMB_POISON" in bomb_recipes
+    assert "BOMB_STORM_VIRUS" in bomb_recipes
+
+
+@pytest.mark.asyncio
+async def test_available_cache_invalidates_on_ball_changes(game):
+    """Cached available evolutions should refresh after BallRegistry changes."""
+    await reset_registries(game)
+
+    def bomb_entry(recipes):
+        return next(r for r in recipes if r["recipe_key"] == "BURN_IRON")
+
+    recipes = await game.call(FUSION_REGISTRY, "get_available_evolutions")
+    assert bomb_entry(recipes)["can_create"] == False
+
+    await add_l3_basic_ball(game, BURN)
+    await add_l3_basic_ball(game, IRON)
+    recipes = await game.call(FUSION_REGISTRY, "get_available_evolutions")
+    assert bomb_entry(recipes)["can_create"] == True, "BOMB should be available after L3 BURN + IRON"
+
+    result = await game.call(FUSION_REGISTRY, "evolve_balls", [BURN, IRON])
+    assert result == BOMB
+    recipes = await game.call(FUSION_REGISTRY, "get_available_evolutions")
+    assert bomb_entry(recipes)["can_create"] == False, "Consumed balls should no longer be available"
@@ -0,0 +1,67 @@
+"""Tests for SaveCoordinator (debounced write-behind saves with atomic replace)."""
+import asyncio
+import pytest
+
+SAVE_COORDINATOR = "/root/SaveCoordinator"
+SOUND_MANAGER = "/root/SoundManager"
+META_MANAGER = "/root/MetaManager"
+
+# Longer than SaveCoordinator.DEBOUNCE_MSEC
+DEBOUNCE_WAIT = 1.5
+
+
+@pytest.mark.asyncio
+async def test_autoloads_register_their_save_files(game):
+    """Meta, session, audio settings and high scores should all go through the coordinator."""
+    stats = await game.call(SAVE_COORDINATOR, "get_stats")
+    assert stats["registered"] >= 4, f"Expected at least 4 registered save files, got {stats}"
+
+
+@pytest.mark.asyncio
+async def test_slider_ticks_coalesce_into_one_write(game):
+    """Many volume changes in a row should produce a single settings write."""
+    await game.call(SAVE_COORDINATOR, "flush")
+    before = await game.call(SAVE_COORDINATOR, "get_stats")
+
+    for i in range(20):
+        await game.set_property(SOUND_MANAGER, "sfx_volume", 0.5 + i * 0.01)
+
+    dirty = await game.call(SAVE_COORDINATOR, "is_dirty", ["audio_settings"])
+    assert dirty, "Settings should be pending, not written on every tick"
+
+    await asyncio.sleep(DEBOUNCE_WAIT)
+    after = await game.call(SAVE_COORDINATOR, "get_stats")
+    assert after["marks_total"] >= before["marks_total"] + 20
+    writes = after["writes_by_key"].get("audio_settings", 0) - before["writes_by_key"].get("audio_settings", 0)
+    assert writes == 1, f"20 slider ticks should write once, got {writes}"
+    assert after["failed_total"] == before["failed_total"], "Write should succeed"
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_pending_data_now(game):
+    """flush() should write dirty keys immediately (used on focus loss/quit)."""
+    await game.set_property(SOUND_MANAGER, "master_volume", 0.8)
+    before = await game.call(SAVE_COORDINATOR, "get_stats")
+
+    await game.call(SAVE_COORDINATOR, "flush")
+
+    dirty = await game.call(SAVE_COORDINATOR, "is_dirty", ["audio_settings"])
+    assert not dirty, "flush should leave nothing pending"
+    after = await game.call(SAVE_COORDINATOR, "get_stats")
+    assert after["sync_writes_total"] >= before["sync_writes_total"] + 1
+
+
+@pytest.mark.asyncio
+async def test_pending_session_is_visible_to_readers(game):
+    """Reading a save with a pending write should see the new data."""
+    await game.call(META_MANAGER, "save_session", [{"current_wave": 3}])
+
+    has_session = await game.call(META_MANAGER, "has_active_session")
+    assert has_session, "has_active_session should flush the pending session write"
+
+    session = await game.call(META_MANAGER, "load_session")
+    assert session.get("current_wave") == 3
+
+    await game.call(META_MANAGER, "clear_session")
+    has_session = await game.call(META_MANAGER, "has_active_session")
+    assert not has_session, "clear_session should delete the session file"
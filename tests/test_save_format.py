@@ -0,0 +1,47 @@
+"""Tests for the versioned binary save format (SaveFormat + MetaManager schema)."""
+import asyncio
+import os
+import pytest
+
+META_MANAGER = "/root/MetaManager"
+
+
+@pytest.mark.asyncio
+async def test_save_format_benchmark(game):
+    """Binary profiles should round-trip exactly and be smaller than the JSON format."""
+    result = await game.call(META_MANAGER, "benchmark_save_format", [40, 400, 10])
+
+    assert result["binary_round_trip_ok"], "Binary save should load back identical data"
+    assert result["json_round_trip_ok"], "Imported JSON should migrate to the same typed data"
+    assert result["binary_bytes"] < result["json_bytes"], (
+        f"Binary profile should be smaller: binary={result['binary_bytes']}B "
+        f"json={result['json_bytes']}B"
+    )
+    print(
+        f"save: json={result['json_save_usec']}us binary={result['binary_save_usec']}us | "
+        f"load: json={result['json_load_usec']}us binary={result['binary_load_usec']}us"
+    )
+
+
+@pytest.mark.asyncio
+async def test_completions_keep_integer_stage_keys_across_reload(game):
+    """Stage and difficulty completions should survive a save/load with int stage keys."""
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        pytest.skip("Skipping file I/O test in parallel mode - unreliable in CI")
+
+    test_slot = 3
+    await game.call(META_MANAGER, "set_active_slot", [test_slot])
+    await game.call(META_MANAGER, "reset_data", [])
+
+    await game.call(META_MANAGER, "record_difficulty_completion", ["Rookie", 2, 3])
+    await game.call(META_MANAGER, "save_data")
+    await asyncio.sleep(1.0)
+
+    await game.call(META_MANAGER, "load_data")
+
+    highest = await game.call(META_MANAGER, "get_highest_difficulty_beaten", ["Rookie", 2])
+    assert highest == 3, f"Difficulty completion should persist, got {highest}"
+    gears = await game.call(META_MANAGER, "get_stage_gears", [2])
+    assert gears == 1, f"Stage completion should persist with an int stage key, got {gears}"
+
+    await game.call(META_MANAGER, "reset_data", [])
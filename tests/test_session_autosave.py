@@ -0,0 +1,101 @@
+"""Tests for the session autosave pipeline (main-thread snapshot, worker-side encode)."""
+import asyncio
+import os
+import pytest
+
+GAME = "/root/Game"
+GAME_MANAGER = "/root/GameManager"
+SAVE_COORDINATOR = "/root/SaveCoordinator"
+META_MANAGER = "/root/MetaManager"
+TEST_SLOT = 3
+
+# Longer than SaveCoordinator.DEBOUNCE_MSEC
+DEBOUNCE_WAIT = 1.5
+# Main-thread budget for an autosave at a wave transition (well under a 60fps frame)
+SNAPSHOT_BUDGET_USEC = 8000
+
+
+async def _start_run_in_test_slot(game):
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        pytest.skip("Skipping file I/O test in parallel mode - unreliable in CI")
+    await game.call(META_MANAGER, "set_active_slot", [TEST_SLOT])
+    await game.call(META_MANAGER, "reset_data", [])
+    await game.set_property(GAME_MANAGER, "current_state", 1)  # PLAYING
+
+
+async def _autosave_next_wave(game):
+    await game.call(GAME_MANAGER, "advance_wave")
+    await asyncio.sleep(DEBOUNCE_WAIT)
+    return await game.call(GAME, "get_autosave_stats")
+
+
+@pytest.mark.asyncio
+async def test_wave_autosave_only_snapshots_on_main_thread(game):
+    """A wave change should cost the main thread a snapshot, not the encode and write."""
+    await _start_run_in_test_slot(game)
+    before = await game.call(GAME, "get_autosave_stats")
+
+    stats = await _autosave_next_wave(game)
+    assert stats["encodes"] > before["encodes"], "Session should be encoded by the save worker"
+    assert stats["snapshot_usec"] < SNAPSHOT_BUDGET_USEC, (
+        f"Autosave snapshot took {stats['snapshot_usec']}us on the main thread"
+    )
+
+    wave = await game.get_property(GAME_MANAGER, "current_wave")
+    session = await game.call(META_MANAGER, "load_session")
+    assert session.get("current_wave") == wave
+    assert "ball_registry" in session and "fusion_registry" in session
+
+    await game.call(META_MANAGER, "clear_session")
+    await game.call(META_MANAGER, "reset_data", [])
+
+
+@pytest.mark.asyncio
+async def test_unchanged_sections_are_reused(game):
+    """Ball slots and fusion state that did not change between waves skip re-encoding."""
+    await _start_run_in_test_slot(game)
+    await _autosave_next_wave(game)
+    before = await game.call(GAME, "get_autosave_stats")
+
+    after = await _autosave_next_wave(game)
+    reused = after["sections_reused"] - before["sections_reused"]
+    assert reused >= 2, f"Ball and fusion sections should be reused, got {reused}"
+
+    await game.call(META_MANAGER, "clear_session")
+    await game.call(META_MANAGER, "reset_data", [])
+
+
+@pytest.mark.asyncio
+async def test_interrupted_write_keeps_last_complete_snapshot(game):
+    """A crash part-way through a real autosave should leave the previous session
+    loadable, and the next autosave should replace the leftover temp file."""
+    await _start_run_in_test_slot(game)
+    await _autosave_next_wave(game)
+    saved = await game.call(META_MANAGER, "load_session")
+    assert saved, "Autosave should have written a session"
+
+    for fraction in [0.0, 0.5, 1.0]:
+        before = await game.call(SAVE_COORDINATOR, "get_stats")
+        await game.call(SAVE_COORDINATOR, "interrupt_next_write", ["session", fraction])
+        await _autosave_next_wave(game)
+
+        after = await game.call(SAVE_COORDINATOR, "get_stats")
+        assert after["writes_by_key"].get("session", 0) > before["writes_by_key"].get("session", 0), (
+            "The interrupted autosave should have gone through the save worker"
+        )
+        assert after["failed_total"] == before["failed_total"] + 1
+        assert await game.call(SAVE_COORDINATOR, "has_leftover_temp", ["session"])
+        session = await game.call(META_MANAGER, "load_session")
+        assert session.get("current_wave") == saved["current_wave"], (
+            f"Write interrupted at {fraction:.0%} should not replace the last snapshot"
+        )
+
+    # The next complete autosave replaces both the session and the leftover temp file
+    await _autosave_next_wave(game)
+    assert not await game.call(SAVE_COORDINATOR, "has_leftover_temp", ["session"])
+    wave = await game.get_property(GAME_MANAGER, "current_wave")
+    session = await game.call(META_MANAGER, "load_session")
+    assert session.get("current_wave") == wave
+
+    await game.call(META_MANAGER, "clear_session")
+    await game.call(META_MANAGER, "reset_data", [])
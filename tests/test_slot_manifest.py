@@ -0,0 +1,61 @@
+"""Tests for the slot manifest (save-slot previews without reading full save files)."""
+import asyncio
+import os
+import pytest
+
+META_MANAGER = "/root/MetaManager"
+TEST_SLOT = 3
+
+
+async def _use_clean_test_slot(game):
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        pytest.skip("Skipping file I/O test in parallel mode - unreliable in CI")
+    await game.call(META_MANAGER, "set_active_slot", [TEST_SLOT])
+    await game.call(META_MANAGER, "reset_data", [])
+
+
+@pytest.mark.asyncio
+async def test_previews_cover_every_slot(game):
+    """get_slot_previews should return one entry per slot."""
+    previews = await game.call(META_MANAGER, "get_slot_previews")
+    assert len(previews) == 3, f"Expected one preview per slot, got {len(previews)}"
+
+
+@pytest.mark.asyncio
+async def test_manifest_tracks_meta_saves(game):
+    """Saving a slot should update its manifest preview."""
+    await _use_clean_test_slot(game)
+    assert await game.call(META_MANAGER, "get_slot_preview", [TEST_SLOT]) == {}
+
+    await game.call(META_MANAGER, "set", ["pit_coins", 777])
+    await game.call(META_MANAGER, "save_data")
+    await asyncio.sleep(1.0)
+
+    preview = await game.call(META_MANAGER, "get_slot_preview", [TEST_SLOT])
+    assert preview["slot"] == TEST_SLOT
+    assert preview["coins"] == 777, f"Preview should show saved coins, got {preview}"
+    assert not await game.call(META_MANAGER, "is_slot_empty", [TEST_SLOT])
+
+    await game.call(META_MANAGER, "delete_slot", [TEST_SLOT])
+    assert await game.call(META_MANAGER, "get_slot_preview", [TEST_SLOT]) == {}
+    assert await game.call(META_MANAGER, "is_slot_empty", [TEST_SLOT])
+
+
+@pytest.mark.asyncio
+async def test_manifest_tracks_session_saves(game):
+    """Session saves and clears should show up in the slot preview."""
+    await _use_clean_test_slot(game)
+    await game.call(META_MANAGER, "save_data")
+    await game.call(META_MANAGER, "save_session", [{"current_wave": 7, "player_level": 4}])
+
+    preview = await game.call(META_MANAGER, "get_slot_preview", [TEST_SLOT])
+    assert preview["has_active_session"], "Pending session should be visible in the preview"
+    assert preview["session"]["current_wave"] == 7
+    assert preview["session"]["player_level"] == 4
+
+    await game.call(META_MANAGER, "clear_session")
+    preview = await game.call(META_MANAGER, "get_slot_preview", [TEST_SLOT])
+    assert not preview["has_active_session"]
+    assert not await game.call(META_MANAGER, "has_active_session", [TEST_SLOT])
+
+    await game.call(META_MANAGER, "reset_data", [])
@@ -0,0 +1,46 @@
+"""Tests for the pre-rendered SoundManager sound bank."""
+import pytest
+
+SOUND_MANAGER = "/root/SoundManager"
+
+
+@pytest.mark.asyncio
+async def test_sound_bank_covers_every_sound_type(game):
+    """Every SoundType should have at least one banked stream."""
+    stats = await game.call(SOUND_MANAGER, "get_sound_bank_stats")
+
+    # 27 SoundType values (FIRE through UNPAUSE)
+    assert stats["sounds"] >= 27, f"Bank should hold every SoundType, got {stats['sounds']}"
+    assert stats["variants"] >= stats["sounds"], "Each sound needs at least one take"
+
+
+@pytest.mark.asyncio
+async def test_sound_bank_reports_cost(game):
+    """Bank stats should report memory and build time."""
+    stats = await game.call(SOUND_MANAGER, "get_sound_bank_stats")
+
+    assert stats["bytes"] > 0, "Bank should report sample memory in bytes"
+    assert stats["build_msec"] >= 0.0, "Bank should report build time"
+    assert isinstance(stats["from_cache"], bool), "Bank should report whether it loaded from cache"
+
+
+@pytest.mark.asyncio
+async def test_noisy_sounds_have_variants(game):
+    """Noise-based sounds should get multiple takes for variety."""
+    stats = await game.call(SOUND_MANAGER, "get_sound_bank_stats")
+    variants_per_noisy = await game.get_property(SOUND_MANAGER, "NOISE_VARIANTS")
+
+    assert variants_per_noisy > 1, "Noisy sounds should have more than one take"
+    assert stats["variants"] > stats["sounds"], "Some sounds should have multiple takes"
+
+
+@pytest.mark.asyncio
+async def test_play_uses_bank_without_error(game):
+    """Playing the hottest sounds repeatedly should reuse banked streams."""
+    before = await game.call(SOUND_MANAGER, "get_sound_bank_stats")
+    for sound_type in [1, 2]:  # HIT_WALL, HIT_ENEMY
+        for _ in range(10):
+            await game.call(SOUND_MANAGER, "play", [sound_type])
+    after = await game.call(SOUND_MANAGER, "get_sound_bank_stats")
+
+    assert after["variants"] == before["variants"], "play() should not synthesize new takes"
@@ -0,0 +1,61 @@
+"""Tests for SoundManager voice limiting, priority and per-frame coalescing."""
+import pytest
+
+SOUND_MANAGER = "/root/SoundManager"
+
+# SoundManager.SoundType values
+HIT_WALL = 1
+LEVEL_UP = 6
+FIRE_BALL = 10
+ICE_BALL = 11
+LIGHTNING_BALL = 12
+POISON_BALL = 13
+BLEED_BALL = 14
+IRON_BALL = 15
+
+
+@pytest.mark.asyncio
+async def test_voice_stats_exposed(game):
+    """SoundManager should expose played/merged/dropped/stolen counters."""
+    stats = await game.call(SOUND_MANAGER, "get_voice_stats")
+    for key in ["played", "merged", "dropped", "stolen"]:
+        assert key in stats, f"Voice stats should include '{key}'"
+
+
+@pytest.mark.asyncio
+async def test_every_request_is_accounted_for(game):
+    """Each play request should be played, merged or dropped."""
+    await game.call(SOUND_MANAGER, "reset_voice_stats")
+    requests = 20
+    for _ in range(requests):
+        await game.call(SOUND_MANAGER, "play", [HIT_WALL])
+
+    stats = await game.call(SOUND_MANAGER, "get_voice_stats")
+    total = stats["played"] + stats["merged"] + stats["dropped"]
+    assert total == requests, f"Expected {requests} accounted requests, got {total} ({stats})"
+
+
+@pytest.mark.asyncio
+async def test_spam_sound_is_voice_limited(game):
+    """HIT_WALL spam should never occupy every voice."""
+    await game.call(SOUND_MANAGER, "reset_voice_stats")
+    for _ in range(30):
+        await game.call(SOUND_MANAGER, "play", [HIT_WALL])
+
+    busy = await game.call(SOUND_MANAGER, "_count_voices", [HIT_WALL])
+    max_players = await game.get_property(SOUND_MANAGER, "MAX_PLAYERS")
+    assert busy < max_players, f"HIT_WALL should be capped below {max_players} voices, got {busy}"
+
+
+@pytest.mark.asyncio
+async def test_level_up_not_dropped_when_voices_busy(game):
+    """Critical cues should steal a voice instead of being dropped."""
+    for sound in [FIRE_BALL, ICE_BALL, LIGHTNING_BALL, POISON_BALL, BLEED_BALL, IRON_BALL, HIT_WALL]:
+        await game.call(SOUND_MANAGER, "play", [sound])
+        await game.call(SOUND_MANAGER, "play", [sound])
+
+    await game.call(SOUND_MANAGER, "reset_voice_stats")
+    await game.call(SOUND_MANAGER, "play", [LEVEL_UP])
+    stats = await game.call(SOUND_MANAGER, "get_voice_stats")
+    assert stats["played"] == 1, f"LEVEL_UP should play even with busy voices ({stats})"
+    assert stats["dropped"] == 0, "LEVEL_UP should never be dropped for lower-priority sounds"
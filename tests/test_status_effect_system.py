@@ -0,0 +1,31 @@
+"""Tests for the StatusEffectSystem autoload (packed status effect simulation)."""
+import pytest
+
+STATUS_SYSTEM = "/root/StatusEffectSystem"
+
+
+@pytest.mark.asyncio
+async def test_status_effect_system_autoload_exists(game):
+    """StatusEffectSystem autoload should be registered."""
+    node = await game.get_node(STATUS_SYSTEM)
+    assert node is not None, "StatusEffectSystem autoload should exist"
+
+
+@pytest.mark.asyncio
+async def test_parity_with_status_effect_objects(game):
+    """Packed simulation must match StatusEffect.update() tick for tick."""
+    result = await game.call(STATUS_SYSTEM, "run_parity_check", [600])
+    assert result["effects"] >= 18, f"Every effect type should be covered, got {result['effects']}"
+    assert result["mismatches"] == 0, f"{result['mismatches']} frame/effect results differed"
+    assert result["legacy_damage"] > 0, "Parity run should include DoT ticks"
+    assert result["system_damage"] == result["legacy_damage"], (
+        f"Total DoT differs: legacy={result['legacy_damage']} system={result['system_damage']}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_stats_report_active_effects(game):
+    """get_stats should report the live effect count."""
+    stats = await game.call(STATUS_SYSTEM, "get_stats")
+    for key in ["active_effects", "ticks_last_frame", "dot_events_last_frame"]:
+        assert key in stats, f"Stats should include {key}"